@@ -16,8 +16,14 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import hashlib
+from itertools import chain
+
+import numpy as np
+
 from sverchok import data_structure
-from sverchok.utils.logging import warning, info
+from sverchok.utils.logging import warning, info, debug
+from sverchok.utils.ragged_array import RaggedArray, ragged_to_lists
 
 #####################################
 # socket data cache                 #
@@ -28,6 +34,9 @@ sentinel = object()
 # socket cache
 socket_data_cache = {}
 
+# fingerprints of socket data, used by incremental update
+socket_data_fingerprints = {}
+
 # faster than builtin deep copy for us.
 # useful for our limited case
 # we should be able to specify vectors here to get them create
@@ -35,14 +44,166 @@ socket_data_cache = {}
 
 
 def sv_deep_copy(lst):
-    """return deep copied data of list/tuple structure"""
+    """return deep copied data of list/tuple structure,
+    numpy arrays are copied as well, so the copy is always writeable
+    even if the data holds read-only views (see sv_readonly_view)"""
     if isinstance(lst, (list, tuple)):
-        if lst and not isinstance(lst[0], (list, tuple)):
+        if lst and not isinstance(lst[0], (list, tuple, np.ndarray)):
             return lst[:]
         return [sv_deep_copy(l) for l in lst]
+    if isinstance(lst, np.ndarray):
+        return lst.copy()
+    if isinstance(lst, RaggedArray):
+        return RaggedArray(lst.values.copy(), lst.offsets.copy())
     return lst
 
 
+class _NotFingerprintable(Exception):
+    pass
+
+_fingerprint_scalars = {int, float, bool, str, type(None)}
+# flat lists of these types are hashed as numpy arrays
+_fingerprint_dtypes = {float: np.float64, int: np.int64, bool: np.bool_}
+
+def _hash_flat(hasher, data, item_types, width=None):
+    """
+    Feed a list of scalars, or of tuples of scalars of the same width,
+    into hasher. Lists of one number type go through numpy; anything else
+    (mixed types, strings, tuples of different lengths) through repr,
+    which keeps 1, 1.0 and True apart.
+    """
+    dtype = _fingerprint_dtypes.get(next(iter(item_types))) if len(item_types) == 1 else None
+    if dtype is not None:
+        values = data if width is None else chain.from_iterable(data)
+        try:
+            array = np.fromiter(values, dtype=dtype, count=len(data) * (width or 1))
+        except OverflowError:
+            array = None
+        if array is not None:
+            hasher.update(b'A%r%d,%d:' % (array.dtype.str, len(data), width or 0))
+            hasher.update(array.tobytes())
+            return
+    text = repr(data).encode()
+    hasher.update(b'R%d:' % len(text))
+    hasher.update(text)
+
+def _fingerprint(hasher, data):
+    data_type = type(data)
+    if data_type in _fingerprint_scalars:
+        hasher.update(b'S%r:' % data_type.__name__)
+        hasher.update(repr(data).encode())
+        return
+    if isinstance(data, np.ndarray):
+        if data.dtype.hasobject:
+            raise _NotFingerprintable
+        hasher.update(b'N%r%r' % (data.dtype.str, data.shape))
+        hasher.update(np.ascontiguousarray(data))
+        return
+    if isinstance(data, np.generic):
+        hasher.update(b'G%r:' % data.dtype.str)
+        hasher.update(data.tobytes())
+        return
+    if isinstance(data, RaggedArray):
+        hasher.update(b'Q')
+        _fingerprint(hasher, data.values)
+        _fingerprint(hasher, data.offsets)
+        return
+    if isinstance(data, (list, tuple)):
+        hasher.update(b'L%r%d:' % (data_type.__name__, len(data)))
+        # fast paths for flat lists and lists of tuples (vertices, faces),
+        # these keep the iteration on the C side
+        item_types = set(map(type, data))
+        if item_types <= _fingerprint_scalars:
+            _hash_flat(hasher, data, item_types)
+            return
+        if item_types == {tuple}:
+            inner_types = set(map(type, chain.from_iterable(data)))
+            if inner_types <= _fingerprint_scalars:
+                widths = set(map(len, data))
+                width = widths.pop() if len(widths) == 1 else None
+                _hash_flat(hasher, data, inner_types if width else {tuple}, width)
+                return
+        for item in data:
+            _fingerprint(hasher, item)
+        return
+    raise _NotFingerprintable
+
+def sv_fingerprint(data):
+    """
+    Return a comparable fingerprint of socket data: a SHA-1 digest of the
+    values and of their types, so it stays small whatever the data size, and
+    1, 1.0 and True give different fingerprints. Equal fingerprints mean
+    equal data; None is returned if data contains objects (matrices, bmesh,
+    blender objects...) whose content can not be compared, such data is
+    always considered changed.
+    """
+    hasher = hashlib.sha1()
+    try:
+        _fingerprint(hasher, data)
+    except _NotFingerprintable:
+        return None
+    return hasher.digest()
+
+def get_socket_fingerprint(socket):
+    """
+    Return previously stored fingerprint of output socket data, or None
+    """
+    return socket_data_fingerprints.get(socket.id_data.name, {}).get(socket.socket_id)
+
+def store_socket_fingerprint(socket):
+    """
+    Fingerprint current data of output socket and store it.
+    Returns the new fingerprint, or None if there is nothing to compare.
+    """
+    s_ng = socket.id_data.name
+    s_id = socket.socket_id
+    if s_id not in socket_data_cache.get(s_ng, {}):
+        return None
+    fingerprint = sv_fingerprint(socket_data_cache[s_ng][s_id])
+    if fingerprint is not None:
+        socket_data_fingerprints.setdefault(s_ng, {})[s_id] = fingerprint
+    return fingerprint
+
+def sv_readonly_view(data):
+    """
+    Return data with all numpy arrays replaced by read-only views of them.
+    Only containers holding arrays are rebuilt, lists of plain values are
+    returned as is, so this is cheap compared to sv_deep_copy. Writing into
+    the returned arrays raises ValueError instead of silently changing data
+    shared with other nodes; a node which needs to modify them has to copy.
+    """
+    if isinstance(data, np.ndarray):
+        if not data.flags.writeable:
+            return data
+        view = data.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(data, (list, tuple)) and data:
+        first = data[0]
+        if isinstance(first, np.ndarray):
+            return type(data)(sv_readonly_view(item) for item in data)
+        # lists of vertices, edges etc. can not hold arrays, leave them
+        if isinstance(first, (list, tuple)) and first and isinstance(first[0], (list, tuple, np.ndarray)):
+            return type(data)(sv_readonly_view(item) for item in data)
+    return data
+
+def get_input_fingerprints(node):
+    """
+    Fingerprints of data passed into linked inputs of the node,
+    used to check that node does not modify data of upstream nodes.
+    """
+    fingerprints = {}
+    for socket in node.inputs:
+        if not socket.is_linked:
+            continue
+        other = socket.other
+        if other is None:
+            continue
+        data = socket_data_cache.get(other.id_data.name, {}).get(other.socket_id, sentinel)
+        if data is not sentinel:
+            fingerprints[socket.name] = sv_fingerprint(data)
+    return fingerprints
+
 # Build string for showing in socket label
 def SvGetSocketInfo(socket):
     """returns string to show in socket label"""
@@ -77,16 +238,19 @@ def SvSetSocket(socket, out):
             warning(f"{socket.node.name} setting unconncted socket: {socket.name}")
     s_id = socket.socket_id
     s_ng = socket.id_data.name
-    if s_ng not in socket_data_cache:
-        socket_data_cache[s_ng] = {}
-    socket_data_cache[s_ng][s_id] = out
+    # setdefault is atomic, sockets may be set from worker threads
+    socket_data_cache.setdefault(s_ng, {})[s_id] = out
+    if s_ng in socket_data_fingerprints:
+        # stored fingerprint is stale now
+        socket_data_fingerprints[s_ng].pop(s_id, None)
 
 
 def SvGetSocket(socket, deepcopy=True):
     """gets socket data from socket,
     if deep copy is True a deep copy is make_dep_dict,
     to increase performance if the node doesn't mutate input
-    set to False and increase performance substanstilly
+    set to False and increase performance substanstilly,
+    with CHECK_INPUT_MUTATION numpy arrays are returned as read-only views then
     """
     global socket_data_cache
     if socket.is_linked:
@@ -97,8 +261,12 @@ def SvGetSocket(socket, deepcopy=True):
             raise LookupError
         if s_id in socket_data_cache[s_ng]:
             out = socket_data_cache[s_ng][s_id]
+            if not getattr(socket.node, 'sv_accepts_ragged', False):
+                out = ragged_to_lists(out)
             if deepcopy:
                 return sv_deep_copy(out)
+            elif data_structure.CHECK_INPUT_MUTATION:
+                return sv_readonly_view(out)
             else:
                 return out
         else:
@@ -143,7 +311,8 @@ class SvNoDataError(LookupError):
 def get_output_socket_data(node, output_socket_name):
     """
     This method is intended to usage in internal tests mainly.
-    Get data that the node has written to the output socket.
+    Get data that the node has written to the output socket,
+    RaggedArray converted to lists as most nodes read it.
     Raises SvNoDataError if it hasn't written any.
     """
 
@@ -155,7 +324,7 @@ def get_output_socket_data(node, output_socket_name):
     if tree_name not in socket_data_cache:
         raise SvNoDataError()
     if socket_id in socket_data_cache[tree_name]:
-        return socket_data_cache[tree_name][socket_id]
+        return ragged_to_lists(socket_data_cache[tree_name][socket_id])
     else:
         raise SvNoDataError(socket)
 
@@ -165,3 +334,4 @@ def reset_socket_cache(ng):
     """
     global socket_data_cache
     socket_data_cache[ng.name] = {}
+    socket_data_fingerprints[ng.name] = {}
@@ -21,3 +21,15 @@ class SvNotFullyConnected(SvProcessingError):
 
     def __str__(self):
         return self.message
+
+
+class SvInputMutatedError(SvProcessingError):
+
+    def __init__(self, node, sockets):
+        self.node = node
+        self.sockets = sockets
+        socket_names = ", ".join(sockets)
+        self.message = "Node modified data shared with other nodes in place, inputs: " + socket_names
+
+    def __str__(self):
+        return self.message
@@ -18,14 +18,19 @@
 
 import collections
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import bpy
 from mathutils import Vector
 
 from sverchok import data_structure
-from sverchok.core.socket_data import SvNoDataError, reset_socket_cache
+from sverchok.core.socket_data import (
+    SvNoDataError, reset_socket_cache,
+    get_socket_fingerprint, store_socket_fingerprint, get_input_fingerprints)
+from sverchok.core.sv_custom_exceptions import SvInputMutatedError
 from sverchok.utils.logging import debug, info, warning, error, exception
 from sverchok.utils.profile import profile
+from sverchok.utils import node_stats
 import sverchok
 
 import traceback
@@ -46,6 +51,14 @@ def update_error_colors(self, context):
 update_cache = {}
 # cache for partial update lists
 partial_update_cache = {}
+# names of nodes skipped by last incremental update, per tree
+skipped_nodes_cache = {}
+# structure of each tree at the last build_update_list
+tree_structure_cache = {}
+# tree structure -> dependencies and update lists built for it,
+# kept for a while so undo/redo of link edits can reuse them
+structure_cache = collections.OrderedDict()
+STRUCTURE_CACHE_SIZE = 32
 
 
 def make_dep_dict(node_tree, down=False):
@@ -153,16 +166,19 @@ def make_update_list(node_tree, node_set=None, dependencies=None):
 def separate_nodes(ng, links=None):
     '''
     Separate a node group (layout) into unconnected parts
-    Arguments: Node group
+    Arguments: Node group, optionally its dependency dictionary
     Returns: A list of sets with separate node groups
     '''
     nodes = set(ng.nodes.keys())
     if not nodes:
         return []
-    node_links = make_dep_dict(ng)
-    down = make_dep_dict(ng, down=True)
-    for name, links in down.items():
-        node_links[name].update(links)
+    if links is None:
+        links = make_dep_dict(ng)
+    node_links = collections.defaultdict(set)
+    for name, deps in links.items():
+        node_links[name].update(deps)
+        for dep in deps:
+            node_links[dep].add(name)
     n = nodes.pop()
     node_set_list = [set([n])]
     node_stack = collections.deque()
@@ -186,10 +202,11 @@ def separate_nodes(ng, links=None):
 
     return [ns for ns in node_set_list if len(ns) > 1]
 
-def make_tree_from_nodes(node_names, tree, down=True):
+def make_tree_from_nodes(node_names, tree, down=True, structure=None):
     """
     Create a partial update list from a sub-tree, node_names is a list of nodes that
-    drives change for the tree
+    drives change for the tree.
+    Dependencies are taken from structure (see get_tree_structure) if it is passed.
     """
     ng = tree
     nodes = ng.nodes
@@ -202,8 +219,10 @@ def make_tree_from_nodes(node_names, tree, down=True):
     out_stack = collections.deque(node_names)
     current_node = out_stack.pop()
 
-    # build downwards links, this should be cached perhaps
-    node_links = make_dep_dict(ng, down)
+    if structure is not None:
+        node_links = structure.down_deps if down else structure.deps
+    else:
+        node_links = make_dep_dict(ng, down)
     while current_node:
         for node in node_links[current_node]:
             if node not in out_set:
@@ -217,7 +236,89 @@ def make_tree_from_nodes(node_names, tree, down=True):
     if len(out_set) == 1:
         return list(out_set)
     else:
-        return make_update_list(ng, out_set)
+        return make_update_list(ng, out_set, structure.deps if structure is not None else None)
+
+
+class TreeStructure:
+    """
+    Dependencies of a tree and update lists built from them.
+    Trees with the same nodes and links share one TreeStructure,
+    so it is reused after undo/redo of topology changes.
+    """
+    def __init__(self, key, deps):
+        self.key = key
+        self.deps = deps
+        self._down_deps = None
+        self.node_sets = []
+        self.update_lists = []
+        self.partial_update_lists = {}
+
+    @property
+    def down_deps(self):
+        if self._down_deps is None:
+            down = collections.defaultdict(set)
+            for name, deps in self.deps.items():
+                for dep in deps:
+                    down[dep].add(name)
+            self._down_deps = down
+        return self._down_deps
+
+
+def get_structure_key(ng, deps):
+    """
+    Hashable description of tree topology: node names and dependencies
+    """
+    edges = frozenset((name, dep) for name, node_deps in deps.items() for dep in node_deps)
+    return (frozenset(ng.nodes.keys()), edges)
+
+
+def update_tree_structure(ng):
+    """
+    Find TreeStructure for current topology of the tree.
+    If the tree was seen with this topology recently, the cached structure
+    is returned, otherwise update lists are updated from the previous
+    structure of the tree: partial lists and orders of unconnected parts
+    not affected by changed links are kept.
+    """
+    deps = make_dep_dict(ng)
+    key = get_structure_key(ng, deps)
+    structure = structure_cache.get(key)
+    if structure is not None:
+        structure_cache.move_to_end(key)
+        tree_structure_cache[ng.name] = structure
+        return structure
+
+    structure = TreeStructure(key, deps)
+    structure.node_sets = separate_nodes(ng, deps)
+    old = tree_structure_cache.get(ng.name)
+
+    if old is None:
+        structure.update_lists = [make_update_list(ng, s, deps) for s in structure.node_sets]
+    else:
+        old_nodes, old_edges = old.key
+        new_nodes, new_edges = key
+        changed_edges = old_edges ^ new_edges
+        changed_nodes = old_nodes ^ new_nodes
+        touched = changed_nodes.union(*changed_edges) if changed_edges else set(changed_nodes)
+
+        # a partial list is affected if it contains upstream node of a changed link
+        changed_sources = {dep for name, dep in changed_edges} | changed_nodes
+        for name, update_list in old.partial_update_lists.items():
+            if name in new_nodes and changed_sources.isdisjoint(update_list):
+                structure.partial_update_lists[name] = update_list
+
+        old_orders = {frozenset(s): l for s, l in zip(old.node_sets, old.update_lists)}
+        for node_set in structure.node_sets:
+            order = old_orders.get(frozenset(node_set))
+            if order is None or not touched.isdisjoint(node_set):
+                order = make_update_list(ng, node_set, deps)
+            structure.update_lists.append(order)
+
+    structure_cache[key] = structure
+    if len(structure_cache) > STRUCTURE_CACHE_SIZE:
+        structure_cache.popitem(last=False)
+    tree_structure_cache[ng.name] = structure
+    return structure
 
 
 # to make update tree based on node types and node names bases
@@ -239,7 +340,7 @@ def make_animation_tree(node_types, node_list, tree_name):
     return a_tree
 
 
-def do_update_heat_map(node_list, nodes):
+def do_update_heat_map(node_list, nodes, roots=None):
     """
     Create a heat map for the node tree,
     Needs development.
@@ -248,7 +349,7 @@ def do_update_heat_map(node_list, nodes):
         color_data = {node.name: (node.color[:], node.use_custom_color) for node in nodes}
         nodes.id_data.sv_user_colors = str(color_data)
 
-    times = do_update_general(node_list, nodes)
+    times = do_update_general(node_list, nodes, roots=roots)
     if not times:
         return
     t_max = max(times)
@@ -315,10 +416,55 @@ def reset_error_nodes(ng):
         del ng["error nodes"]
 
 
+def process_node(node):
+    """
+    Call node's process() method; in debug mode also check
+    that the node did not modify its input data in place.
+    """
+    if not hasattr(node, "process"):
+        return
+    if not data_structure.CHECK_INPUT_MUTATION:
+        node.process()
+        return
+    before = get_input_fingerprints(node)
+    node.process()
+    after = get_input_fingerprints(node)
+    mutated = [name for name, fingerprint in before.items()
+                if fingerprint is not None and after.get(name) != fingerprint]
+    if mutated:
+        raise SvInputMutatedError(node, mutated)
+
+
+def inputs_changed(node, changed_sockets, visited_nodes):
+    """
+    Check if any linked input of the node gets data from an output
+    that was changed during current update.
+    Outputs of nodes that were not visited during current update
+    are considered unchanged. Nodes without linked inputs are
+    always considered changed.
+    """
+    has_links = False
+    for socket in node.inputs:
+        if not socket.is_linked:
+            continue
+        other = data_structure.get_other_socket(socket)
+        if other is None:
+            return True
+        has_links = True
+        if other.node.name in visited_nodes and other.socket_id in changed_sockets:
+            return True
+    return not has_links
+
+
 @profile(section="UPDATE")
-def do_update_general(node_list, nodes, procesed_nodes=set()):
+def do_update_general(node_list, nodes, procesed_nodes=set(), roots=None):
     """
     General update function for node set
+
+    If incremental update is enabled, data of output sockets is fingerprinted
+    after each node is processed. If roots (names of nodes that started the
+    update) are passed as well, the nodes which inputs were not changed
+    during this update are skipped.
     """
     global graphs
     timings = []
@@ -328,16 +474,46 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
     total_time = 0
     done_nodes = set(procesed_nodes)
 
+    incremental = data_structure.INCREMENTAL_UPDATE
+    skip_unchanged = incremental and roots is not None
+    changed_sockets = set()
+    visited_nodes = set()
+    skipped = []
+    collect_stats = node_stats.is_enabled()
+
     for node_name in node_list:
         if node_name in done_nodes:
             continue
         try:
             node = nodes[node_name]
+            if skip_unchanged and node_name not in roots:
+                if not inputs_changed(node, changed_sockets, visited_nodes):
+                    visited_nodes.add(node_name)
+                    skipped.append(node_name)
+                    timings.append(0.0)
+                    gather({"name" : node_name, "bl_idname": node.bl_idname, "start": time.perf_counter(), "duration": 0.0, "skipped": True})
+                    if collect_stats:
+                        node_stats.record_node(node, 0.0, skipped=True)
+                    continue
+
+            if incremental:
+                old_fingerprints = {socket.socket_id: get_socket_fingerprint(socket) for socket in node.outputs}
+
+            if collect_stats:
+                memory_state = node_stats.start_tracing()
             start = time.perf_counter()
-            if hasattr(node, "process"):
-                node.process()
+            process_node(node)
             delta = time.perf_counter() - start
             total_time += delta
+            if collect_stats:
+                node_stats.record_node(node, delta, memory_state)
+
+            if incremental:
+                for socket in node.outputs:
+                    fingerprint = store_socket_fingerprint(socket)
+                    if fingerprint is None or fingerprint != old_fingerprints[socket.socket_id]:
+                        changed_sockets.add(socket.socket_id)
+            visited_nodes.add(node_name)
 
             if data_structure.DEBUG_MODE:
                 debug("Processed  %s in: %.4f", node_name, delta)
@@ -353,17 +529,115 @@ def do_update_general(node_list, nodes, procesed_nodes=set()):
             return None
 
     graphs.append(graph)
+    if skip_unchanged:
+        skipped_nodes_cache[nodes.id_data.name] = skipped
     if data_structure.DEBUG_MODE:
         debug("Node set updated in: %.4f seconds", total_time)
+        if skip_unchanged:
+            debug("Incremental update skipped %d of %d nodes", len(skipped), len(node_list))
     
     return timings
 
 
-def do_update(node_list, nodes):
+def is_thread_safe(node):
+    """
+    Nodes may declare sv_thread_safe = True if their process() method
+    does not touch bpy data other than own properties and sockets.
+    """
+    return getattr(node, 'sv_thread_safe', False)
+
+
+def process_nodes_chunk(node_names, nodes):
+    """
+    Process nodes sequentially, this is what threaded update runs in workers.
+    Returns list of timings and a (node name, exception) pair
+    if one of the nodes failed.
+    """
+    timings = []
+    for node_name in node_names:
+        node = nodes[node_name]
+        try:
+            start = time.perf_counter()
+            process_node(node)
+            delta = time.perf_counter() - start
+            timings.append((node_name, start, delta))
+            if node_stats.is_enabled():
+                # tracemalloc peak is not per thread, so no memory here
+                node_stats.record_node(node, delta)
+            if data_structure.INCREMENTAL_UPDATE:
+                for socket in node.outputs:
+                    store_socket_fingerprint(socket)
+        except Exception as err:
+            exception("Node %s had exception: %s", node_name, err)
+            return timings, (node_name, err)
+    return timings, None
+
+
+@profile(section="UPDATE")
+def do_update_threaded(update_lists, nodes):
+    """
+    Update independent node sets (as returned by separate_nodes) concurrently.
+    Consecutive nodes declaring sv_thread_safe are processed in a thread pool,
+    all other nodes of each set are processed in the main thread, between
+    the chunks running in workers. Nodes of one set are always processed in
+    order; an exception stops processing of its own set only.
+    """
+    global graphs
+    ng = nodes.id_data
+    branches = [collections.deque(node_list) for node_list in update_lists if node_list]
+    graph = []
+    running = {}
+
+    def collect(result):
+        timings, failed = result
+        for node_name, start, delta in timings:
+            if data_structure.DEBUG_MODE:
+                debug("Processed  %s in: %.4f", node_name, delta)
+            graph.append({"name" : node_name, "bl_idname": nodes[node_name].bl_idname, "start": start, "duration": delta})
+        if failed:
+            node_name, err = failed
+            update_error_nodes(ng, node_name, err)
+            return False
+        return True
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=data_structure.THREADS_COUNT or None) as executor:
+        while running or any(branches):
+            busy = set(running.values())
+            processed_in_main = False
+            for idx, branch in enumerate(branches):
+                if idx in busy or not branch:
+                    continue
+                if is_thread_safe(nodes[branch[0]]):
+                    chunk = []
+                    while branch and is_thread_safe(nodes[branch[0]]):
+                        chunk.append(branch.popleft())
+                    running[executor.submit(process_nodes_chunk, chunk, nodes)] = idx
+                else:
+                    if not collect(process_nodes_chunk([branch.popleft()], nodes)):
+                        branch.clear()
+                    processed_in_main = True
+
+            if not running:
+                continue
+            # do not block while there still are nodes for the main thread
+            timeout = 0 if processed_in_main else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                if not collect(future.result()):
+                    branches[idx].clear()
+
+    graphs.append(graph)
+    if data_structure.DEBUG_MODE:
+        debug("Node sets updated in %d threads in: %.4f seconds", len(update_lists), time.perf_counter() - start)
+
+
+def do_update(node_list, nodes, roots=None):
     if data_structure.HEAT_MAP:
-        do_update_heat_map(node_list, nodes)
+        do_update_heat_map(node_list, nodes, roots=roots)
     else:
-        do_update_general(node_list, nodes)
+        do_update_general(node_list, nodes, roots=roots)
 
 def build_update_list(ng=None):
     """
@@ -379,11 +653,9 @@ def build_update_list(ng=None):
         for ng in sverchok_trees():
             build_update_list(ng)
     else:
-        node_sets = separate_nodes(ng)
-        deps = make_dep_dict(ng)
-        out = [make_update_list(ng, s, deps) for s in node_sets]
-        update_cache[ng.name] = out
-        partial_update_cache[ng.name] = {}
+        structure = update_tree_structure(ng)
+        update_cache[ng.name] = structure.update_lists
+        partial_update_cache[ng.name] = structure.partial_update_lists
         reset_socket_cache(ng)
 
 
@@ -409,7 +681,7 @@ def process_from_nodes(nodes):
     node_names = [node.name for node in nodes]
     ng = nodes[0].id_data
     update_list = make_tree_from_nodes(node_names, ng)
-    do_update(update_list, ng.nodes)
+    do_update(update_list, ng.nodes, roots=set(node_names))
 
 
 def process_from_node(node):
@@ -432,12 +704,12 @@ def process_from_node(node):
         if p_u_c:
             update_list = p_u_c.get(node.name)
         if not update_list:
-            update_list = make_tree_from_nodes([node.name], ng)
+            update_list = make_tree_from_nodes([node.name], ng, structure=tree_structure_cache.get(ng.name))
             partial_update_cache[ng.name][node.name] = update_list
         nodes = ng.nodes
         if not ng.sv_process:
             return
-        do_update(update_list, nodes)
+        do_update(update_list, nodes, roots={node.name})
     else:
         process_tree(ng)
 
@@ -464,8 +736,11 @@ def process_tree(ng=None):
         if not update_list:
             build_update_list(ng)
             update_list = update_cache.get(ng.name)
-        for l in update_list:
-            do_update(l, ng.nodes)
+        if data_structure.THREADED_UPDATE and not data_structure.HEAT_MAP and len(update_list) > 1:
+            do_update_threaded(update_list, ng.nodes)
+        else:
+            for l in update_list:
+                do_update(l, ng.nodes)
     else:
         pass
 
@@ -486,6 +761,13 @@ def get_update_lists(ng):
         build_update_list(ng)
     return (update_cache.get(ng.name), partial_update_cache.get(ng.name))
 
+def get_skipped_nodes(ng):
+    """
+    Names of nodes which were skipped by the last incremental update of the tree,
+    the number of them is the count of process() calls saved.
+    """
+    return skipped_nodes_cache.get(ng.name, [])
+
 def register():
     addon_name = sverchok.__name__
     addon = bpy.context.preferences.addons.get(addon_name)
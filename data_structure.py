@@ -26,9 +26,16 @@ from mathutils import Vector, Matrix
 import numpy as np
 
 from sverchok.utils.logging import info
+from sverchok.utils.ragged_array import RaggedArray
 
 DEBUG_MODE = False
 HEAT_MAP = False
+INCREMENTAL_UPDATE = False
+THREADED_UPDATE = False
+THREADS_COUNT = 0
+CHECK_INPUT_MUTATION = False
+COLLECT_NODE_STATS = False
+TRACE_NODE_MEMORY = False
 RELOAD_EVENT = False
 
 # this is set correctly later.
@@ -80,7 +87,7 @@ def repeat_last(lst):
     use with terminating input
     """
     i = -1
-    while lst:
+    while len(lst):
         i += 1
         if len(lst) > i:
             yield lst[i]
@@ -239,6 +246,9 @@ numpy_list_match_modes =  list_match_modes[:3]
 
 def numpy_match_long_repeat(list_of_arrays):
     '''match numpy arrays length by repeating last one'''
+    if any(array.shape[0] == 0 for array in list_of_arrays):
+        # nothing to repeat, as with match_long_repeat the result is empty
+        return [array[:0] for array in list_of_arrays]
     out = []
     maxl = 0
     for array in list_of_arrays:
@@ -253,6 +263,9 @@ def numpy_match_long_repeat(list_of_arrays):
 
 def numpy_match_long_cycle(list_of_arrays):
     '''match numpy arrays length by repeating last one'''
+    if any(array.shape[0] == 0 for array in list_of_arrays):
+        # nothing to cycle, as with match_long_cycle the result is empty
+        return [array[:0] for array in list_of_arrays]
     out = []
     maxl = 0
     for array in list_of_arrays:
@@ -286,6 +299,8 @@ numpy_list_match_func = {
     "CYCLE":  numpy_match_long_cycle,
     "REPEAT": numpy_match_long_repeat,
     }
+# for nested data encoded as RaggedArray use ragged_list_match_func
+# from utils/ragged_array.py, it supports XREF modes as well
 
 def make_repeaters(lists):
     chain = itertools.chain
@@ -380,9 +395,16 @@ def dataStandart(data, dept, nominal_dept):
 
 
 def levelsOflist(lst):
-    """calc list nesting only in countainment level integer"""
+    """calc list nesting only in countainment level integer,
+    numpy arrays count as their number of dimensions"""
+    if isinstance(lst, np.ndarray):
+        return lst.ndim
+    if isinstance(lst, RaggedArray):
+        return 1 + lst.values.ndim
     level = 1
     for n in lst:
+        if isinstance(n, (np.ndarray, RaggedArray)):
+            return level + levelsOflist(n)
         if n and isinstance(n, (list, tuple)):
             level += levelsOflist(n)
         return level
@@ -739,6 +761,12 @@ def setup_init():
     """
     global DEBUG_MODE
     global HEAT_MAP
+    global INCREMENTAL_UPDATE
+    global THREADED_UPDATE
+    global THREADS_COUNT
+    global CHECK_INPUT_MUTATION
+    global COLLECT_NODE_STATS
+    global TRACE_NODE_MEMORY
     global SVERCHOK_NAME
     import sverchok
     SVERCHOK_NAME = sverchok.__name__
@@ -746,6 +774,12 @@ def setup_init():
     if addon:
         DEBUG_MODE = addon.preferences.show_debug
         HEAT_MAP = addon.preferences.heat_map
+        INCREMENTAL_UPDATE = addon.preferences.incremental_update
+        THREADED_UPDATE = addon.preferences.threaded_update
+        THREADS_COUNT = addon.preferences.threads_count
+        CHECK_INPUT_MUTATION = addon.preferences.check_input_mutation
+        COLLECT_NODE_STATS = addon.preferences.collect_node_stats
+        TRACE_NODE_MEMORY = addon.preferences.trace_node_memory
     else:
         print("Setup of preferences failed")
 
@@ -33,7 +33,7 @@ from sverchok.core.update_system import (
     build_update_list,
     process_from_node, process_from_nodes,
     process_tree,
-    get_update_lists, update_error_nodes,
+    get_update_lists, get_skipped_nodes, update_error_nodes,
     get_original_node_color)
 
 from sverchok.core.socket_conversions import DefaultImplicitConversionPolicy
@@ -185,6 +185,9 @@ class SvNodeTreeCommon(object):
     def get_update_lists(self):
         return get_update_lists(self)
 
+    def get_skipped_nodes(self):
+        return get_skipped_nodes(self)
+
     @property
     def sv_trees(self):
         res = []
@@ -335,6 +338,16 @@ class SverchCustomTreeNode:
     # E.g., draft_properties_mapping = dict(count = 'count_draft').
     draft_properties_mapping = dict()
 
+    # Nodes which process() method does not touch bpy data except for
+    # node's own properties and sockets may set this to True, to be
+    # processed in worker threads when threaded update is enabled.
+    sv_thread_safe = False
+
+    # Nodes which can consume RaggedArray data (see utils/ragged_array.py)
+    # natively should set this to True; for other nodes it is
+    # converted to lists when they read it from input sockets.
+    sv_accepts_ragged = False
+
     @classmethod
     def poll(cls, ntree):
         return ntree.bl_idname in ['SverchCustomTreeType', 'SverchGroupTreeType']
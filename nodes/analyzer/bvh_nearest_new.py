@@ -17,10 +17,10 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import bpy
-from bpy.props import EnumProperty
+from bpy.props import EnumProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_cycle as C)
-from mathutils.bvhtree import BVHTree
+from sverchok.utils.sv_bvh_utils import cached_bvh, bvh_find_nearest
 
 
 class SvBVHnearNewNode(bpy.types.Node, SverchCustomTreeNode):
@@ -37,9 +37,18 @@ class SvBVHnearNewNode(bpy.types.Node, SverchCustomTreeNode):
 
     mode: EnumProperty(name="Mode", items=modes, default='find_nearest', update=updateNode)
 
+    output_numpy: BoolProperty(
+        name='Output NumPy', description='Output NumPy arrays (nearest mode)',
+        default=False, update=updateNode)
+
     def draw_buttons(self, context, layout):
         layout.prop(self, 'mode')
 
+    def draw_buttons_ext(self, context, layout):
+        layout.prop(self, 'mode')
+        if self.mode == 'find_nearest':
+            layout.prop(self, 'output_numpy')
+
     def sv_init(self, context):
         si = self.inputs.new
         so = self.outputs.new
@@ -54,7 +63,7 @@ class SvBVHnearNewNode(bpy.types.Node, SverchCustomTreeNode):
     @staticmethod
     def svmesh_to_bvh_lists(vsock, fsock):
         for vertices, polygons in zip(*C([vsock.sv_get(), fsock.sv_get()])):
-            yield BVHTree.FromPolygons(vertices, polygons, all_triangles=False, epsilon=0.0)
+            yield cached_bvh(vertices, polygons)
 
     def process(self):
         vert_sock, face_sock, point_sock = self.inputs
@@ -63,7 +72,12 @@ class SvBVHnearNewNode(bpy.types.Node, SverchCustomTreeNode):
         PT = point_sock.sv_get()
         if self.mode == 'find_nearest':
             for bvh, pt in zip(self.svmesh_to_bvh_lists(vert_sock, face_sock), PT):
-                RL.append([bvh.find_nearest(P) for P in pt])
+                RL.append(bvh_find_nearest(bvh, pt))
+            for idx, socket in enumerate((L, N, I, D)):
+                if socket.is_linked:
+                    out = [result[idx] for result in RL]
+                    socket.sv_set(out if self.output_numpy else [data.tolist() for data in out])
+            return
         else:  # find_nearest_range
             for bvh, pt in zip(self.svmesh_to_bvh_lists(vert_sock, face_sock), PT):
                 RL.extend([bvh.find_nearest_range(P) for P in pt])
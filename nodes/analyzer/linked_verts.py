@@ -17,52 +17,24 @@
 # ##### END GPL LICENSE BLOCK #####
 
 
+import numpy as np
+
 import bpy
 from bpy.props import IntProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_repeat
-
-
-def all_connexions(edges, item_n, distance, connexions_dict, distance_max):
-    '''iterative calculation of connexions'''
-    connexions_list = []
-    edges_out = []
-    for e in edges:
-        edge_in = True
-        for s in e:
-            if s in item_n:
-                connexions_list += e
-                edge_in = False
-                break
-        if edge_in:
-            edges_out.append(e)
-    connexions_list_clean = list(set(connexions_list) - set(item_n))
-    connexions_dict[distance_max - distance + 1] = connexions_list_clean
-
-    if distance > 1:
-        connexions_list_clean = all_connexions(edges_out, connexions_list_clean, distance - 1, connexions_dict, distance_max)
-
-    return connexions_list_clean
+from sverchok.utils.sv_mesh_utils import hop_distances
 
 
 def calc_connexions(meshes, gates, result):
-    '''calculate connexions by creating sets'''
+    '''select vertices at the given numbers of edges from the items'''
 
     for vertices, edges, item_n, distance in zip(*meshes):
         if gates[3]:
             item_n = [i for i, m in enumerate(item_n) if m]
-            print(item_n)
-        connexions_dict = {}
-        connexions_dict[0] = item_n
-        d_max = max(distance)
-        _ = all_connexions(edges, item_n, d_max, connexions_dict, d_max)
-
-        out_index = []
-        for d in distance:
-            if d in connexions_dict:
-                out_index += connexions_dict[d]
-
-        out_index = list(set(out_index))
+        hops = hop_distances(len(vertices), edges, item_n, max(distance))
+        selected = np.isin(hops, distance) & (hops >= 0)
+        out_index = np.flatnonzero(selected).tolist()
 
         result[0].append(out_index)
 
@@ -73,8 +45,7 @@ def calc_connexions(meshes, gates, result):
             result[1].append(connected_v)
 
         if gates[2]:
-            mask = [True if i in out_index else False for i in range(len(vertices))]
-            result[2].append(mask)
+            result[2].append(selected.tolist())
 
     return result
 
@@ -20,12 +20,12 @@ import bpy
 import mathutils
 import numpy as np
 from mathutils import Vector
-from mathutils.bvhtree import BVHTree
 
 from bpy.props import BoolProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_repeat, match_cross)
 from sverchok.utils.logging import debug, info, error
+from sverchok.utils.sv_bvh_utils import cached_bvh
 
 class FakeObj(object):
 
@@ -39,7 +39,7 @@ class FakeObj(object):
         vertices = [vert.co[:] for vert in data.vertices]
         polygons = [poly.vertices[:] for poly in data.polygons]
 
-        self.BVH = BVHTree.FromPolygons(vertices, polygons)
+        self.BVH = cached_bvh(vertices, polygons)
         obj.to_mesh_clear()
 
 
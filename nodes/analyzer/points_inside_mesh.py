@@ -18,6 +18,7 @@
 
 
 from itertools import cycle
+import numpy as np
 import bpy
 from bpy.props import (IntProperty, FloatProperty, BoolProperty, EnumProperty, FloatVectorProperty)
 import bmesh
@@ -29,6 +30,9 @@ from mathutils.noise import seed_set, random_unit_vector
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, list_match_func, list_match_modes
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
+from sverchok.utils.points_inside_mesh import points_inside_mesh, VOTES_NEEDED
+from sverchok.utils.ragged_array import ragged_to_lists
+from sverchok.utils.sv_bvh_utils import cached_bvh, bvh_ray_cast
 
 
 def generate_random_unitvectors():
@@ -41,46 +45,25 @@ directions = generate_random_unitvectors()
 
 
 def get_points_in_mesh(verts, faces, points, eps=0.0, num_samples=3):
-    mask_inside = []
-
-    bvh = BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=eps)
+    bvh = cached_bvh(verts, faces, eps)
+    votes = np.zeros(len(points), dtype=np.int64)
 
     for direction in directions[:num_samples]:
-        samples = []
-        mask = samples.append
+        success, _, normals, _, _ = bvh_ray_cast(bvh, points, direction)
+        votes += success & (normals @ np.array(direction) >= 0.0)
+
+    # exactly what the criteria should be here is not clear, this seems enough.
+    return (votes >= VOTES_NEEDED[num_samples]).tolist()
 
-        for point in points:
-            hit = bvh.ray_cast(point, direction)
-            if hit[0]:
-                v = hit[1].dot(direction)
-                mask(not v < 0.0)
-            else:
-                mask(False)
-
-        mask_inside.append(samples)
-
-    if len(mask_inside) == 1:
-        return mask_inside[0]
-    else:
-        mask_totals = []
-        oversample = mask_totals.append
-        num_points = len(points)
-
-        # exactly what the criteria should be here is not clear, this seems enough.
-        for i in range(num_points):
-            fsum = sum(mask_inside[j][i] for j in range(num_samples))
-
-            if num_samples == 2:
-                oversample(fsum >= 1)
-            elif num_samples == 3:
-                oversample(fsum >= 2)
-            elif num_samples == 4:
-                oversample(fsum >= 3)
-            elif num_samples == 5:
-                oversample(fsum >= 4)
-            elif num_samples == 6:
-                oversample(fsum >= 4)
-        return mask_totals
+
+def get_points_in_mesh_parity(verts, faces, points, eps=0.0, num_samples=3):
+    # eps is the BVH tolerance, the NumPy test does not need it
+    rays = np.array(directions[:num_samples])
+    return points_inside_mesh(verts, faces, points, directions=rays, method='PARITY')
+
+
+def get_points_in_mesh_winding(verts, faces, points, eps=0.0):
+    return points_inside_mesh(verts, faces, points, method='WINDING')
 
 
 def are_inside(verts, faces, points, eps):
@@ -101,7 +84,7 @@ def are_inside(verts, faces, points, eps):
 
 def get_points_in_mesh_2D(verts, faces, points, normal, eps=0.0):
     mask_totals = []
-    bvh = BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=eps)
+    bvh = cached_bvh(verts, faces, eps)
 
     for point in points:
         inside = False
@@ -120,7 +103,7 @@ def get_points_in_mesh_2D(verts, faces, points, normal, eps=0.0):
 
 def get_points_in_mesh_2D_clip(verts, faces, points, normal, clip_distance, eps=0.0, matchig_method='REPEAT'):
     mask_totals = []
-    bvh = BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=eps)
+    bvh = cached_bvh(verts, faces, eps)
 
     normal, clip_distance = list_match_func[matchig_method]([normal, clip_distance])
     for point in points:
@@ -147,8 +130,11 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
     bl_idname = 'SvPointInside'
     bl_label = 'Points Inside Mesh'
     sv_icon = 'SV_POINTS_INSIDE_MESH'
+    # faces as RaggedArray are used as is by the NumPy algorithms
+    sv_accepts_ragged = True
 
-    mode_options = [(k[0], k[1], '', i) for i, k in enumerate([("algo 1", "Regular"), ("algo 2", "Multisample")])]
+    mode_options = [(k[0], k[1], '', i) for i, k in enumerate([
+        ("algo 1", "Regular"), ("algo 2", "Multisample"), ("algo 3", "Ray Parity"), ("algo 4", "Winding")])]
     dimension_options = [(k, k, '', i) for i, k in enumerate(["2D", "3D"])]
 
     @throttled
@@ -196,6 +182,10 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
         min=1, max=6, default=3,
         update=updateNode)
 
+    output_numpy: BoolProperty(
+        name='Output NumPy', description='Output NumPy arrays',
+        default=False, update=updateNode)
+
     list_match_global: EnumProperty(
         name="Match Global",
         description="Behavior on different list lengths, multiple objects level",
@@ -224,9 +214,16 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
             if self.selected_algo == 'algo 2':
                 layout.prop(self, 'epsilon_bvh', text='Epsilon')
                 layout.prop(self, 'num_samples', text='Samples')
+            elif self.selected_algo == 'algo 3':
+                layout.prop(self, 'num_samples', text='Samples')
+
+    def numpy_mask(self):
+        return self.dimensions_mode == '3D' and self.selected_algo in {'algo 3', 'algo 4'}
 
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
+        if self.numpy_mask():
+            layout.prop(self, 'output_numpy')
         layout.prop(self, 'list_match_global', text='Global Match')
         if self.dimensions_mode == '2D' and self.limit_max_dist:
             layout.prop(self, 'list_match_local', text='Local Match')
@@ -240,6 +237,8 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
     def get_data(self):
         # general parameters
         params = [s.sv_get() for s in self.inputs[:3]]
+        if not self.numpy_mask():
+            params[1] = ragged_to_lists(params[1])
         # special parameters
         if self.dimensions_mode == '2D':
             params.append(self.inputs['Plane Normal'].sv_get(default=[[]]))
@@ -257,6 +256,11 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
             elif self.selected_algo == 'algo 2':
                 params.append(cycle([self.num_samples]))
                 main_func = get_points_in_mesh
+            elif self.selected_algo == 'algo 3':
+                params.append(cycle([self.num_samples]))
+                main_func = get_points_in_mesh_parity
+            else:
+                main_func = get_points_in_mesh_winding
         else:
             if self.limit_max_dist:
                 params.append(cycle([self.list_match_local]))
@@ -277,13 +281,24 @@ class SvPointInside(bpy.types.Node, SverchCustomTreeNode):
         for par in zip(*params):
             mask.append(main_func(*par))
 
-        self.outputs['mask'].sv_set(mask)
+        if not self.numpy_mask():
+            self.outputs['mask'].sv_set(mask)
+
+            if self.outputs['verts'].is_linked:
+                out_verts = []
+                for masked, pts_in in zip(mask, params[2]):
+                    out_verts.append([p for m, p in zip(masked, pts_in) if m])
+                self.outputs['verts'].sv_set(out_verts)
+            return
 
         if self.outputs['verts'].is_linked:
-            out_verts = []
-            for masked, pts_in in zip(mask, params[2]):
-                out_verts.append([p for m, p in zip(masked, pts_in) if m])
+            out_verts = [np.asarray(pts_in)[masked] for masked, pts_in in zip(mask, params[2])]
+            if not self.output_numpy:
+                out_verts = [v.tolist() for v in out_verts]
             self.outputs['verts'].sv_set(out_verts)
+        if not self.output_numpy:
+            mask = [m.tolist() for m in mask]
+        self.outputs['mask'].sv_set(mask)
 
 
 def register():
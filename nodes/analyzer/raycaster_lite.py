@@ -19,7 +19,7 @@
 import bpy
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_cycle as C)
-from mathutils.bvhtree import BVHTree
+from sverchok.utils.sv_bvh_utils import cached_bvh, bvh_ray_cast
 
 # zeffii 2017 8 okt
 # airlifted from Kosvor's Raycast nodes..
@@ -33,6 +33,9 @@ class SvRaycasterLiteNode(bpy.types.Node, SverchCustomTreeNode):
 
     start: bpy.props.FloatVectorProperty(default=(0,0,0), size=3, update=updateNode)
     direction: bpy.props.FloatVectorProperty(default=(0,0,-1), size=3, update=updateNode)
+    output_numpy: bpy.props.BoolProperty(
+        name='Output NumPy', description='Output NumPy arrays',
+        default=False, update=updateNode)
 
     def sv_init(self, context):
         si = self.inputs.new
@@ -49,10 +52,13 @@ class SvRaycasterLiteNode(bpy.types.Node, SverchCustomTreeNode):
         so('SvStringsSocket', 'Distance')
         so('SvStringsSocket', 'Success')
 
+    def draw_buttons_ext(self, context, layout):
+        layout.prop(self, 'output_numpy')
+
     @staticmethod
     def svmesh_to_bvh_lists(v, f):
         for vertices, polygons in zip(*C([v, f])):
-            yield BVHTree.FromPolygons(vertices, polygons, all_triangles=False, epsilon=0.0)
+            yield cached_bvh(vertices, polygons)
 
     def process(self):
         L, N, I, D, S = self.outputs
@@ -62,18 +68,13 @@ class SvRaycasterLiteNode(bpy.types.Node, SverchCustomTreeNode):
 
         for bvh, st, di in zip(*[self.svmesh_to_bvh_lists(vert_in, face_in), start_in, direction_in]):
             st, di = C([st, di])
-            RL.append([bvh.ray_cast(i, i2) for i, i2 in zip(st, di)])
-
-        if L.is_linked:
-            L.sv_set([[r[0][:] if r[0] else (0, 0, 0) for r in L] for L in RL])
-        if N.is_linked:
-            N.sv_set([[r[1][:] if r[1] else (0, 0, 0) for r in L] for L in RL])
-        if I.is_linked:
-            I.sv_set([[r[2] if r[2] else -1 for r in L] for L in RL])
-        if D.is_linked:
-            D.sv_set([[r[3] if r[3] else 0 for r in L] for L in RL])
-        if S.is_linked:
-            S.sv_set([[r[2] != None for r in L] for L in RL])
+            RL.append(bvh_ray_cast(bvh, st, di))
+
+        # bvh_ray_cast returns success, location, normal, index, distance
+        for socket, idx in zip((L, N, I, D, S), (1, 2, 3, 4, 0)):
+            if socket.is_linked:
+                out = [result[idx] for result in RL]
+                socket.sv_set(out if self.output_numpy else [data.tolist() for data in out])
 
 
 def register():
@@ -20,8 +20,14 @@ import bpy
 import ast
 from bpy.props import IntProperty, FloatProperty, EnumProperty
 
+from collections import defaultdict
+
+import numpy as np
+
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
+from sverchok.utils.modules.eval_formula import compile_formula
+from sverchok.utils.logging import exception
 
 import bpy, math, cmath, mathutils
 from math import acos, acosh, asin, asinh, atan, atan2, \
@@ -341,17 +347,41 @@ class SvFormulaShapeNode(bpy.types.Node, SverchCustomTreeNode):
     
     def makeverts(self, vert, f, XX, YY, ZZ, fx,fy,fz, X_X, Y_Y, Z_Z, i_over):
         ''' main function '''
-        out=[]
+        # formulas see the names of this module (math, cmath, mathutils, math functions)
+        # and the variables of previous formulas, as with plain eval before;
+        # each formula is compiled once
+        env = dict(globals())
+        env.update(vert=vert, f=f, XX=XX, YY=YY, ZZ=ZZ)
+        steps = [('i', i_over), ('XX', X_X), ('YY', Y_Y), ('ZZ', Z_Z)]
+        coords = [('X', fx), ('Y', fy), ('Z', fz)]
+        names = {name for name, _ in coords}
+        # XX, YY and ZZ of each step depend on the previous step, so they are found
+        # one by one; coordinates are then evaluated at once if they depend only on
+        # the step variables and NumPy can evaluate them
+        vectorized = all(not names & compile_formula(formula).variables for _, formula in steps) and \
+            all(compile_formula(formula).vectorizable and
+                compile_formula(formula).variables <= {'vert', 'f', 'n', 'i', 'XX', 'YY', 'ZZ'}
+                for _, formula in coords)
+        if not vectorized:
+            steps += coords
+        codes = [(name, compile(formula.strip(), "<formula>", 'eval')) for name, formula in steps]
+
+        values = defaultdict(list)
+        out = []
         for n in range(vert):
-            i = eval(i_over)
-            XX = eval(X_X)
-            YY = eval(Y_Y)
-            ZZ = eval(Z_Z)
-            X = eval(fx)
-            Y = eval(fy)
-            Z = eval(fz)
-            out.append((X,Y,Z))
-        return [out]
+            env['n'] = n
+            for name, code in codes:
+                env[name] = eval(code, env)
+            if vectorized:
+                for name in ('vert', 'f', 'n', 'i', 'XX', 'YY', 'ZZ'):
+                    values[name].append(env[name])
+            else:
+                out.append((env['X'], env['Y'], env['Z']))
+        if not vectorized or not vert:
+            return [out]
+        columns = [compile_formula(formula).evaluate(values) for _, formula in coords]
+        columns = [c.tolist() if isinstance(c, np.ndarray) else c for c in columns]
+        return [list(zip(*columns))]
 
     def sv_init(self, context):
         self.inputs.new('SvStringsSocket', "Count").prop_name = 'number'
@@ -390,8 +420,8 @@ class SvFormulaShapeNode(bpy.types.Node, SverchCustomTreeNode):
                                 self.formulaX, self.formulaY, self.formulaZ, 
                                 self.X_X, self.Y_Y, self.Z_Z, self.i_override)
                 self.outputs['Verts'].sv_set(out)
-            except:
-                print('Cannot calculate, formula generator')
+            except Exception as e:
+                exception("Cannot calculate, formula generator: %s", e)
                 out = sv_no_ve
                 edg = sv_no_ed
                 self.outputs['Verts'].sv_set(sv_no_ve)
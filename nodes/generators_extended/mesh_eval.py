@@ -30,6 +30,7 @@ import io
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import fullList, updateNode, dataCorrect, match_long_repeat
 from sverchok.utils.script_importhelper import safe_names
+from sverchok.utils.modules.eval_formula import safe_eval
 from sverchok.utils.logging import exception, info
 
 """
@@ -50,15 +51,6 @@ def get_variables(string):
     result = {node.id for node in ast.walk(root) if isinstance(node, ast.Name)}
     return result.difference(safe_names.keys())
 
-# It could be safer...
-def safe_eval(string, variables):
-    env = dict()
-    env.update(safe_names)
-    env.update(variables)
-    env["__builtins__"] = {}
-    root = ast.parse(string, mode='eval')
-    return eval(compile(root, "<expression>", 'eval'), env)
-
 def evaluate(json, variables):
     result = {}
     result['edges'] = json['edges']
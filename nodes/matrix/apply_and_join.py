@@ -21,7 +21,7 @@ from bpy.props import BoolProperty
 from mathutils import Matrix, Vector
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (Matrix_generate, updateNode) #, fullList_deep_copy)
-from sverchok.utils.sv_mesh_utils import mesh_join
+from sverchok.utils.sv_mesh_utils import mesh_join_np
 
 
 class SvMatrixApplyJoinNode(bpy.types.Node, SverchCustomTreeNode):
@@ -35,6 +35,8 @@ class SvMatrixApplyJoinNode(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Matrix Apply'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_MATRIX_APPLY_JOIN'
+    # mesh_join_np takes faces as RaggedArray, joined faces are output as RaggedArray
+    sv_accepts_ragged = True
 
     do_join: BoolProperty(name='Join', default=True, update=updateNode)
 
@@ -69,8 +71,8 @@ class SvMatrixApplyJoinNode(bpy.types.Node, SverchCustomTreeNode):
         result_edges = (edges * n)[:n]
         result_faces = (faces * n)[:n]
         if self.do_join:
-            outV, result_edges, result_faces = mesh_join(outV, result_edges, result_faces)
-            outV, result_edges, result_faces = [outV], [result_edges], [result_faces]
+            outV, result_edges, result_faces = mesh_join_np(outV, result_edges, result_faces)
+            outV, result_edges, result_faces = [outV.tolist()], [result_edges.tolist()], [result_faces]
         self.outputs['Edges'].sv_set(result_edges)
         self.outputs['Faces'].sv_set(result_faces)
         self.outputs['Vertices'].sv_set(outV)
@@ -16,11 +16,13 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
-import collections
+import numpy as np
 
 import bpy
 
 from sverchok.node_tree import SverchCustomTreeNode
+from sverchok.utils.ragged_array import RaggedArray
+from sverchok.utils.sv_mesh_utils import item_pairs, mesh_components
 
 
 class SvSeparateMeshNodeMK2(bpy.types.Node, SverchCustomTreeNode):
@@ -51,53 +53,52 @@ class SvSeparateMeshNodeMK2(bpy.types.Node, SverchCustomTreeNode):
         poly_edge_index = []
 
         for ve, pe in zip(verts, poly):
-            # build links
-            node_links = collections.defaultdict(set)
-            for edge_face in pe:
-                for i in edge_face:
-                    node_links[i].update(edge_face)
-
-            nodes = set(node_links.keys())
-            n = nodes.pop()
-            node_set_list = [set([n])]
-            node_stack = collections.deque()
-            node_stack_append = node_stack.append
-            node_stack_pop = node_stack.pop
-            node_set = node_set_list[-1]
-            # find separate sets
-            while nodes:
-                for node in node_links[n]:
-                    if node not in node_set:
-                        node_stack_append(node)
-                if not node_stack:  # new mesh part
-                    n = nodes.pop()
-                    node_set_list.append(set([n]))
-                    node_set = node_set_list[-1]
-                else:
-                    while node_stack and n in node_set:
-                        n = node_stack_pop()
-                    nodes.discard(n)
-                    node_set.add(n)
-            # create new meshes from sets, new_pe is the slow line.
-            if len(node_set_list) > 1:
-                node_set_list.sort(key=lambda x: min(x))
-                for idx, node_set in enumerate(node_set_list):
-                    mesh_index = sorted(node_set)
-                    vert_dict = {j: i for i, j in enumerate(mesh_index)}
-                    new_vert = [ve[i] for i in mesh_index]
-                    new_pe = [[vert_dict[n] for n in fe]
-                              for fe in pe
-                              if fe[0] in node_set]
+            loops = RaggedArray.from_list(pe, dtype=np.int64)
+            if not len(loops.values):
+                continue
+            labels = mesh_components(len(ve), item_pairs(loops))
+            # parts are numbered in the order of their smallest vertex,
+            # vertices not used by edges / faces are dropped
+            used = np.zeros(len(ve), dtype=bool)
+            used[loops.values] = True
+            roots, part = np.unique(labels[used], return_inverse=True)
+            part = part.reshape(-1)
+
+            if len(roots) > 1:
+                used_verts = np.flatnonzero(used)
+                vert_order = np.argsort(part, kind='stable')
+                vert_counts = np.bincount(part, minlength=len(roots))
+                vert_starts = np.cumsum(vert_counts) - vert_counts
+                # index of each vertex in its part
+                local = np.zeros(len(ve), dtype=np.int64)
+                local[used_verts[vert_order]] = np.arange(len(vert_order)) - np.repeat(vert_starts, vert_counts)
+
+                part_of_vert = np.zeros(len(ve), dtype=np.int64)
+                part_of_vert[used_verts] = part
+                item_part = part_of_vert[loops.values[loops.offsets[:-1]]]
+                item_order = np.argsort(item_part, kind='stable')
+                item_counts = np.bincount(item_part, minlength=len(roots)).tolist()
+                items = loops.take(item_order)
+                items.values = local[items.values]
+                items = items.tolist()
+
+                part_verts = used_verts[vert_order].tolist()
+                vert_start, item_start = 0, 0
+                for idx, (vert_count, item_count) in enumerate(zip(vert_counts.tolist(), item_counts)):
+                    new_vert = [ve[i] for i in part_verts[vert_start:vert_start + vert_count]]
+                    new_pe = items[item_start:item_start + item_count]
+                    vert_start += vert_count
+                    item_start += item_count
 
                     verts_out.append(new_vert)
                     poly_edge_out.append(new_pe)
-                    vert_index.append([idx for i in range(len(new_vert))])
-                    poly_edge_index.append([idx for face in new_pe])
-            elif node_set_list:  # no reprocessing needed
+                    vert_index.append([idx] * len(new_vert))
+                    poly_edge_index.append([idx] * len(new_pe))
+            else:  # no reprocessing needed
                 verts_out.append(ve)
                 poly_edge_out.append(pe)
-                vert_index.append([0 for i in range(len(ve))])
-                poly_edge_index.append([0 for face in pe])
+                vert_index.append([0] * len(ve))
+                poly_edge_index.append([0] * len(pe))
 
         self.outputs['Vertices'].sv_set(verts_out)
         self.outputs['Poly Egde'].sv_set(poly_edge_out)
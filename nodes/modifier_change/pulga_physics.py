@@ -17,12 +17,16 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+import hashlib
+import os
+import tempfile
 from numpy import array
 import bpy
 from bpy.props import IntProperty, StringProperty, BoolProperty, FloatProperty, FloatVectorProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, node_id, match_long_repeat
-from sverchok.utils.pulga_physics_core import pulga_system_init
+from sverchok.core.socket_data import sv_fingerprint
+from sverchok.utils.pulga_physics_core import pulga_system_init, get_simulation, drop_simulations
 
 FILE_NAME = 'pulga_Memory '
 
@@ -231,6 +235,45 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
         update=memory_to_file
         )
 
+    keep_state : BoolProperty(
+        name="Keep State",
+        description="Keep simulation state between updates: more Iterations continue from the last result,"
+                    " fewer Iterations resume from the nearest snapshot",
+        default=False,
+        update=updateNode)
+
+    snapshot_interval : IntProperty(
+        name="Snapshot Interval",
+        description="Save simulation state to disk every n iterations, 0 = no snapshots",
+        default=50, min=0,
+        update=updateNode)
+
+    checkpoint_dir : StringProperty(
+        name="Snapshots Folder",
+        description="Folder for snapshot files (.npz), temporary folder if empty",
+        default="", subtype='DIR_PATH',
+        update=updateNode)
+
+    def get_checkpoint_dir(self):
+        if self.checkpoint_dir:
+            return bpy.path.abspath(self.checkpoint_dir)
+        return os.path.join(bpy.app.tempdir or tempfile.gettempdir(), "pulga_checkpoints")
+
+    def get_simulation(self, par, gates_dict, temp_id):
+        '''stored state of the system, it is dropped if any input other than Iterations changes'''
+        inputs = [p for idx, p in enumerate(par) if idx != 1]
+        gates = [(k, v) for k, v in sorted(gates_dict.items()) if k != "output"]
+        fingerprint = sv_fingerprint([inputs, gates])
+        if fingerprint is None:
+            return None
+        # the fingerprint is a digest of the inputs already, the key only adds the node and object
+        key = hashlib.sha1(b"%s:%d:%s" % (node_id(self).encode(), temp_id, fingerprint)).hexdigest()[:20]
+        sim_id = (node_id(self), temp_id)
+        return get_simulation(sim_id, key, self.get_checkpoint_dir(), self.snapshot_interval)
+
+    def free(self):
+        drop_simulations(node_id(self))
+
     def accumulativity_get_data(self):
         '''get data form previous update'''
         data = self.node_cache.get(0)
@@ -432,11 +475,16 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
             cr.prop(self, "accumulative_reset", toggle=True)
             cr.prop(self,"accumulative_update",  toggle=True)
             cr.prop(self, "accumulative_parse", toggle=True)
+        else:
+            r4.prop(self, "keep_state", toggle=True)
 
     def draw_buttons_ext(self, context, layout):
         '''draw buttons on the N-panel'''
         self.draw_buttons(context, layout)
         layout.prop(self, "output_numpy", toggle=False)
+        if self.keep_state and not self.accumulative:
+            layout.prop(self, "snapshot_interval")
+            layout.prop(self, "checkpoint_dir")
 
 
     def get_data(self):
@@ -527,13 +575,19 @@ class SvPulgaPhysicsNode(bpy.types.Node, SverchCustomTreeNode):
                 par_dict = {}
                 for idx, p in enumerate(self.sorted_props):
                     par_dict[p[0]] = par[idx]
-                cache_new = pulga_system_init(par_dict, par, gates_dict, out_lists, cache)
+                simulation = None
+                if self.keep_state and not self.accumulative:
+                    simulation = self.get_simulation(par, gates_dict, temp_id)
+                cache_new = pulga_system_init(par_dict, par, gates_dict, out_lists, cache, simulation)
 
                 if self.accumulative:
                     self.accumulativity_set_data(cache_new, temp_id)
 
                 temp_id += 1
 
+            # forget states of objects which are not there anymore
+            drop_simulations(node_id(self), temp_id if self.keep_state and not self.accumulative else 0)
+
         if so['Vertices'].is_linked:
             so['Vertices'].sv_set(verts_out)
         if so['Rads'].is_linked:
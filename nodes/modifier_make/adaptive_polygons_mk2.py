@@ -18,6 +18,7 @@
 
 from math import sin, cos, pi, sqrt, pow
 from functools import reduce
+from itertools import chain
 
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
@@ -35,7 +36,7 @@ from sverchok.data_structure import (updateNode, Vector_generate,
 
 from sverchok.ui.sv_icons import custom_icon
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, remove_doubles
-from sverchok.utils.sv_mesh_utils import mesh_join
+from sverchok.utils.sv_mesh_utils import mesh_join_np
 from sverchok.utils.geom import diameter, LineEquation2D, center
 from sverchok.utils.logging import info, debug
 # "coauthor": "Alessandro Zomparelli (sketchesofcode)"
@@ -909,10 +910,11 @@ class SvAdaptivePolygonsNodeMk2(bpy.types.Node, SverchCustomTreeNode):
 
             output.verts_out = Vector_degenerate(output.verts_out)
             if self.join:
-                output.verts_out, _, output.faces_out = mesh_join(output.verts_out, [], output.faces_out)
-                output.face_data_out = sum(output.face_data_out, [])
-                output.vert_recpt_idx_out = sum(output.vert_recpt_idx_out, [])
-                output.face_recpt_idx_out = sum(output.face_recpt_idx_out, [])
+                verts_out, _, faces_out = mesh_join_np(output.verts_out, [], output.faces_out)
+                output.verts_out, output.faces_out = verts_out.tolist(), faces_out.tolist()
+                output.face_data_out = list(chain.from_iterable(output.face_data_out))
+                output.vert_recpt_idx_out = list(chain.from_iterable(output.vert_recpt_idx_out))
+                output.face_recpt_idx_out = list(chain.from_iterable(output.face_recpt_idx_out))
 
                 if self.remove_doubles:
                     doubles_res = remove_doubles(output.verts_out, [], output.faces_out, threshold, face_data=output.face_data_out, vert_data=output.vert_recpt_idx_out)
@@ -17,7 +17,7 @@ from bpy.props import IntProperty, EnumProperty, BoolProperty, FloatProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_repeat, Matrix_generate, Vector_generate, Vector_degenerate, ensure_nesting_level
 from sverchok.utils.geom import autorotate_householder, autorotate_track, autorotate_diff, diameter
-from sverchok.utils.geom import LinearSpline, CubicSpline
+from sverchok.utils.geom import LinearSpline, CubicSpline, frames_to_matrices
 from sverchok.utils.logging import info
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh
 from sverchok.utils.sv_mesh_utils import polygons_to_edges
@@ -35,7 +35,8 @@ class SvBevelCurveNode(bpy.types.Node, SverchCustomTreeNode):
     algorithms = [
             ("householder", "Householder", "Use Householder reflection matrix", 1),
             ("track", "Tracking", "Use quaternion-based tracking", 2),
-            ("diff", "Rotation difference", "Use rotational difference calculation", 3)
+            ("diff", "Rotation difference", "Use rotational difference calculation", 3),
+            ("transport", "Parallel transport", "Use rotation minimizing frames along the curve", 4)
         ]
 
     algorithm: EnumProperty(name = "Algorithm",
@@ -177,7 +178,8 @@ class SvBevelCurveNode(bpy.types.Node, SverchCustomTreeNode):
 
         layout.prop(self, 'metric')
         layout.prop(self, 'taper_metric')
-        layout.prop(self, 'tangent_precision')
+        if self.algorithm != 'transport':
+            layout.prop(self, 'tangent_precision')
         if hasattr(self, 'twist_mode'):
             layout.prop(self, 'twist_mode')
 
@@ -228,7 +230,15 @@ class SvBevelCurveNode(bpy.types.Node, SverchCustomTreeNode):
             vertices = [Vector((twist, 0, t)) for t, twist in zip(ts, data)]
             return self.build_spline(vertices, self.twist_mode, is_cyclic=self.is_cyclic, metric = self.metric)
 
-    def get_matrix(self, tangent, twist_value, scale_x, scale_y):
+    def get_frame_axes(self):
+        if self.orient_axis_idx == 0:
+            return (0, 1, 2)
+        elif self.orient_axis_idx == 1:
+            return (1, 0, 2)
+        else:
+            return (2, 0, 1)
+
+    def get_matrix(self, tangent, twist_value, scale_x, scale_y, frame=None):
         x = Vector((1.0, 0.0, 0.0))
         y = Vector((0.0, 1.0, 0.0))
         z = Vector((0.0, 0.0, 1.0))
@@ -250,6 +260,8 @@ class SvBevelCurveNode(bpy.types.Node, SverchCustomTreeNode):
             rot = autorotate_track(self.orient_axis, tangent, self.up_axis)
         elif self.algorithm == 'diff':
             rot = autorotate_diff(tangent, ax1)
+        elif self.algorithm == 'transport':
+            rot = frame.to_4x4()
         else:
             raise Exception("Unsupported algorithm")
 
@@ -287,7 +299,13 @@ class SvBevelCurveNode(bpy.types.Node, SverchCustomTreeNode):
             t_for_twist = t_values
 
         spline_vertices = [Vector(v) for v in spline.eval(t_for_curve).tolist()]
-        spline_tangents = [Vector(v) for v in spline.tangent(t_for_curve, h=self.tangent_precision).tolist()]
+        if self.algorithm == 'transport':
+            frames = spline.parallel_transport_frames(t_for_curve)
+            spline_frames = [Matrix(m) for m in frames_to_matrices(*frames, axes=self.get_frame_axes()).tolist()]
+            spline_tangents = [Vector(v) for v in frames[0].tolist()]
+        else:
+            spline_tangents = [Vector(v) for v in spline.tangent(t_for_curve, h=self.tangent_precision).tolist()]
+            spline_frames = [None] * len(spline_tangents)
         taper_values = [self.get_taper_scale(v) for v in taper.eval(t_for_taper).tolist()]
         twist_values = [self.get_twist_value(v) for v in twist.eval(t_for_twist).tolist()]
 
@@ -299,10 +317,10 @@ class SvBevelCurveNode(bpy.types.Node, SverchCustomTreeNode):
         mesh = bmesh.new()
         prev_level_vertices = None
         first_level_vertices = None
-        for spline_vertex, spline_tangent, taper_value, twist_value in zip(spline_vertices, spline_tangents, taper_values, twist_values):
+        for spline_vertex, spline_tangent, spline_frame, taper_value, twist_value in zip(spline_vertices, spline_tangents, spline_frames, taper_values, twist_values):
             # Scaling and rotation matrix
             scale_x, scale_y = taper_value
-            matrix = self.get_matrix(spline_tangent, twist_value, scale_x, scale_y)
+            matrix = self.get_matrix(spline_tangent, twist_value, scale_x, scale_y, spline_frame)
             level_vertices = []
             for bevel_vertex in bevel_verts:
                 new_vertex = matrix @ Vector(bevel_vertex) + spline_vertex
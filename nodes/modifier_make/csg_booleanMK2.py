@@ -22,6 +22,7 @@ from bpy.props import EnumProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_cycle as mlr
 from sverchok.utils.csg_core import CSG
+from sverchok.utils.csg_numpy import NumpyCSG
 
 
 def Boolean(VA, PA, VB, PB, operation):
@@ -29,6 +30,7 @@ def Boolean(VA, PA, VB, PB, operation):
     b = CSG.Obj_from_pydata(VB, PB)
     faces = []
     vertices = []
+    vertex_index = {}
     if operation == 'DIFF':
         polygons = a.subtract(b).toPolygons()
     elif operation == 'JOIN':
@@ -38,15 +40,29 @@ def Boolean(VA, PA, VB, PB, operation):
     for polygon in polygons:
         indices = []
         for v in polygon.vertices:
-            pos = [v.pos.x, v.pos.y, v.pos.z]
-            if pos not in vertices:
-                vertices.append(pos)
-            index = vertices.index(pos)
+            pos = (v.pos.x, v.pos.y, v.pos.z)
+            index = vertex_index.get(pos)
+            if index is None:
+                index = vertex_index[pos] = len(vertices)
+                vertices.append(list(pos))
             indices.append(index)
         faces.append(indices)
     return [vertices, faces]
 
 
+def Boolean_numpy(VA, PA, VB, PB, operation):
+    a = NumpyCSG.Obj_from_pydata(VA, PA)
+    b = NumpyCSG.Obj_from_pydata(VB, PB)
+    if operation == 'DIFF':
+        result = a.subtract(b)
+    elif operation == 'JOIN':
+        result = a.union(b)
+    elif operation == 'ITX':
+        result = a.intersect(b)
+    vertices, faces = result.to_pydata()
+    return [vertices, faces]
+
+
 class SvCSGBooleanNodeMK2(bpy.types.Node, SverchCustomTreeNode):
     '''CSG Boolean Node MK2'''
     bl_idname = 'SvCSGBooleanNodeMK2'
@@ -65,6 +81,18 @@ class SvCSGBooleanNodeMK2(bpy.types.Node, SverchCustomTreeNode):
         default="ITX",
         update=updateNode)
 
+    engine_options = [
+        ("BSP", "BSP", "Original engine, builds BSP trees of polygons", 0),
+        ("NUMPY", "NumPy", "Faster engine working on NumPy arrays, output faces touching the other mesh are triangulated", 1)
+    ]
+
+    engine: EnumProperty(
+        name="Engine",
+        items=engine_options,
+        description="Implementation of boolean operations",
+        default="BSP",
+        update=updateNode)
+
     def update_mode(self, context):
         self.inputs['Verts A'].hide_safe = self.nest_objs
         self.inputs['Polys A'].hide_safe = self.nest_objs
@@ -95,6 +123,7 @@ class SvCSGBooleanNodeMK2(bpy.types.Node, SverchCustomTreeNode):
         self.inputs.new('SvStringsSocket',  'Polys Nested').hide_safe = True
         self.outputs.new('SvVerticesSocket', 'Vertices')
         self.outputs.new('SvStringsSocket', 'Polygons')
+        self.engine = "NUMPY"
 
     def draw_buttons(self, context, layout):
         row = layout.row()
@@ -104,29 +133,34 @@ class SvCSGBooleanNodeMK2(bpy.types.Node, SverchCustomTreeNode):
         if self.nest_objs:
             col.prop(self, "out_last", toggle=True)
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "engine")
+
     def process(self):
         OutV, OutP = self.outputs
         if not OutV.is_linked:
             return
         VertA, PolA, VertB, PolB, VertN, PolN = self.inputs
         SMode = self.selected_mode
+        Boolean_func = Boolean_numpy if self.engine == "NUMPY" else Boolean
         out = []
         recursionlimit = sys.getrecursionlimit()
         sys.setrecursionlimit(10000)
         if not self.nest_objs:
             for v1, p1, v2, p2 in zip(*mlr([VertA.sv_get(), PolA.sv_get(), VertB.sv_get(), PolB.sv_get()])):
-                out.append(Boolean(v1, p1, v2, p2, SMode))
+                out.append(Boolean_func(v1, p1, v2, p2, SMode))
         else:
             vnest, pnest = VertN.sv_get(), PolN.sv_get()
-            First = Boolean(vnest[0], pnest[0], vnest[1], pnest[1], SMode)
+            First = Boolean_func(vnest[0], pnest[0], vnest[1], pnest[1], SMode)
             if not self.out_last:
                 out.append(First)
                 for i in range(2, len(vnest)):
-                    out.append(Boolean(First[0], First[1], vnest[i], pnest[i], SMode))
+                    out.append(Boolean_func(First[0], First[1], vnest[i], pnest[i], SMode))
                     First = out[-1]
             else:
                 for i in range(2, len(vnest)):
-                    First = Boolean(First[0], First[1], vnest[i], pnest[i], SMode)
+                    First = Boolean_func(First[0], First[1], vnest[i], pnest[i], SMode)
                 out.append(First)
         sys.setrecursionlimit(recursionlimit)
         OutV.sv_set([i[0] for i in out])
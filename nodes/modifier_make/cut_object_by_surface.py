@@ -20,13 +20,13 @@ from collections import defaultdict
 
 import bpy
 import bmesh
-import mathutils
 from bpy.props import BoolProperty, IntProperty
 from mathutils import Vector, Matrix
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, zip_long_repeat
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh
+from sverchok.utils.sv_bvh_utils import cached_bvh
 
 class SvCutObjBySurfaceNode(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -116,7 +116,7 @@ class SvCutObjBySurfaceNode(bpy.types.Node, SverchCustomTreeNode):
 
             # We are using bvh's raycast to calculate intersections of object's edges
             # with the surface.
-            bvh = mathutils.bvhtree.BVHTree.FromPolygons(surf_vertices, surf_faces)
+            bvh = cached_bvh(surf_vertices, surf_faces)
             bm_obj = bmesh_from_pydata(obj_vertices, obj_edges, obj_faces)
             bm_cut = bmesh.new()
             edges_by_face = defaultdict(list)
@@ -16,14 +16,23 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import numpy as np
+
 import bpy
 from bpy.props import FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
-from sverchok.utils.voronoi import Site, computeVoronoiDiagram, computeDelaunayTriangulation
+from sverchok.utils.voronoi_numpy import delaunay_triangulation
+
+def delaunay_2d_faces(vertices):
+    '''
+    Delaunay triangles of vertices projected to XY plane, as list of faces;
+    triangles are clockwise, as the Fortune based computeDelaunayTriangulation made them
+    '''
+    triangles, _, _ = delaunay_triangulation(np.array(vertices)[:, :2])
+    return triangles[:, ::-1].tolist()
 
-# computeDelaunayTriangulation
 class DelaunayTriangulation2DNode(bpy.types.Node, SverchCustomTreeNode):
     '''dea Verts. Triangulation '''
     bl_idname = 'DelaunayTriangulation2DNode'
@@ -47,9 +56,7 @@ class DelaunayTriangulation2DNode(bpy.types.Node, SverchCustomTreeNode):
         points_in = self.inputs['Vertices'].sv_get()
 
         for obj in points_in:
-            pt_list = [Site(pt[0], pt[1]) for pt in obj]
-            res = computeDelaunayTriangulation(pt_list)
-            tris_out.append([tri for tri in res if -1 not in tri])
+            tris_out.append(delaunay_2d_faces(obj))
 
 
         self.outputs['Polygons'].sv_set(tris_out)
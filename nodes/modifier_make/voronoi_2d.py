@@ -19,6 +19,8 @@
 from math import sqrt, atan2
 from collections import defaultdict
 
+import numpy as np
+
 import bpy
 import bmesh
 from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
@@ -28,6 +30,7 @@ from mathutils.geometry import intersect_line_line_2d
 from sverchok.node_tree import SverchCustomTreeNode, throttled
 from sverchok.data_structure import updateNode, zip_long_repeat
 from sverchok.utils.voronoi import Site, computeVoronoiDiagram, computeDelaunayTriangulation, BIG_FLOAT
+from sverchok.utils.voronoi_numpy import Voronoi2D
 from sverchok.utils.geom import center, LineEquation2D, CircleEquation2D
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
 from sverchok.utils.logging import debug, info
@@ -276,6 +279,18 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
         min=3,
         update=updateNode)
 
+    engine_options = [
+        ('FORTUNE', "Fortune", "Original implementation, sweep line algorithm by Steven Fortune", 0),
+        ('NUMPY', "NumPy", "Faster implementation, builds Delaunay triangulation and clips the diagram on NumPy arrays", 1)
+    ]
+
+    engine: EnumProperty(
+        name = "Engine",
+        description = "Implementation of Voronoi diagram",
+        items = engine_options,
+        default = 'FORTUNE',
+        update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "Vertices")
         self.inputs.new('SvStringsSocket', 'MaxSides').prop_name = 'max_sides'
@@ -283,6 +298,7 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
         self.outputs.new('SvStringsSocket', "Edges")
         self.outputs.new('SvStringsSocket', "Faces")
         self.update_sockets(context)
+        self.engine = 'NUMPY'
 
     def draw_buttons(self, context, layout):
         layout.prop(self, "bound_mode")
@@ -292,6 +308,176 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
         layout.prop(self, "clip", text="Clipping")
         layout.prop(self, "make_faces")
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.prop(self, "engine")
+
+    def voronoi_numpy(self, sites):
+        sites = np.array(sites)[:, :2]
+        diagram = Voronoi2D(sites)
+        keep_partial = self.draw_hangs or self.draw_bounds
+        delta = self.clip
+        if self.bound_mode == 'BOX':
+            x_min, y_min = sites.min(axis=0) - delta
+            x_max, y_max = sites.max(axis=0) + delta
+            verts, edges = diagram.clip_box(x_min, y_min, x_max, y_max,
+                                            keep_partial=keep_partial, draw_bounds=self.draw_bounds)
+        else:
+            bounds_center = sites.mean(axis=0)
+            radius = np.sqrt(np.sum((sites - bounds_center) ** 2, axis=1)).max() + delta
+            verts, edges = diagram.clip_circle(bounds_center, radius,
+                                               keep_partial=keep_partial, draw_bounds=self.draw_bounds)
+        verts = np.concatenate((verts, np.zeros((len(verts), 1))), axis=1)
+        return verts.tolist(), edges.tolist()
+
+    def voronoi_fortune(self, sites):
+        bounds = Bounds.new(self.bound_mode)
+        source_sites = []
+        bounds.x_max = -BIG_FLOAT
+        bounds.x_min = BIG_FLOAT
+        bounds.y_min = BIG_FLOAT
+        bounds.y_max = -BIG_FLOAT
+        x0, y0, z0 = center(sites)
+        bounds.center = (x0, y0)
+        # creates points in format for voronoi library, throwing away z
+        for x, y, z in sites:
+            r = sqrt((x-x0)**2 + (y-y0)**2)
+            bounds.r_max = max(r, bounds.r_max)
+            bounds.x_max = max(x, bounds.x_max)
+            bounds.x_min = min(x, bounds.x_min)
+            bounds.y_max = max(y, bounds.y_max)
+            bounds.y_min = min(y, bounds.y_min)
+            source_sites.append(Site(x, y))
+
+        delta = self.clip
+        bounds.x_max = bounds.x_max + delta
+        bounds.y_max = bounds.y_max + delta
+
+        bounds.x_min = bounds.x_min - delta
+        bounds.y_min = bounds.y_min - delta
+
+        bounds.r_max = bounds.r_max + delta
+
+        voronoi_data = computeVoronoiDiagram(source_sites)
+        verts = voronoi_data.vertices
+        lines = voronoi_data.lines
+        all_edges = voronoi_data.edges
+
+        finite_edges = [(edge[1], edge[2]) for edge in all_edges if -1 not in edge]
+        bm = Mesh2D.from_pydata(verts, finite_edges)
+
+        # clipping box to bounding box.
+        verts_to_remove = set()
+        edges_to_remove = set()
+        bounding_verts = []
+
+        # For each diagram vertex that is outside of the bounds,
+        # cut each edge connected with that vertex by bounding line.
+        # Remove such vertices, remove such edges, and instead add
+        # vertices lying on the bounding line and corresponding edges.
+        for vert_idx, vert in enumerate(bm.verts[:]):
+            x, y = tuple(vert)
+            if not bounds.contains((x,y)):
+                verts_to_remove.add(vert_idx)
+                for other_vert_idx in list(bm.linked_verts[vert_idx]):
+                    edges_to_remove.add((vert_idx, other_vert_idx))
+                    if self.draw_hangs or self.draw_bounds:
+                        other_vert = bm.verts[other_vert_idx]
+                        if other_vert is not None:
+                            x2, y2 = tuple(other_vert)
+                            intersection = bounds.segment_intersection((x,y), (x2,y2))
+                            if intersection is not None:
+                                intersection = tuple(intersection)
+                                new_vert_idx = bm.new_vert(intersection)
+                                bounding_verts.append(new_vert_idx)
+                                #info("CLIP: Added point: %s => %s", (x_i, y_i), new_vert_idx)
+                                bm.new_edge(other_vert_idx, new_vert_idx)
+
+        # Diagram lines that go infinitely from one side of diagram to another
+        infinite_lines = []
+        # Lines that start at the one vertex of the diagram and go to infinity
+        rays = defaultdict(list)
+        if self.draw_hangs or self.draw_bounds:
+            sites_by_line = defaultdict(list)
+
+            for site_idx in voronoi_data.polygons.keys():
+                for line_index, i1, i2 in voronoi_data.polygons[site_idx]:
+                    if i1 == -1 or i2 == -1:
+                        site = source_sites[site_idx]
+                        sites_by_line[line_index].append((site.x, site.y))
+
+            for line_index, i1, i2 in all_edges:
+                if i1 == -1 or i2 == -1:
+                    line = lines[line_index]
+                    a, b, c = line
+                    eqn = LineEquation2D(a, b, -c)
+                    if i1 == -1 and i2 != -1:
+                        eqn.sites = sites_by_line[line_index]
+                        rays[i2].append(eqn)
+                    elif i2 == -1 and i1 != -1:
+                        eqn.sites = sites_by_line[line_index]
+                        rays[i1].append(eqn)
+                    elif i1 == -1 and i2 == -1:
+                        infinite_lines.append(eqn)
+
+            # For each (half-infinite) ray, calculate it's intersection
+            # with the bounding line and draw an edge from ray's beginning to
+            # the bounding line.
+            # NB: The data returned from voronoi.py for such lines
+            # is a vertex and a line equation. The line obviously intersects
+            # the bounding line in two points; which one should we choose?
+            # Let's choose that one which is closer to site points which the
+            # line is dividing.
+            for vert_index in rays.keys():
+                x,y = bm.verts[vert_index]
+                vert = Vector((x,y))
+                if vert_index not in verts_to_remove:
+                    for line in rays[vert_index]:
+                        intersection = bounds.ray_intersection(vert, line)
+                        intersection = tuple(intersection)
+                        new_vert_idx = bm.new_vert(intersection)
+                        bounding_verts.append(new_vert_idx)
+                        #info("INF: Added point: %s: %s => %s", (x,y), (x_i, y_i), new_vert_idx)
+                        bm.new_edge(vert_index, new_vert_idx)
+
+            # For each infinite (in two directions) line,
+            # calculate two it's intersections with the bounding
+            # line and connect them by an edge.
+            for eqn in infinite_lines:
+                intersections = bounds.line_intersection(eqn)
+                if len(intersections) == 2:
+                    v1, v2 = intersections
+                    new_vert_1_idx = bm.new_vert(tuple(v1))
+                    new_vert_2_idx = bm.new_vert(tuple(v2))
+                    bounding_verts.append(new_vert_1_idx)
+                    bounding_verts.append(new_vert_2_idx)
+                    bm.new_edge(new_vert_1_idx, new_vert_2_idx)
+                else:
+                    self.error("unexpected number of intersections of infinite line %s with area bounds: %s", eqn, intersections)
+
+            # TODO: there could be (finite) edges, which have both ends
+            # outside of the bounding line. We could detect such edges and
+            # process similarly to infinite lines - calculate two intersections
+            # with the bounding line and connect them by an edge.
+            # Currently I consider such cases as rare, so this is a low priority issue.
+            # Btw, such edges do not fall under definition of either "bounding edge"
+            # or "hanging edge"; so should we add a separate checkbox for such edges?...
+
+        if self.draw_bounds and bounding_verts:
+            bounding_verts.sort(key = lambda idx: atan2(bm.verts[idx][1], bm.verts[idx][0]))
+            for i, j in zip(bounding_verts, bounding_verts[1:]):
+                bm.new_edge(i, j)
+            bm.new_edge(bounding_verts[-1], bounding_verts[0])
+
+        for i, j in edges_to_remove:
+            bm.remove_edge(i, j)
+        for vert_idx in verts_to_remove:
+            bm.verts[vert_idx] = None
+
+        verts, edges = bm.to_pydata()
+
+        return [(vert[0], vert[1], 0) for vert in verts], edges
+
     def process(self):
 
         if not self.inputs['Vertices'].is_linked:
@@ -313,152 +499,10 @@ class Voronoi2DNode(bpy.types.Node, SverchCustomTreeNode):
             if isinstance(max_sides, (list, tuple)):
                 max_sides = max_sides[0]
 
-            bounds = Bounds.new(self.bound_mode)
-            source_sites = []
-            bounds.x_max = -BIG_FLOAT
-            bounds.x_min = BIG_FLOAT
-            bounds.y_min = BIG_FLOAT
-            bounds.y_max = -BIG_FLOAT
-            x0, y0, z0 = center(sites)
-            bounds.center = (x0, y0)
-            # creates points in format for voronoi library, throwing away z
-            for x, y, z in sites:
-                r = sqrt((x-x0)**2 + (y-y0)**2)
-                bounds.r_max = max(r, bounds.r_max)
-                bounds.x_max = max(x, bounds.x_max)
-                bounds.x_min = min(x, bounds.x_min)
-                bounds.y_max = max(y, bounds.y_max)
-                bounds.y_min = min(y, bounds.y_min)
-                source_sites.append(Site(x, y))
-
-            delta = self.clip
-            bounds.x_max = bounds.x_max + delta
-            bounds.y_max = bounds.y_max + delta
-
-            bounds.x_min = bounds.x_min - delta
-            bounds.y_min = bounds.y_min - delta
-
-            bounds.r_max = bounds.r_max + delta
-
-            voronoi_data = computeVoronoiDiagram(source_sites)
-            verts = voronoi_data.vertices
-            lines = voronoi_data.lines
-            all_edges = voronoi_data.edges
-
-            finite_edges = [(edge[1], edge[2]) for edge in all_edges if -1 not in edge]
-            bm = Mesh2D.from_pydata(verts, finite_edges)
-
-            # clipping box to bounding box.
-            verts_to_remove = set()
-            edges_to_remove = set()
-            bounding_verts = []
-
-            # For each diagram vertex that is outside of the bounds,
-            # cut each edge connected with that vertex by bounding line.
-            # Remove such vertices, remove such edges, and instead add
-            # vertices lying on the bounding line and corresponding edges.
-            for vert_idx, vert in enumerate(bm.verts[:]):
-                x, y = tuple(vert)
-                if not bounds.contains((x,y)):
-                    verts_to_remove.add(vert_idx)
-                    for other_vert_idx in list(bm.linked_verts[vert_idx]):
-                        edges_to_remove.add((vert_idx, other_vert_idx))
-                        if self.draw_hangs or self.draw_bounds:
-                            other_vert = bm.verts[other_vert_idx]
-                            if other_vert is not None:
-                                x2, y2 = tuple(other_vert)
-                                intersection = bounds.segment_intersection((x,y), (x2,y2))
-                                if intersection is not None:
-                                    intersection = tuple(intersection)
-                                    new_vert_idx = bm.new_vert(intersection)
-                                    bounding_verts.append(new_vert_idx)
-                                    #info("CLIP: Added point: %s => %s", (x_i, y_i), new_vert_idx)
-                                    bm.new_edge(other_vert_idx, new_vert_idx)
-
-            # Diagram lines that go infinitely from one side of diagram to another
-            infinite_lines = []
-            # Lines that start at the one vertex of the diagram and go to infinity
-            rays = defaultdict(list)
-            if self.draw_hangs or self.draw_bounds:
-                sites_by_line = defaultdict(list)
-
-                for site_idx in voronoi_data.polygons.keys():
-                    for line_index, i1, i2 in voronoi_data.polygons[site_idx]:
-                        if i1 == -1 or i2 == -1:
-                            site = source_sites[site_idx]
-                            sites_by_line[line_index].append((site.x, site.y))
-
-                for line_index, i1, i2 in all_edges:
-                    if i1 == -1 or i2 == -1:
-                        line = lines[line_index]
-                        a, b, c = line
-                        eqn = LineEquation2D(a, b, -c)
-                        if i1 == -1 and i2 != -1:
-                            eqn.sites = sites_by_line[line_index]
-                            rays[i2].append(eqn)
-                        elif i2 == -1 and i1 != -1:
-                            eqn.sites = sites_by_line[line_index]
-                            rays[i1].append(eqn)
-                        elif i1 == -1 and i2 == -1:
-                            infinite_lines.append(eqn)
-
-                # For each (half-infinite) ray, calculate it's intersection
-                # with the bounding line and draw an edge from ray's beginning to
-                # the bounding line.
-                # NB: The data returned from voronoi.py for such lines
-                # is a vertex and a line equation. The line obviously intersects
-                # the bounding line in two points; which one should we choose?
-                # Let's choose that one which is closer to site points which the
-                # line is dividing.
-                for vert_index in rays.keys():
-                    x,y = bm.verts[vert_index]
-                    vert = Vector((x,y))
-                    if vert_index not in verts_to_remove:
-                        for line in rays[vert_index]:
-                            intersection = bounds.ray_intersection(vert, line)
-                            intersection = tuple(intersection)
-                            new_vert_idx = bm.new_vert(intersection)
-                            bounding_verts.append(new_vert_idx)
-                            #info("INF: Added point: %s: %s => %s", (x,y), (x_i, y_i), new_vert_idx)
-                            bm.new_edge(vert_index, new_vert_idx)
-
-                # For each infinite (in two directions) line,
-                # calculate two it's intersections with the bounding
-                # line and connect them by an edge.
-                for eqn in infinite_lines:
-                    intersections = bounds.line_intersection(eqn)
-                    if len(intersections) == 2:
-                        v1, v2 = intersections
-                        new_vert_1_idx = bm.new_vert(tuple(v1))
-                        new_vert_2_idx = bm.new_vert(tuple(v2))
-                        bounding_verts.append(new_vert_1_idx)
-                        bounding_verts.append(new_vert_2_idx)
-                        bm.new_edge(new_vert_1_idx, new_vert_2_idx)
-                    else:
-                        self.error("unexpected number of intersections of infinite line %s with area bounds: %s", eqn, intersections)
-
-                # TODO: there could be (finite) edges, which have both ends
-                # outside of the bounding line. We could detect such edges and
-                # process similarly to infinite lines - calculate two intersections
-                # with the bounding line and connect them by an edge.
-                # Currently I consider such cases as rare, so this is a low priority issue.
-                # Btw, such edges do not fall under definition of either "bounding edge"
-                # or "hanging edge"; so should we add a separate checkbox for such edges?...
-
-            if self.draw_bounds and bounding_verts:
-                bounding_verts.sort(key = lambda idx: atan2(bm.verts[idx][1], bm.verts[idx][0]))
-                for i, j in zip(bounding_verts, bounding_verts[1:]):
-                    bm.new_edge(i, j)
-                bm.new_edge(bounding_verts[-1], bounding_verts[0])
-
-            for i, j in edges_to_remove:
-                bm.remove_edge(i, j)
-            for vert_idx in verts_to_remove:
-                bm.verts[vert_idx] = None
-
-            verts, edges = bm.to_pydata()
-
-            new_vertices = [(vert[0], vert[1], 0) for vert in verts]
+            if self.engine == 'NUMPY':
+                new_vertices, edges = self.voronoi_numpy(sites)
+            else:
+                new_vertices, edges = self.voronoi_fortune(sites)
 
             if self.make_faces:
                 bm = bmesh_from_pydata(new_vertices, edges, [])
@@ -19,15 +19,16 @@
 from math import *
 from collections import defaultdict
 
+import numpy as np
 import bpy
 from bpy.props import BoolProperty, StringProperty, EnumProperty, FloatVectorProperty, IntProperty
 import json
 import io
 
 from sverchok.node_tree import SverchCustomTreeNode, throttled
-from sverchok.data_structure import updateNode, match_long_repeat, zip_long_repeat
+from sverchok.data_structure import updateNode, match_long_repeat
 from sverchok.utils import logging
-from sverchok.utils.modules.eval_formula import get_variables, safe_eval
+from sverchok.utils.modules.eval_formula import get_variables, compile_formula
 
 class SvFormulaNodeMk3(bpy.types.Node, SverchCustomTreeNode):
     """
@@ -185,19 +186,24 @@ class SvFormulaNodeMk3(bpy.types.Node, SverchCustomTreeNode):
             parameters = match_long_repeat(input_values)
         else:
             parameters = [[[]]]
+        formulas = [compile_formula(formula) for formula in self.formulas() if formula]
         for objects in zip(*parameters):
-            object_results = []
-            for values in zip_long_repeat(*objects):
-                variables = dict(zip(var_names, values))
-                vector = []
-                for formula in self.formulas():
-                    if formula:
-                        value = safe_eval(formula, variables)
-                        vector.append(value)
+            if not var_names:
+                results.append([])
+                continue
+            variables = dict(zip(var_names, objects))
+            # each formula is evaluated for all values of the object at once
+            columns = [formula.evaluate(variables) for formula in formulas]
+            if all(isinstance(column, np.ndarray) for column in columns) \
+                    and len(set(column.dtype for column in columns)) == 1:
+                vectors = np.stack(columns, axis=-1)
+                object_results = vectors.tolist() if self.separate else vectors.ravel().tolist()
+            else:
+                columns = [column.tolist() if isinstance(column, np.ndarray) else column for column in columns]
                 if self.separate:
-                    object_results.append(vector)
+                    object_results = [list(vector) for vector in zip(*columns)]
                 else:
-                    object_results.extend(vector)
+                    object_results = [value for vector in zip(*columns) for value in vector]
             results.append(object_results)
 
         if self.wrap:
@@ -19,10 +19,10 @@
 import bpy
 import mathutils
 from mathutils import Vector
-from mathutils.bvhtree import BVHTree
 from bpy.props import BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, match_long_repeat)
+from sverchok.utils.sv_bvh_utils import cached_bvh, bvh_ray_cast
 
 
 class FakeObj(object):
@@ -33,7 +33,7 @@ class FakeObj(object):
         data = obj.to_mesh() #*mesh_settings)
         vertices = [vert.co[:] for vert in data.vertices]
         polygons = [poly.vertices[:] for poly in data.polygons]
-        self.BVH = BVHTree.FromPolygons(vertices, polygons)
+        self.BVH = cached_bvh(vertices, polygons)
         obj.to_mesh_clear()
 
     def ray_cast(self, a, b):
@@ -46,6 +46,11 @@ class FakeObj(object):
         else:
             return [True, tv[0], tv[1], tv[2]]
 
+    def ray_cast_many(self, origins, directions):
+        success, locations, normals, indices, _ = bvh_ray_cast(self.BVH, origins, directions)
+        normals[~success] = (1, 0, 0)
+        return list(zip(success.tolist(), locations.tolist(), normals.tolist(), indices.tolist()))
+
 
 class SvOBJRayCastNodeMK2(bpy.types.Node, SverchCustomTreeNode):
     ''' RayCast Object '''
@@ -83,9 +88,13 @@ class SvOBJRayCastNodeMK2(bpy.types.Node, SverchCustomTreeNode):
                 OB = FakeObj(OB)
             if sm1:
                 obm = OB.matrix_local.inverted()
-                outfin.append([OB.ray_cast(obm @ Vector(i), obm @ Vector(i2)) for i,i2 in zip(st,en)])
+                rays = [(obm @ Vector(i), obm @ Vector(i2)) for i,i2 in zip(st,en)]
+            else:
+                rays = list(zip(st,en))
+            if isinstance(OB, FakeObj):
+                outfin.append(OB.ray_cast_many(*zip(*rays)) if rays else [])
             else:
-                outfin.append([OB.ray_cast(i,i2) for i,i2 in zip(st,en)])
+                outfin.append([OB.ray_cast(i,i2) for i,i2 in rays])
         if S.is_linked:
             S.sv_set([[i[0] for i in i2] for i2 in outfin])
 
@@ -22,6 +22,7 @@ from bpy.props import EnumProperty
 from mathutils.bvhtree import BVHTree
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, enum_item as e)
+from sverchok.utils.sv_bvh_utils import cached_bvh
 
 
 class SvBVHtreeNode(bpy.types.Node, SverchCustomTreeNode):
@@ -65,7 +66,7 @@ class SvBVHtreeNode(bpy.types.Node, SverchCustomTreeNode):
                 bvh.append(BVHTree.FromBMesh(i))
         else:
             for i,i2 in zip(self.inputs[1].sv_get(),self.inputs[2].sv_get()):
-                bvh.append(BVHTree.FromPolygons(i, i2, all_triangles=False, epsilon=0.0))
+                bvh.append(cached_bvh(i, i2))
         self.outputs[0].sv_set(bvh)
 
 
@@ -25,7 +25,7 @@ from bpy.props import IntProperty, EnumProperty, BoolProperty, FloatProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_repeat, Vector_generate, Vector_degenerate, ensure_nesting_level
 from sverchok.utils.geom import autorotate_householder, autorotate_track, autorotate_diff
-from sverchok.utils.geom import LinearSpline, CubicSpline
+from sverchok.utils.geom import LinearSpline, CubicSpline, frames_to_matrices
 
 class SvBendAlongPathNode(bpy.types.Node, SverchCustomTreeNode):
     '''
@@ -39,7 +39,8 @@ class SvBendAlongPathNode(bpy.types.Node, SverchCustomTreeNode):
     algorithms = [
             ("householder", "Householder", "Use Householder reflection matrix", 1),
             ("track", "Tracking", "Use quaternion-based tracking", 2),
-            ("diff", "Rotation difference", "Use rotational difference calculation", 3)
+            ("diff", "Rotation difference", "Use rotational difference calculation", 3),
+            ("transport", "Parallel transport", "Use rotation minimizing frames along the path", 4)
         ]
 
     algorithm: EnumProperty(
@@ -118,7 +119,8 @@ class SvBendAlongPathNode(bpy.types.Node, SverchCustomTreeNode):
         self.draw_buttons(context, layout)
         layout.prop(self, 'flip')
         layout.prop(self, 'metric')
-        layout.prop(self, 'tangent_precision')
+        if self.algorithm != 'transport':
+            layout.prop(self, 'tangent_precision')
 
     def build_spline(self, path):
         if self.mode == 'LIN':
@@ -155,6 +157,25 @@ class SvBendAlongPathNode(bpy.types.Node, SverchCustomTreeNode):
 
         return rot @ scale_matrix
 
+    def bend_transport(self, vertices, spline, t_values, scale):
+        """
+        Bend vertices using rotation minimizing frames of the spline,
+        calculated for all vertices at once.
+        """
+        if self.orient_axis == 0:
+            axes = (0, 1, 2)
+        elif self.orient_axis == 1:
+            axes = (1, 0, 2)
+        else:
+            axes = (2, 0, 1)
+        rotations = frames_to_matrices(*spline.parallel_transport_frames(t_values), axes=axes)
+        projections = np.array(vertices, dtype=np.float64)
+        projections[:, self.orient_axis] = 0
+        if self.scale_all:
+            projections *= scale
+        new_vertices = np.einsum('nij,nj->ni', rotations, projections) + spline.eval(t_values)
+        return new_vertices.tolist()
+
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
             return
@@ -187,6 +208,9 @@ class SvBendAlongPathNode(bpy.types.Node, SverchCustomTreeNode):
 
             spline = self.build_spline(path)
             scale = spline.length(t_values) / object_size
+            if self.algorithm == 'transport':
+                result_vertices.append(self.bend_transport(vertices, spline, t_values, scale))
+                continue
             # These are points lying on the spline
             # (a projection of object to spline)
             spline_vertices = [Vector(v) for v in spline.eval(t_values).tolist()]
@@ -203,9 +227,9 @@ class SvBendAlongPathNode(bpy.types.Node, SverchCustomTreeNode):
                 new_vertex = matrix @ Vector(src_vertex_projection) + spline_vertex
                 new_vertices.append(new_vertex)
 
-            result_vertices.append(new_vertices)
+            result_vertices.append(Vector_degenerate([new_vertices])[0])
 
-        self.outputs['Vertices'].sv_set(Vector_degenerate(result_vertices))
+        self.outputs['Vertices'].sv_set(result_vertices)
 
 def register():
     bpy.utils.register_class(SvBendAlongPathNode)
@@ -27,6 +27,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_repeat, ensure_nesting_level, transpose_list
 from sverchok.utils.geom import diameter
 from sverchok.utils.geom import LinearSpline, CubicSpline, Spline2D
+from sverchok.utils.ragged_array import RaggedArray
 
 class SvBendAlongSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
     '''
@@ -142,18 +143,17 @@ class SvBendAlongSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
     def get_uv(self, vertices):
         """
         Translate source vertices to UV space of future spline.
-        vertices must be list of list of 3-tuples.
+        vertices must be np.array of shape (n, 3).
         """
-        #print("Vertices: {} of {} of {}".format(type(vertices), type(vertices[0]), type(vertices[0][0])))
         u_index, v_index = self.get_other_axes()
 
         # Rescale U and V coordinates to [0, 1], drop third coordinate
-        us = [vertex[u_index] for col in vertices for vertex in col]
-        vs = [vertex[v_index] for col in vertices for vertex in col]
-        min_u = min(us)
-        max_u = max(us)
-        min_v = min(vs)
-        max_v = max(vs)
+        us = vertices[:, u_index]
+        vs = vertices[:, v_index]
+        min_u = us.min()
+        max_u = us.max()
+        min_v = vs.min()
+        max_v = vs.max()
 
         size_u = max_u - min_u
         size_v = max_v - min_v
@@ -162,9 +162,8 @@ class SvBendAlongSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
             raise Exception("Object has too small size in U direction")
         if size_v < 0.00001:
             raise Exception("Object has too small size in V direction")
-        result = [[((vertex[u_index] - min_u)/size_u, (vertex[v_index] - min_v)/size_v) for vertex in col] for col in vertices]
 
-        return size_u, size_v, result
+        return size_u, size_v, (us - min_u)/size_u, (vs - min_v)/size_v
 
     def process(self):
         if not any(socket.is_linked for socket in self.outputs):
@@ -186,9 +185,10 @@ class SvBendAlongSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
                 surface = transpose_list(surface)
             #print("Surface: {} of {} of {}".format(type(surface), type(surface[0]), type(surface[0][0])))
             spline = self.build_spline(surface)
-            # uv_coords will be list[m] of lists[n] of 2-tuples of floats
-            # number of "rows" and "columns" in uv_coords will match so of vertices.
-            src_size_u, src_size_v, uv_coords = self.get_uv(vertices)
+            # all vertices of the object are bent at once, rows are restored after that
+            rows = RaggedArray.from_list(vertices, dtype=np.float64)
+            src_vertices = rows.values.reshape((-1, 3))
+            src_size_u, src_size_v, us, vs = self.get_uv(src_vertices)
             if self.autoscale:
                 u_index, v_index = self.get_other_axes()
                 surface_flattened = [v for col in surface for v in col]
@@ -199,20 +199,11 @@ class SvBendAlongSurfaceNode(bpy.types.Node, SverchCustomTreeNode):
                 scale_z = 1.0
             if self.flip:
                 scale_z = - scale_z
-            new_vertices = []
-            for uv_row, vertices_row in zip(uv_coords,vertices):
-                new_row = []
-                for ((u, v), src_vertex) in zip(uv_row, vertices_row):
-                    #print("UV: ({}, {}), SRC: {}".format(u, v, src_vertex))
-                    spline_vertex = np.array(spline.eval(u, v))
-                    spline_normal = np.array(spline.normal(u, v, h=self.normal_precision))
-                    #print("Spline: M {}, N {}".format(spline_vertex, spline_normal))
-                    # Coordinate of source vertex corresponding to orientation axis
-                    z = src_vertex[self.orient_axis]
-                    new_vertex = tuple(spline_vertex + scale_z * z * spline_normal)
-                    new_row.append(new_vertex)
-                new_vertices.append(new_row)
-            result_vertices.append(new_vertices)
+            spline_vertices, spline_normals = spline.points_and_normals(us, vs, h=self.normal_precision)
+            # Coordinate of source vertex corresponding to orientation axis
+            z = src_vertices[:, self.orient_axis]
+            new_vertices = spline_vertices + scale_z * z[:, np.newaxis] * spline_normals
+            result_vertices.append(RaggedArray(new_vertices, rows.offsets).tolist())
 
         if not self.grouped:
             result_vertices = result_vertices[0]
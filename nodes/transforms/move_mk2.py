@@ -30,6 +30,7 @@ class SvMoveNodeMK2(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Move'
     bl_icon = 'NONE' #'MAN_TRANS'
     sv_icon = 'SV_MOVE'
+    sv_thread_safe = True
 
     mult_: FloatProperty(name='multiplier', default=1.0, update=updateNode)
 
@@ -59,6 +59,7 @@ class SvRotationNodeMK2(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Rotation'
     bl_icon = 'NONE' #'MAN_ROT'
     sv_icon = 'SV_ROTATE'
+    sv_thread_safe = True
 
     angle_: FloatProperty(
         name='Angle', description='rotation angle', default=0.0, update=updateNode)
@@ -32,6 +32,7 @@ class SvScaleNodeMK2(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Scale'
     bl_icon = 'NONE' #'MAN_SCALE'
     sv_icon = 'SV_SCALE'
+    sv_thread_safe = True
 
     factor_: FloatProperty(
         name='multiplyer', description='scaling factor', default=1.0, update=updateNode)
@@ -18,9 +18,33 @@
 
 import bpy
 from math import *
-from bpy.props import StringProperty
+import numpy as np
+from bpy.props import StringProperty, EnumProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, second_as_first_cycle as safc)
+from sverchok.utils.modules.eval_formula import evaluate_formulas
+
+
+def colors_vectorized(formulas, colors, colors2=None):
+    """
+    Evaluate formulas of R, G, B and A for all colors of each object at once;
+    formulas are compiled once and cached by their text, so this can run
+    in several threads.
+    """
+    result = []
+    for I, L in enumerate(colors):
+        first = np.asarray(L).reshape((-1, 4))
+        variables = dict(I=[I])
+        if colors2 is not None:
+            second = np.asarray(colors2[I]).reshape((-1, 4))
+            if len(second) == 0:
+                first = first[:0]
+            # second list is cycled to the length of the first one
+            second = second[np.arange(len(first)) % max(len(second), 1)]
+            variables.update(R=second[:, 0], G=second[:, 1], B=second[:, 2], A=second[:, 3])
+        variables.update(r=first[:, 0], g=first[:, 1], b=first[:, 2], a=first[:, 3], i=np.arange(len(first)))
+        result.append(evaluate_formulas(formulas, variables))
+    return result
 
 
 class SvFormulaColorNode(bpy.types.Node, SverchCustomTreeNode):
@@ -35,6 +59,24 @@ class SvFormulaColorNode(bpy.types.Node, SverchCustomTreeNode):
     ModeB: StringProperty(name='formulaB', default='b', update=updateNode)
     ModeA: StringProperty(name='formulaA', default='a', update=updateNode)
 
+    implementation_modes = [
+        ("Python", "Python", "Evaluate formulas color by color", 0),
+        ("NumPy", "NumPy", "Evaluate formulas on whole arrays of colors", 1)]
+
+    implementation: EnumProperty(
+        name='Implementation', items=implementation_modes,
+        description='Choose calculation method',
+        default="Python", update=updateNode)
+
+    output_numpy: BoolProperty(
+        name='Output NumPy',
+        description='Output NumPy arrays',
+        default=False, update=updateNode)
+
+    @property
+    def sv_thread_safe(self):
+        return self.implementation == "NumPy"
+
     def sv_init(self, context):
         self.inputs.new('SvColorSocket', 'Colors(rgba)')
         self.inputs.new('SvColorSocket', 'Colors(RGBA)')
@@ -46,12 +88,32 @@ class SvFormulaColorNode(bpy.types.Node, SverchCustomTreeNode):
             split = row.split(align=True)
             split.split().prop(self, "Mode"+element, text='')
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.label(text="Implementation:")
+        layout.prop(self, "implementation", expand=True)
+        if self.implementation == "NumPy":
+            layout.prop(self, "output_numpy", toggle=False)
+
+    def rclick_menu(self, context, layout):
+        layout.prop_menu_enum(self, "implementation", text="Implementation")
+        if self.implementation == "NumPy":
+            layout.prop(self, "output_numpy", toggle=True)
+
     def process(self):
         Io, Io2 = self.inputs
         Oo = self.outputs[0]
         if Oo.is_linked:
             V = Io.sv_get()
-            if Io2.is_linked:
+            if self.implementation == "NumPy":
+                V2 = Io2.sv_get() if Io2.is_linked else None
+                if V2 is not None:
+                    V = V[:len(V2)]
+                fin = colors_vectorized((self.ModeR, self.ModeG, self.ModeB, self.ModeA), V, V2)
+                if not self.output_numpy:
+                    fin = [colors.tolist() if isinstance(colors, np.ndarray) else colors for colors in fin]
+                Oo.sv_set(fin)
+            elif Io2.is_linked:
                 str = "for Enum,Val2L in zip(enumerate(V), V2): \n    I,L = Enum \n    Pfin = [] \n    for Enum2, col2 in zip(enumerate(L), safc(L, Val2L)): \n        i, (r, g, b, a) = Enum2 \n        (R, G, B, A) = col2 \n        Pfin.append(({n.ModeR},{n.ModeG},{n.ModeB},{n.ModeA})) \n    fin.append(Pfin)"
                 fin = []
                 V2 = Io2.sv_get()
@@ -18,9 +18,33 @@
 
 import bpy
 from math import *
-from bpy.props import StringProperty
+import numpy as np
+from bpy.props import StringProperty, EnumProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, second_as_first_cycle as safc)
+from sverchok.utils.modules.eval_formula import evaluate_formulas
+
+
+def deform_vectorized(formulas, verts, verts2=None):
+    """
+    Evaluate formulas of X, Y and Z for all vertices of each object at once;
+    formulas are compiled once and cached by their text, so this can run
+    in several threads.
+    """
+    result = []
+    for I, L in enumerate(verts):
+        points = np.asarray(L).reshape((-1, 3))
+        variables = dict(I=[I])
+        if verts2 is not None:
+            second = np.asarray(verts2[I]).reshape((-1, 3))
+            if len(second) == 0:
+                points = points[:0]
+            # second list is cycled to the length of the first one
+            second = second[np.arange(len(points)) % max(len(second), 1)]
+            variables.update(X=second[:, 0], Y=second[:, 1], Z=second[:, 2])
+        variables.update(x=points[:, 0], y=points[:, 1], z=points[:, 2], i=np.arange(len(points)))
+        result.append(evaluate_formulas(formulas, variables))
+    return result
 
 
 class SvFormulaDeformMK2Node(bpy.types.Node, SverchCustomTreeNode):
@@ -34,6 +58,24 @@ class SvFormulaDeformMK2Node(bpy.types.Node, SverchCustomTreeNode):
     ModeY: StringProperty(name='formulaY', default='y', update=updateNode)
     ModeZ: StringProperty(name='formulaZ', default='z', update=updateNode)
 
+    implementation_modes = [
+        ("Python", "Python", "Evaluate formulas vertex by vertex", 0),
+        ("NumPy", "NumPy", "Evaluate formulas on whole arrays of vertices", 1)]
+
+    implementation: EnumProperty(
+        name='Implementation', items=implementation_modes,
+        description='Choose calculation method',
+        default="Python", update=updateNode)
+
+    output_numpy: BoolProperty(
+        name='Output NumPy',
+        description='Output NumPy arrays',
+        default=False, update=updateNode)
+
+    @property
+    def sv_thread_safe(self):
+        return self.implementation == "NumPy"
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', 'Verts(xyz)')
         self.inputs.new('SvVerticesSocket', 'Verts(XYZ)')
@@ -45,12 +87,32 @@ class SvFormulaDeformMK2Node(bpy.types.Node, SverchCustomTreeNode):
             split = row.split(align=True)
             split.split().prop(self, "Mode"+element, text='')
 
+    def draw_buttons_ext(self, context, layout):
+        self.draw_buttons(context, layout)
+        layout.label(text="Implementation:")
+        layout.prop(self, "implementation", expand=True)
+        if self.implementation == "NumPy":
+            layout.prop(self, "output_numpy", toggle=False)
+
+    def rclick_menu(self, context, layout):
+        layout.prop_menu_enum(self, "implementation", text="Implementation")
+        if self.implementation == "NumPy":
+            layout.prop(self, "output_numpy", toggle=True)
+
     def process(self):
         Io, Io2 = self.inputs
         Oo = self.outputs[0]
         if Oo.is_linked:
             V = Io.sv_get()
-            if Io2.is_linked:
+            if self.implementation == "NumPy":
+                V2 = Io2.sv_get() if Io2.is_linked else None
+                if V2 is not None:
+                    V = V[:len(V2)]
+                fin = deform_vectorized((self.ModeX, self.ModeY, self.ModeZ), V, V2)
+                if not self.output_numpy:
+                    fin = [verts.tolist() if isinstance(verts, np.ndarray) else verts for verts in fin]
+                Oo.sv_set(fin)
+            elif Io2.is_linked:
                 str = "for Enum,Val2L in zip(enumerate(V), V2): \n    I,L = Enum \n    Pfin = [] \n    for Enum2, vert2 in zip(enumerate(L), safc(L, Val2L)): \n        i, (x, y, z) = Enum2 \n        (X, Y, Z) = vert2 \n        Pfin.append(({n.ModeX},{n.ModeY},{n.ModeZ})) \n    fin.append(Pfin)"
                 fin = []
                 V2 = Io2.sv_get()
@@ -23,7 +23,7 @@ from bpy.props import EnumProperty, FloatProperty, BoolProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, dataCorrect, repeat_last
-from sverchok.utils.geom import LinearSpline, CubicSpline
+from sverchok.utils.geom import LinearSpline, CubicSplineBatch
 
 
 def make_range(number):
@@ -108,11 +108,11 @@ class SvInterpolationNodeMK3(bpy.types.Node, SverchCustomTreeNode):
             verts_out = []
             tanget_out = []
             norm_tanget_out = []
-            for v, t_in in zip(verts, repeat_last(t_ins)):
+            if self.mode == 'LIN':
+                for v, t_in in zip(verts, repeat_last(t_ins)):
 
-                t_corr = np.array(t_in).clip(0, 1)
+                    t_corr = np.array(t_in).clip(0, 1)
 
-                if self.mode == 'LIN':
                     spline = LinearSpline(v, metric = self.knot_mode, is_cyclic = self.is_cyclic)
                     out = spline.eval(t_corr)
                     verts_out.append(out.tolist())
@@ -120,16 +120,22 @@ class SvInterpolationNodeMK3(bpy.types.Node, SverchCustomTreeNode):
                     if calc_tanget:
                         tanget_out.append(spline.tangent(t_corr).tolist())
 
-                else:  # SPL
-                    spline = CubicSpline(v, metric = self.knot_mode, is_cyclic = self.is_cyclic)
-                    out = spline.eval(t_corr)
-                    verts_out.append(out.tolist())
-                    if calc_tanget:
-                        tangent = spline.tangent(t_corr, h)
-                        if norm_tanget:
-                            norm = np.linalg.norm(tangent, axis=1)
-                            norm_tanget_out.append((tangent / norm[:, np.newaxis]).tolist())
-                        tanget_out.append(tangent.tolist())
+            elif verts:  # SPL
+                # splines of all objects are built and evaluated at once
+                t_corrs = [np.array(t_in).clip(0, 1) for v, t_in in zip(verts, repeat_last(t_ins))]
+                spline = CubicSplineBatch(verts, metric = self.knot_mode, is_cyclic = self.is_cyclic)
+                counts = [len(t_corr) for t_corr in t_corrs]
+                t_corr = np.concatenate(t_corrs)
+                curve = np.repeat(np.arange(len(verts)), counts)
+                split = np.cumsum(counts)[:-1]
+                out = spline.eval(t_corr, curve)
+                verts_out = [part.tolist() for part in np.split(out, split)]
+                if calc_tanget:
+                    tangent = spline.tangent(t_corr, curve, h)
+                    if norm_tanget:
+                        norm = np.linalg.norm(tangent, axis=1)
+                        norm_tanget_out = [part.tolist() for part in np.split(tangent / norm[:, np.newaxis], split)]
+                    tanget_out = [part.tolist() for part in np.split(tangent, split)]
 
             outputs = self.outputs
             if outputs['Vertices'].is_linked:
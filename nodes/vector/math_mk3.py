@@ -97,6 +97,7 @@ class SvVectorMathNodeMK3(bpy.types.Node, SverchCustomTreeNode):
     bl_label = 'Vector Math'
     bl_icon = 'THREE_DOTS'
     sv_icon = 'SV_VECTOR_MATH'
+    sv_thread_safe = True
 
     @throttled
     def mode_change(self, context):
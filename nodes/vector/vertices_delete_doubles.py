@@ -17,9 +17,11 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import bpy
+from bpy.props import FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import levelsOflist
+from sverchok.data_structure import levelsOflist, updateNode, zip_long_repeat
+from sverchok.utils.sv_mesh_utils import remove_doubles_numpy, rewire_mesh_indices
 
 
 class VertsDelDoublesNode(bpy.types.Node, SverchCustomTreeNode):
@@ -29,28 +31,71 @@ class VertsDelDoublesNode(bpy.types.Node, SverchCustomTreeNode):
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VECTOR_X_DOUBLES'
 
+    tolerance: FloatProperty(
+        name='Tolerance', description='Merge vertices closer than this distance, 0 - only equal vertices',
+        default=0.0, min=0.0, precision=6, update=updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', "vers")
+        self.inputs.new('SvStringsSocket', "edges")
+        self.inputs.new('SvStringsSocket', "pols")
         self.outputs.new('SvVerticesSocket', "vers")
+        self.outputs.new('SvStringsSocket', "edges")
+        self.outputs.new('SvStringsSocket', "pols")
+        self.outputs.new('SvStringsSocket', "index")
+
+    def draw_buttons(self, context, layout):
+        layout.prop(self, 'tolerance')
 
     def process(self):
         vers = self.inputs['vers'].sv_get()
         # Process data
         levs = levelsOflist(vers)
-        result = self.remdou(vers, levs)
+        result, index = self.remdou(vers, levs)
         self.outputs[0].sv_set(result)
+        if 'index' in self.outputs:
+            self.outputs['index'].sv_set(index)
+
+        # nodes from older files have no mesh sockets
+        if 'edges' not in self.inputs:
+            return
+        edges_out, faces_out = [], []
+        # edges and polygons can be rewired only for a list of meshes
+        if levs == 3:
+            edges_in = self.inputs['edges'].sv_get(default=[[]])
+            faces_in = self.inputs['pols'].sv_get(default=[[]])
+            for obj_index, edges, faces in zip_long_repeat(index, edges_in, faces_in):
+                new_edges, new_faces = rewire_mesh_indices(obj_index, edges, faces)
+                edges_out.append(new_edges)
+                faces_out.append(new_faces)
+        self.outputs['edges'].sv_set(edges_out)
+        self.outputs['pols'].sv_set(faces_out)
 
     def remdou(self, vers, levs):
-        out = []
         if levs >= 3:
             levs -= 1
+            out, index = [], []
             for x in vers:
-                out.append(self.remdou(x, levs))
-        else:
-            for x in vers:
-                if x not in out:
-                    out.append(x)
-        return out
+                new_vers, new_index = self.remdou(x, levs)
+                out.append(new_vers)
+                index.append(new_index)
+            return out, index
+        if len(vers) == 0:
+            return [], []
+        try:
+            new_vers, new_index = remove_doubles_numpy(vers, self.tolerance)
+        except (ValueError, TypeError):
+            # rows of different length or not numbers, only equal items are merged
+            return self.remdou_items(vers)
+        return new_vers.tolist(), new_index.tolist()
+
+    def remdou_items(self, vers):
+        out, index = [], []
+        for x in vers:
+            if x not in out:
+                out.append(x)
+            index.append(out.index(x))
+        return out, index
 
 
 def register():
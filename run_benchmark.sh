@@ -0,0 +1,17 @@
+#!/bin/bash
+
+# Benchmark processing speed of json_examples against stored baseline.
+# If your blender is not available as just "blender" command, then you need
+# to specify path to blender when running this script, e.g.
+#
+# $ BLENDER=~/soft/blender-2.80/blender ./run_benchmark.sh --iterations 5
+#
+# Use --save-baseline to store current timings as the new baseline;
+# without a baseline (e.g. on the first run) the benchmark fails.
+#
+
+set -e
+
+BLENDER=${BLENDER:-blender}
+
+$BLENDER -b --addons sverchok --python utils/benchmark.py --python-exit-code 1 -- "$@"
@@ -7,7 +7,7 @@ from bpy.props import BoolProperty, FloatVectorProperty, EnumProperty, IntProper
 from sverchok import data_structure
 from sverchok.core import handlers
 from sverchok.core import update_system
-from sverchok.utils import sv_panels_tools, logging
+from sverchok.utils import sv_panels_tools, logging, node_stats
 from sverchok.utils.sv_gist_tools import TOKEN_HELP_URL
 from sverchok.ui import color_def
 
@@ -54,9 +54,25 @@ class SverchokPreferences(AddonPreferences):
     def update_debug_mode(self, context):
         data_structure.DEBUG_MODE = self.show_debug
 
+    def update_check_input_mutation(self, context):
+        data_structure.CHECK_INPUT_MUTATION = self.check_input_mutation
+
+    def update_node_stats(self, context):
+        data_structure.COLLECT_NODE_STATS = self.collect_node_stats
+        data_structure.TRACE_NODE_MEMORY = self.trace_node_memory
+        if not (self.collect_node_stats and self.trace_node_memory):
+            node_stats.stop_tracing()
+
     def update_heat_map(self, context):
         data_structure.heat_map_state(self.heat_map)
 
+    def update_incremental_mode(self, context):
+        data_structure.INCREMENTAL_UPDATE = self.incremental_update
+
+    def update_threaded_mode(self, context):
+        data_structure.THREADED_UPDATE = self.threaded_update
+        data_structure.THREADS_COUNT = self.threads_count
+
     def set_frame_change(self, context):
         handlers.set_frame_change(self.frame_change_mode)
 
@@ -80,6 +96,24 @@ class SverchokPreferences(AddonPreferences):
         default=False, subtype='NONE',
         update=update_debug_mode)
 
+    check_input_mutation: BoolProperty(
+        name="Check input mutation",
+        description="Raise an error when a node modifies its input data in place, arrays read without copy are read-only (slow)",
+        default=False, subtype='NONE',
+        update=update_check_input_mutation)
+
+    collect_node_stats: BoolProperty(
+        name="Collect node statistics",
+        description="Keep history of update time and output size of each node",
+        default=False, subtype='NONE',
+        update=update_node_stats)
+
+    trace_node_memory: BoolProperty(
+        name="Trace memory",
+        description="Record peak memory allocated by each node (slows down processing)",
+        default=False, subtype='NONE',
+        update=update_node_stats)
+
     no_data_color: FloatVectorProperty(
         name="No data", description='When a node can not get data',
         size=3, min=0.0, max=1.0,
@@ -109,6 +143,24 @@ class SverchokPreferences(AddonPreferences):
         size=3, min=0.0, max=1.0,
         default=(1, 1, 1), subtype='COLOR')
 
+    incremental_update: BoolProperty(
+        name="Incremental update",
+        description="Do not process nodes downstream of a changed node if their input data did not change",
+        default=False, subtype='NONE',
+        update=update_incremental_mode)
+
+    threaded_update: BoolProperty(
+        name="Threaded update",
+        description="Process unconnected parts of a tree in parallel threads (only nodes marked as thread-safe)",
+        default=False, subtype='NONE',
+        update=update_threaded_mode)
+
+    threads_count: IntProperty(
+        name="Threads",
+        description="Number of worker threads for threaded update, 0 means number of CPUs",
+        default=0, min=0,
+        update=update_threaded_mode)
+
     # Profiling settings
     profiling_sections = [
         ("NONE", "Disable", "Disable profiling", 0),
@@ -334,12 +386,22 @@ class SverchokPreferences(AddonPreferences):
             col2 = col_split.split().column()
             col2.label(text="Frame change handler:")
             col2.row().prop(self, "frame_change_mode", expand=True)
+            col2.prop(self, "incremental_update")
+            threads_row = col2.row()
+            threads_row.prop(self, "threaded_update")
+            if self.threaded_update:
+                threads_row.prop(self, "threads_count")
             col2.separator()
 
             col2box = col2.box()
             col2box.label(text="Debug:")
             col2box.prop(self, "profile_mode")
             col2box.prop(self, "show_debug")
+            col2box.prop(self, "check_input_mutation")
+            stats_row = col2box.row()
+            stats_row.prop(self, "collect_node_stats")
+            if self.collect_node_stats:
+                stats_row.prop(self, "trace_node_memory")
             col2box.prop(self, "heat_map")
             col2box.prop(self, "developer_mode")
 
@@ -0,0 +1,64 @@
+
+import json
+import tempfile
+from os.path import join, exists
+
+from sverchok.utils.testing import *
+from sverchok.utils.benchmark import compare_with_baseline, check_results
+
+class BenchmarkCompareTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.baseline = {"box.json": {"total": 0.1, "nodes": {"Box": 0.05, "Viewer": 0.0001}}}
+
+    def test_no_regressions(self):
+        results = {"box.json": {"total": 0.11, "nodes": {"Box": 0.055, "Viewer": 0.0001}}}
+        self.assertEqual(compare_with_baseline(results, self.baseline, threshold=0.2), [])
+
+    def test_total_regression(self):
+        results = {"box.json": {"total": 0.2, "nodes": {"Box": 0.05, "Viewer": 0.0001}}}
+        regressions = compare_with_baseline(results, self.baseline, threshold=0.2)
+        self.assertEqual(regressions, [("box.json", None, 0.1, 0.2)])
+
+    def test_node_regression_ignores_noise(self):
+        results = {"box.json": {"total": 0.1, "nodes": {"Box": 0.08, "Viewer": 0.0009}}}
+        regressions = compare_with_baseline(results, self.baseline, threshold=0.2)
+        self.assertEqual(regressions, [("box.json", "Box", 0.05, 0.08)])
+
+    def test_new_example_is_skipped(self):
+        results = {"new.json": {"total": 1.0, "nodes": {}}}
+        self.assertEqual(compare_with_baseline(results, self.baseline), [])
+
+
+class BenchmarkCheckTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.baseline_path = join(self.directory.name, "baseline.json")
+        self.results = {"box.json": {"total": 0.1, "nodes": {"Box": 0.05}}}
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def save_baseline(self):
+        with open(self.baseline_path, 'w') as f:
+            json.dump(self.results, f)
+
+    def test_missing_baseline_fails(self):
+        self.assertFalse(check_results(self.results, [], self.baseline_path))
+        self.assertFalse(exists(self.baseline_path))
+
+    def test_save_baseline(self):
+        self.assertTrue(check_results(self.results, [], self.baseline_path, save_baseline=True))
+        self.assertTrue(exists(self.baseline_path))
+
+    def test_failed_example_fails(self):
+        self.save_baseline()
+        self.assertTrue(check_results(self.results, [], self.baseline_path))
+        self.assertFalse(check_results(self.results, ["broken.json"], self.baseline_path))
+
+    def test_regression_fails(self):
+        self.save_baseline()
+        results = {"box.json": {"total": 0.2, "nodes": {"Box": 0.05}}}
+        self.assertFalse(check_results(results, [], self.baseline_path))
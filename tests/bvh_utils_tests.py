@@ -0,0 +1,38 @@
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.sv_bvh_utils import cached_bvh, bvh_find_nearest, bvh_ray_cast
+
+class BVHUtilsTests(SverchokTestCase):
+    verts = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+    faces = [[0, 1, 2, 3]]
+
+    def test_cache(self):
+        bvh = cached_bvh(self.verts, self.faces)
+        self.assertIs(cached_bvh(self.verts, self.faces), bvh)
+        self.assertIs(cached_bvh([list(v) for v in self.verts], [[0, 1, 2, 3]]), bvh)
+        self.assertIsNot(cached_bvh(self.verts, [[3, 2, 1, 0]]), bvh)
+
+    def test_changed_in_place(self):
+        verts = [list(v) for v in self.verts]
+        faces = [list(f) for f in self.faces]
+        bvh = cached_bvh(verts, faces)
+        verts[2][2] = 1
+        moved = cached_bvh(verts, faces)
+        self.assertIsNot(moved, bvh)
+        faces[0].reverse()
+        self.assertIsNot(cached_bvh(verts, faces), moved)
+
+    def test_nearest(self):
+        bvh = cached_bvh(self.verts, self.faces)
+        locations, normals, indices, distances = bvh_find_nearest(bvh, [[0.5, 0.5, 2], [2, 0.5, 0]])
+        self.assert_numpy_arrays_equal(locations, np.array([[0.5, 0.5, 0], [1, 0.5, 0]]), precision=6)
+        self.assertEqual(indices.tolist(), [0, 0])
+        self.assert_numpy_arrays_equal(distances, np.array([2, 1]), precision=6)
+
+    def test_ray_cast(self):
+        bvh = cached_bvh(self.verts, self.faces)
+        success, locations, _, indices, _ = bvh_ray_cast(bvh, [[0.5, 0.5, 1], [2, 2, 1]], [0, 0, -1])
+        self.assertEqual(success.tolist(), [True, False])
+        self.assertEqual(indices.tolist(), [0, -1])
+        self.assert_numpy_arrays_equal(locations[0], np.array([0.5, 0.5, 0]), precision=6)
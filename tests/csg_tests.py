@@ -0,0 +1,51 @@
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.csg_numpy import NumpyCSG, winding_numbers
+from sverchok.utils.csg_benchmark import box, uv_sphere
+
+def mesh_volume(verts, faces):
+    verts = np.array(verts)
+    volume = 0.0
+    for face in faces:
+        for i in range(1, len(face) - 1):
+            volume += np.dot(verts[face[0]], np.cross(verts[face[i]], verts[face[i + 1]]))
+    return volume / 6.0
+
+class NumpyCSGTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.box_a = NumpyCSG.Obj_from_pydata(*box(1.0))
+        self.box_b = NumpyCSG.Obj_from_pydata(*box(1.0, (0.5, 0.25, 0.25)))
+
+    def test_union(self):
+        verts, faces = self.box_a.union(self.box_b).to_pydata()
+        self.assertAlmostEqual(mesh_volume(verts, faces), 1.0 + 1.0 - 0.5 * 0.75 * 0.75)
+
+    def test_subtract(self):
+        verts, faces = self.box_a.subtract(self.box_b).to_pydata()
+        self.assertAlmostEqual(mesh_volume(verts, faces), 1.0 - 0.5 * 0.75 * 0.75)
+
+    def test_intersect(self):
+        verts, faces = self.box_a.intersect(self.box_b).to_pydata()
+        self.assertAlmostEqual(mesh_volume(verts, faces), 0.5 * 0.75 * 0.75)
+
+    def test_coplanar_union(self):
+        touching = NumpyCSG.Obj_from_pydata(*box(1.0, (1.0, 0, 0)))
+        verts, faces = self.box_a.union(touching).to_pydata()
+        self.assertAlmostEqual(mesh_volume(verts, faces), 2.0)
+
+    def test_sphere_subtract(self):
+        verts, faces = uv_sphere(0.6, 16, 8, (0.5, 0.5, 0.5))
+        sphere = NumpyCSG.Obj_from_pydata(verts, faces)
+        sphere_volume = mesh_volume(verts, faces)
+        inside = mesh_volume(*self.box_a.intersect(sphere).to_pydata())
+        outside = mesh_volume(*self.box_a.subtract(sphere).to_pydata())
+        self.assertAlmostEqual(inside + outside, 1.0)
+        self.assertTrue(0 < inside < sphere_volume)
+
+    def test_winding_numbers(self):
+        points = np.array([[0, 0, 0], [2, 0, 0], [0.4, -0.3, 0.1]])
+        result = winding_numbers(points, self.box_a.tri_points)
+        self.assert_numpy_arrays_equal(result, np.array([1, 0, 1]))
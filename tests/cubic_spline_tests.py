@@ -2,7 +2,7 @@
 import numpy as np 
 from sverchok.utils.testing import *
 from sverchok.utils.logging import debug, info
-from sverchok.utils.geom import CubicSpline
+from sverchok.utils.geom import CubicSpline, CubicSplineBatch
 
 class CubicSplineTests(SverchokTestCase):
     def setUp(self):
@@ -36,3 +36,42 @@ class CubicSplineTests(SverchokTestCase):
                  [ 0.00789736,  0.00663246,  0.0 ]])
         self.assert_numpy_arrays_equal(result, expected_result, precision=8)
 
+    def test_derivative(self):
+        t_in = np.array([0.1, 0.4, 0.5, 0.7])
+        result = self.spline.derivative(t_in)
+        expected_result = self.spline.tangent(t_in, h=1e-6) / 2e-6
+        self.assert_numpy_arrays_equal(result, expected_result, precision=4)
+
+    def test_parallel_transport_frames(self):
+        t_in = np.array([0.7, 0.0, 0.4, 1.0, 0.1])
+        tangents, normals, binormals = self.spline.parallel_transport_frames(t_in)
+        # the spline is flat, so the normal does not turn
+        expected_normals = np.array([[0.0, 0.0, 1.0]] * len(t_in))
+        self.assert_numpy_arrays_equal(normals, expected_normals, precision=8)
+        self.assert_numpy_arrays_equal(binormals, np.cross(tangents, normals), precision=8)
+
+
+class CubicSplineBatchTests(SverchokTestCase):
+    def test_same_as_single(self):
+        curves = [[(-1, -1, 0), (0, 0, 0), (1, 2, 0), (2, 3, 0)],
+                  [(0, 0, 0), (1, 0, 0)],
+                  [(0, 0, 0), (1, 0, 1), (1, 1, 2), (0, 1, 3), (0, 0, 4), (1, 0, 5)]]
+        t_in = np.array([0.0, 0.1, 0.4, 0.5, 0.7, 1.0])
+        for is_cyclic in [False, True]:
+            batch = CubicSplineBatch(curves, metric="DISTANCE", is_cyclic=is_cyclic)
+            points = batch.eval(t_in)
+            tangents = batch.tangent(t_in)
+            for i, vertices in enumerate(curves):
+                if is_cyclic and len(vertices) < 4:
+                    continue
+                spline = CubicSpline(vertices, metric="DISTANCE", is_cyclic=is_cyclic)
+                self.assert_numpy_arrays_equal(points[i], spline.eval(t_in), precision=8)
+                self.assert_numpy_arrays_equal(tangents[i], spline.tangent(t_in), precision=8)
+                curve = np.full(len(t_in), i)
+                self.assert_numpy_arrays_equal(batch.eval(t_in, curve), spline.eval(t_in), precision=8)
+
+    def test_eval_by_length(self):
+        batch = CubicSplineBatch([[(0, 0, 0), (1, 0, 0), (2, 0, 0)]], metric="POINTS")
+        self.assert_numpy_arrays_equal(batch.curve_lengths(), np.array([2.0]), precision=6)
+        points = batch.eval_by_length(np.array([0.0, 0.25, 0.5, 1.0]))
+        self.assert_numpy_arrays_equal(points[0, :, 0], np.array([0.0, 0.5, 1.0, 2.0]), precision=6)
@@ -1,6 +1,8 @@
 
 import unittest
 
+import numpy as np
+
 from sverchok.utils.logging import error
 from sverchok.utils.testing import *
 from sverchok.data_structure import *
@@ -18,6 +20,41 @@ class DataStructureTests(SverchokTestCase):
         expected_output = [[1,2,3,4,5] ,[10,11,10,11,10]]
         self.assertEquals(output, expected_output)
 
+    def test_match_long_repeat_numpy(self):
+        inputs = [np.array([1,2,3,4,5]), np.array([10,11])]
+        output = numpy_match_long_repeat(inputs)
+        self.assert_numpy_arrays_equal(output[1], np.array([10,11,11,11,11]))
+
+    def test_match_arrays_as_lists(self):
+        # list matching functions keep list semantics for arrays
+        inputs = [np.array([1,2,3]), np.array([10,11])]
+        self.assertEquals(match_long_repeat(inputs), [[1,2,3], [10,11,11]])
+        self.assertEquals(match_long_cycle(inputs), [[1,2,3], [10,11,10]])
+        self.assertEquals(match_short(inputs), [[1,2], [10,11]])
+        self.assertEquals([list(item) for item in zip_long_repeat(*inputs)], [[1,10], [2,11], [3,11]])
+
+    def test_match_mixed(self):
+        inputs = [[1,2,3], np.array([10,11])]
+        self.assertEquals(match_long_repeat(inputs), [[1,2,3], [10,11,11]])
+        self.assertEquals(match_long_cycle(inputs), [[1,2,3], [10,11,10]])
+        self.assertEquals(match_short(inputs), [[1,2], [10,11]])
+
+    def test_match_empty(self):
+        for inputs in [[np.array([1,2]), np.array([])], [[1,2], np.array([])], [[1,2], []]]:
+            self.assertEquals(match_long_repeat(inputs), [])
+            self.assertEquals(match_long_cycle(inputs), [])
+            self.assertEquals(match_short(inputs), [])
+
+    def test_numpy_match_empty(self):
+        inputs = [np.array([1,2]), np.array([])]
+        for match in [numpy_match_long_repeat, numpy_match_long_cycle, numpy_match_short]:
+            output = match(inputs)
+            self.assertEquals([len(array) for array in output], [0, 0])
+
+    def test_levels_of_list_numpy(self):
+        self.assertEquals(levelsOflist([np.zeros((5, 3))]), 3)
+        self.assertEquals(levelsOflist([[(1, 2, 3)]]), 3)
+
     def test_full_list_1(self):
         data = [1,2,3]
         fullList(data, 7)
@@ -0,0 +1,25 @@
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.voronoi import Site, computeDelaunayTriangulation
+from sverchok.nodes.modifier_make.delaunay_2d import delaunay_2d_faces
+
+class Delaunay2DTests(SverchokTestCase):
+    def signed_areas(self, verts, faces):
+        a, b, c = (np.array(verts)[np.array(faces)[:, i], :2] for i in range(3))
+        ab, ac = b - a, c - a
+        return ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]
+
+    def test_clockwise(self):
+        verts = [(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0), (1, 0.8, 0)]
+        faces = delaunay_2d_faces(verts)
+        self.assertEqual(len(faces), 4)
+        self.assertTrue(np.all(self.signed_areas(verts, faces) < 0))
+
+    def test_same_as_fortune(self):
+        verts = np.random.RandomState(3).uniform(0, 10, (200, 3)).tolist()
+        old = [tri for tri in computeDelaunayTriangulation([Site(v[0], v[1]) for v in verts]) if -1 not in tri]
+        # compare triangles with the same winding, starting from the smallest index
+        canonical = lambda faces: sorted(tuple(np.roll(face, -int(np.argmin(face))).tolist()) for face in faces)
+        self.assertEqual(canonical(delaunay_2d_faces(verts)), canonical(old))
@@ -0,0 +1,43 @@
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.modules.eval_formula import compile_formula, evaluate_formulas, safe_eval
+
+class FormulaTests(SverchokTestCase):
+    def assert_same_as_safe_eval(self, string, variables):
+        formula = compile_formula(string)
+        count = max(len(values) for values in variables.values())
+        expected = [safe_eval(string, {name: values[min(i, len(values) - 1)] for name, values in variables.items()})
+                    for i in range(count)]
+        result = formula.evaluate(variables)
+        if isinstance(result, np.ndarray):
+            result = result.tolist()
+        self.assertEqual(len(result), len(expected))
+        for value, expected_value in zip(result, expected):
+            self.assertEqual(type(value), type(expected_value))
+            self.assertAlmostEqual(value, expected_value, places=12)
+
+    def test_vectorized(self):
+        variables = dict(x=[-1.5, 0.25, 2.0], y=[1.0, 3.0], n=[1, 2, 7])
+        for string in ["x + y", "sin(x) * cos(y) / y", "floor(x) + n", "n ** 3 // 2", "log(y, 2)", "x > y"]:
+            self.assertTrue(compile_formula(string).vectorizable)
+            self.assert_same_as_safe_eval(string, variables)
+
+    def test_fallback(self):
+        variables = dict(x=[-1.5, 0.25, 2.0], n=[1, 2, 7])
+        for string in ["x if x > 0 else -x", "factorial(n)"]:
+            self.assertFalse(compile_formula(string).vectorizable)
+            self.assert_same_as_safe_eval(string, variables)
+        # does not fit in int64, evaluated with python integers
+        self.assert_same_as_safe_eval("n ** 40", variables)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            compile_formula("sqrt(x)").evaluate(dict(x=[1.0, -1.0]))
+
+    def test_components(self):
+        variables = dict(x=np.array([0.0, 1.0, 2.0]), i=np.arange(3), I=[1])
+        result = evaluate_formulas(("x", "x * i + I", "1"), variables)
+        self.assert_numpy_arrays_equal(result, np.array([[0.0, 1.0, 1.0], [1.0, 2.0, 1.0], [2.0, 5.0, 1.0]]))
+        result = evaluate_formulas(("x", "x if i else -1"), variables)
+        self.assertEqual(result, [(0.0, -1), (1.0, 1.0), (2.0, 2.0)])
@@ -0,0 +1,23 @@
+from sverchok.utils.testing import *
+from sverchok.utils.sv_KDT_utils import cached_kdt, kdt_closest_verts_find_n
+
+class KDTCacheTests(SverchokTestCase):
+    def test_reuse(self):
+        verts = [[0, 0, 0], [1, 0, 0], [0, 2, 0]]
+        kd = cached_kdt(verts)
+        self.assertIs(cached_kdt([list(v) for v in verts]), kd)
+        self.assertIsNot(cached_kdt([[0, 0, 0], [1, 0, 0], [0, 3, 0]]), kd)
+
+    def test_changed_in_place(self):
+        verts = [[0, 0, 0], [1, 0, 0], [0, 2, 0]]
+        kd = cached_kdt(verts)
+        verts[1][0] = 5
+        changed = cached_kdt(verts)
+        self.assertIsNot(changed, kd)
+        _, index, _ = changed.find((4, 0, 0))
+        self.assertEqual(index, 1)
+
+    def test_find_n(self):
+        out = []
+        kdt_closest_verts_find_n([[0, 0, 0], [1, 0, 0], [0, 2, 0]], [[0.9, 0, 0]], [2], out)
+        self.assertEqual([index for _, index, _ in out[0]], [1, 0])
@@ -2,7 +2,7 @@
 import numpy as np 
 from sverchok.utils.testing import *
 from sverchok.utils.logging import debug, info
-from sverchok.utils.geom import LinearSpline
+from sverchok.utils.geom import LinearSpline, LinearSplineBatch
 
 class LinearSplineTests(SverchokTestCase):
     def setUp(self):
@@ -36,3 +36,36 @@ class LinearSplineTests(SverchokTestCase):
                  [-1, -1,  0]])
         self.assert_numpy_arrays_equal(result, expected_result)
 
+    def test_tangent_cyclic(self):
+        spline = LinearSpline([(0, 0, 0), (1, 0, 0), (1, 1, 0)], metric="POINTS", is_cyclic=True)
+        t_in = np.array([0.0, 0.2, 0.5, 0.9, 1.0])
+        result = spline.tangent(t_in)
+        expected_result = np.array(
+                [[-1,  0,  0],
+                 [-1,  0,  0],
+                 [ 0, -1,  0],
+                 [ 1,  1,  0],
+                 [ 1,  1,  0]])
+        self.assert_numpy_arrays_equal(result, expected_result)
+
+    def test_parallel_transport_frames(self):
+        spline = LinearSpline([(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1)], metric="POINTS")
+        t_in = np.array([0.1, 0.5, 0.9])
+        tangents, normals, binormals = spline.parallel_transport_frames(t_in, normal=(0, 1, 0))
+        expected_tangents = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        expected_normals = np.array([[0, 1, 0], [-1, 0, 0], [-1, 0, 0]])
+        self.assert_numpy_arrays_equal(tangents, expected_tangents, precision=8)
+        self.assert_numpy_arrays_equal(normals, expected_normals, precision=8)
+
+
+class LinearSplineBatchTests(SverchokTestCase):
+    def test_same_as_single(self):
+        curves = [[(-1, -1, 0), (0, 0, 0), (1, 2, 0), (2, 3, 0)],
+                  [(0, 0, 0), (1, 0, 0)]]
+        t_in = np.array([-0.5, 0.0, 0.1, 0.4, 0.5, 0.7, 1.0, 1.5])
+        for is_cyclic in [False, True]:
+            batch = LinearSplineBatch(curves, metric="DISTANCE", is_cyclic=is_cyclic)
+            points = batch.eval(t_in)
+            for i, vertices in enumerate(curves):
+                spline = LinearSpline(vertices, metric="DISTANCE", is_cyclic=is_cyclic)
+                self.assert_numpy_arrays_equal(points[i], spline.eval(t_in), precision=8)
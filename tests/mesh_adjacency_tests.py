@@ -0,0 +1,42 @@
+
+from sverchok.utils.testing import *
+from sverchok.utils.modules.mesh_adjacency import MeshAdjacency, adjacency_index
+from sverchok.utils.modules.edge_utils import adjacent_faces, adjacent_faces_number
+
+class MeshAdjacencyTests(SverchokTestCase):
+    # 2x2 grid of quads
+    faces = [[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 7]]
+
+    def test_edge_neighbours(self):
+        index = MeshAdjacency(self.faces)
+        self.assertEqual(len(index.edges), 12)
+        self.assertEqual(index.edge_neighbours().tolist(), [[1, 2], [3, 0], [0, 3], [1, 2]])
+
+    def test_vert_neighbours(self):
+        index = MeshAdjacency(self.faces)
+        self.assertEqual(index.vert_neighbours().tolist(), [[1, 2, 3], [0, 3, 2], [0, 1, 3], [0, 1, 2]])
+
+    def test_find_edges(self):
+        index = MeshAdjacency(self.faces)
+        found = index.find_edges([[4, 1], [0, 8], [4, 100]])
+        self.assertEqual(index.edge_items(found).tolist(), [[0, 1], [], []])
+
+    def test_no_faces(self):
+        index = MeshAdjacency([])
+        self.assertEqual(index.edge_items(index.find_edges([[0, 1], [1, 2]])).tolist(), [[], []])
+        self.assertEqual(adjacent_faces_number([[0, 1]], []), [0])
+        self.assertEqual(adjacent_faces([[0, 1]], []), [[]])
+
+    def test_vert_items(self):
+        index = MeshAdjacency(self.faces)
+        self.assertEqual(index.vert_items(10).lengths.tolist(), [1, 2, 1, 2, 4, 2, 1, 2, 1, 0])
+
+    def test_cache(self):
+        faces = [list(face) for face in self.faces]
+        index = adjacency_index(faces)
+        self.assertIs(adjacency_index([list(face) for face in self.faces]), index)
+        faces[0][2] = 3
+        faces[2][1] = 0
+        changed = adjacency_index(faces)
+        self.assertIsNot(changed, index)
+        self.assertEqual(changed.vert_items(9).lengths.tolist(), [2, 2, 1, 3, 2, 2, 1, 2, 1])
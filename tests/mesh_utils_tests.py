@@ -0,0 +1,86 @@
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.sv_mesh_utils import (
+    remove_doubles_numpy, rewire_mesh_indices, mesh_join_np,
+    item_pairs, mesh_components, hop_distances)
+from sverchok.utils.spatial_hash import neighbour_pairs
+
+class RemoveDoublesTests(SverchokTestCase):
+    def test_exact(self):
+        verts = [[0, 0, 0], [1, 0, 0], [0, 0, 0], [-0.0, 1, 0], [1, 0, 0], [0, 1, 0]]
+        new_verts, index = remove_doubles_numpy(verts)
+        self.assertEqual(new_verts.tolist(), [[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+        self.assertEqual(index.tolist(), [0, 1, 0, 2, 1, 2])
+
+    def test_tolerance(self):
+        verts = [[0, 0, 0], [0.05, 0, 0], [0.12, 0, 0], [1, 1, 1], [1, 1, 1.01]]
+        new_verts, index = remove_doubles_numpy(verts, 0.1)
+        self.assertEqual(new_verts.tolist(), [[0, 0, 0], [1, 1, 1]])
+        self.assertEqual(index.tolist(), [0, 0, 0, 1, 1])
+
+    def test_tolerance_order(self):
+        verts = [[2, 0, 0], [0, 0, 0], [2.05, 0, 0], [0, 0.05, 0]]
+        new_verts, index = remove_doubles_numpy(verts, 0.1)
+        self.assertEqual(new_verts.tolist(), [[2, 0, 0], [0, 0, 0]])
+        self.assertEqual(index.tolist(), [0, 1, 0, 1])
+
+    def test_numbers(self):
+        new_verts, index = remove_doubles_numpy([3, 1, 3, 2, 1.05])
+        self.assertEqual(new_verts.tolist(), [3, 1, 2, 1.05])
+        self.assertEqual(index.tolist(), [0, 1, 0, 2, 3])
+        new_verts, index = remove_doubles_numpy([3, 1, 3, 2, 1.05], 0.1)
+        self.assertEqual(new_verts.tolist(), [3, 1, 2])
+        self.assertEqual(index.tolist(), [0, 1, 0, 2, 1])
+
+    def test_rows_2d(self):
+        verts = [[0, 0], [1, 0], [0, 0.01], [1, 0]]
+        new_verts, index = remove_doubles_numpy(verts)
+        self.assertEqual(new_verts.tolist(), [[0, 0], [1, 0], [0, 0.01]])
+        self.assertEqual(index.tolist(), [0, 1, 2, 1])
+        new_verts, index = remove_doubles_numpy(verts, 0.1)
+        self.assertEqual(new_verts.tolist(), [[0, 0], [1, 0]])
+        self.assertEqual(index.tolist(), [0, 1, 0, 1])
+
+    def test_neighbour_pairs(self):
+        for dimensions in (1, 2, 3):
+            verts = np.random.RandomState(dimensions).uniform(-1, 1, (200, dimensions))
+            pairs = neighbour_pairs(verts, 0.2)
+            found = {(min(i, j), max(i, j)) for i, j in pairs.tolist()}
+            self.assertEqual(len(found), len(pairs))
+            distances = np.linalg.norm(verts[:, np.newaxis] - verts[np.newaxis], axis=-1)
+            close = {(i, j) for i, j in zip(*np.nonzero(distances < 0.2)) if i < j}
+            self.assertTrue(close <= found)
+
+    def test_rewire(self):
+        edges, faces = rewire_mesh_indices([0, 0, 1, 2], [[0, 1], [1, 2], [2, 3], [3, 2]], [[0, 1, 2], [1, 2, 3]])
+        self.assertEqual(edges, [[0, 1], [1, 2]])
+        self.assertEqual(faces, [[0, 1, 2]])
+
+class MeshJoinTests(SverchokTestCase):
+    def test_join(self):
+        verts = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+        faces = [[0, 1, 2]]
+        new_verts, edges, new_faces = mesh_join_np([verts, verts], [[[0, 1]], [[1, 2]]], [faces, faces])
+        self.assertEqual(new_verts.shape, (6, 3))
+        self.assertEqual(edges.tolist(), [[0, 1], [4, 5]])
+        self.assertEqual(new_faces.tolist(), [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(new_faces.offsets.tolist(), [0, 3, 6])
+
+    def test_join_mixed(self):
+        verts = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]]
+        _, edges, faces = mesh_join_np([verts, verts], [], [[[0, 1, 3, 2]], np.array([[0, 1, 2]])])
+        self.assertEqual(len(edges), 0)
+        self.assertEqual(faces.tolist(), [[0, 1, 3, 2], [4, 5, 6]])
+
+class MeshComponentsTests(SverchokTestCase):
+    def test_components(self):
+        pairs = item_pairs([[4, 2], [0, 5, 1], [2, 6]])
+        labels = mesh_components(8, pairs)
+        self.assertEqual(labels.tolist(), [0, 0, 2, 3, 2, 0, 2, 7])
+
+    def test_hop_distances(self):
+        edges = [[0, 1], [1, 2], [2, 3], [5, 6]]
+        self.assertEqual(hop_distances(7, edges, [0]).tolist(), [0, 1, 2, 3, -1, -1, -1])
+        self.assertEqual(hop_distances(7, edges, [1, 6], max_distance=1).tolist(), [1, 0, 1, -1, -1, 1, 0])
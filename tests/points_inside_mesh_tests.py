@@ -0,0 +1,37 @@
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.points_inside_mesh import mesh_triangles, is_closed, points_inside_mesh
+from sverchok.utils.ragged_array import RaggedArray
+
+class PointsInsideMeshTests(SverchokTestCase):
+    verts = [[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+    faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+
+    def lattice(self):
+        coords = np.linspace(-0.5, 1.5, 11)
+        points = np.stack(np.meshgrid(coords, coords, coords), axis=-1).reshape((-1, 3))
+        inside = np.all((points > 0) & (points < 1), axis=1)
+        on_surface = np.any(np.isclose(points, 0) | np.isclose(points, 1), axis=1) & np.all((points >= 0) & (points <= 1), axis=1)
+        return points, inside, on_surface
+
+    def test_triangles(self):
+        self.assertEqual(mesh_triangles([[0, 1, 2, 3], [3, 4, 5]]).tolist(), [[0, 1, 2], [0, 2, 3], [3, 4, 5]])
+        self.assertEqual(mesh_triangles(RaggedArray.from_list([[0, 1, 2, 3], [3, 4, 5]])).tolist(),
+                         [[0, 1, 2], [0, 2, 3], [3, 4, 5]])
+        self.assertTrue(is_closed(self.faces))
+        self.assertTrue(is_closed(RaggedArray.from_list(self.faces)))
+        self.assertFalse(is_closed(self.faces[:5]))
+
+    def test_parity(self):
+        points, inside, on_surface = self.lattice()
+        # rays along the diagonal go through edges and vertices of the cube
+        for directions in ([[1, 1, 1]], [[0, 0, 1], [0.3, -0.5, 0.8], [1, 0.2, 0]]):
+            mask = points_inside_mesh(self.verts, self.faces, points, directions=directions, method='PARITY')
+            self.assertTrue(np.array_equal(mask[~on_surface], inside[~on_surface]))
+
+    def test_winding(self):
+        points, inside, on_surface = self.lattice()
+        # the cube without one face is not closed, AUTO falls back to winding number
+        mask = points_inside_mesh(self.verts, self.faces[:5], points)
+        self.assertTrue(np.array_equal(mask[~on_surface], inside[~on_surface]))
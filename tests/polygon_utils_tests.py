@@ -0,0 +1,86 @@
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.modules.polygon_utils import (
+    areas_from_polygons, pols_perimeters, pols_normals, pols_center, pols_by_sides)
+
+class PolygonUtilsTests(SverchokTestCase):
+    verts = [
+        # right triangle with legs 4 and 3
+        (0, 0, 0), (4, 0, 0), (0, 3, 0),
+        # unit square in XZ plane
+        (0, 0, 1), (1, 0, 1), (1, 0, 2), (0, 0, 2),
+        # house shaped pentagon
+        (0, 0, 5), (2, 0, 5), (2, 2, 5), (1, 3, 5), (0, 2, 5),
+        # concave L shaped hexagon
+        (0, 0, 9), (2, 0, 9), (2, 1, 9), (1, 1, 9), (1, 2, 9), (0, 2, 9),
+    ]
+    faces = [[0, 1, 2], [3, 4, 5, 6], [7, 8, 9, 10, 11], [12, 13, 14, 15, 16, 17]]
+
+    def test_pols_by_sides(self):
+        groups = pols_by_sides([[0, 1, 2], [3, 4, 5, 6], [2, 1, 0], [7]])
+        self.assertEqual([(sides, idx.tolist(), pols.tolist()) for sides, idx, pols in groups],
+                         [(1, [3], [[7]]), (3, [0, 2], [[0, 1, 2], [2, 1, 0]]), (4, [1], [[3, 4, 5, 6]])])
+
+    def test_areas(self):
+        areas = areas_from_polygons(self.verts, self.faces)
+        self.assert_sverchok_data_equal(areas, [6.0, 1.0, 5.0, 3.0], precision=9)
+
+    def test_areas_sum_numpy(self):
+        areas = areas_from_polygons(self.verts, self.faces, sum_faces=True)
+        self.assert_sverchok_data_equal(areas, [15.0], precision=9)
+        areas = areas_from_polygons(self.verts, self.faces, output_numpy=True)
+        self.assertIsInstance(areas, np.ndarray)
+        self.assert_numpy_arrays_equal(areas, np.array([6.0, 1.0, 5.0, 3.0]), precision=9)
+
+    def test_areas_few_sides(self):
+        areas = areas_from_polygons(self.verts, [[0], [0, 1], [0, 1, 2], []])
+        self.assert_sverchok_data_equal(areas, [0.0, 0.0, 6.0, 0.0], precision=9)
+        centers = pols_center(self.verts, [[1], [0, 1], []], 'Median Center')
+        self.assert_sverchok_data_equal(centers, [(4, 0, 0), (2, 0, 0), (0, 0, 0)], precision=9)
+
+    def test_areas_degenerate(self):
+        verts = [(0, 0, 0), (1, 1, 1), (2, 2, 2), (3, 3, 3), (5, 5, 5)]
+        areas = areas_from_polygons(verts, [[0, 1, 2], [0, 1, 2, 3], [0, 1, 2, 3, 4], [1, 1, 1]])
+        self.assert_sverchok_data_equal(areas, [0.0, 0.0, 0.0, 0.0], precision=9)
+
+    def test_areas_non_planar(self):
+        # n-gons get the length of the Newell vector (0, -1, 4): the area projected
+        # to the plane of the average normal, not the area of a tessellated surface
+        verts = [(0, 0, 0), (2, 0, 0), (2, 2, 1), (1, 2, 0), (0, 2, 1)]
+        areas = areas_from_polygons(verts, [[0, 1, 2, 3, 4]])
+        self.assert_sverchok_data_equal(areas, [np.sqrt(17)], precision=9)
+
+    def test_perimeters(self):
+        perimeters = pols_perimeters(self.verts, self.faces + [[0, 1]], output_numpy=True)
+        house = 6 + 2 * np.sqrt(2)
+        self.assert_numpy_arrays_equal(perimeters, np.array([12.0, 4.0, house, 8.0, 8.0]), precision=9)
+        total = pols_perimeters(self.verts, self.faces, sum_perimeters=True)
+        self.assert_sverchok_data_equal(total, [24.0 + house], precision=9)
+
+    def test_normals(self):
+        normals = pols_normals(self.verts, self.faces, output_numpy=True)
+        expected = np.array([[0, 0, 1], [0, -1, 0], [0, 0, 1], [0, 0, 1]], dtype=np.float64)
+        self.assert_numpy_arrays_equal(normals, expected, precision=9)
+
+    def test_normals_degenerate(self):
+        verts = [(0, 0, 0), (1, 1, 1), (2, 2, 2)]
+        normals = pols_normals(verts, [[0, 1, 2], [0, 1], [2]])
+        self.assertEqual(normals, [[0, 0, 0], [0, 0, 0], [0, 0, 0]])
+
+    def test_centers(self):
+        centers = pols_center(self.verts, self.faces[2:], 'Median Center')
+        self.assert_sverchok_data_equal(centers, [(1.0, 1.4, 5.0), (1.0, 1.0, 9.0)], precision=9)
+        centers = pols_center(self.verts, self.faces[2:], 'Bounds Center')
+        self.assert_sverchok_data_equal(centers, [(1.0, 1.5, 5.0), (1.0, 1.0, 9.0)], precision=9)
+        centers = pols_center(self.verts, self.faces[:2], 'First Vertex')
+        self.assert_sverchok_data_equal(centers, [(0.0, 0.0, 0.0), (0.0, 0.0, 1.0)], precision=9)
+        centers = pols_center(self.verts, self.faces[:2], 'Last Vertex')
+        self.assert_sverchok_data_equal(centers, [(0.0, 3.0, 0.0), (0.0, 0.0, 2.0)], precision=9)
+
+    def test_center_median_weighted(self):
+        # corners are weighted by the sum of their two edges: 3 + 4, 4 + 5, 5 + 3
+        verts = [(0, 0, 0), (4, 0, 0), (0, 3, 0), (1, 1, 1)]
+        centers = pols_center(verts, [[0, 1, 2], [3, 3, 3]], 'Median Weighted Center', output_numpy=True)
+        self.assert_numpy_arrays_equal(centers, np.array([[1.5, 1.0, 0.0], [1.0, 1.0, 1.0]]), precision=9)
@@ -0,0 +1,77 @@
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.ragged_array import (
+    RaggedArray, ragged_to_lists, ragged_match,
+    ragged_match_long_repeat, ragged_match_long_cycle,
+    ragged_match_short, ragged_match_cross)
+
+class RaggedArrayTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.faces = [[0, 1, 2], [0, 2, 3, 4], [5, 6]]
+        self.array = RaggedArray.from_list(self.faces)
+
+    def test_from_list(self):
+        self.assert_numpy_arrays_equal(self.array.offsets, np.array([0, 3, 7, 9]))
+        self.assert_numpy_arrays_equal(self.array.lengths, np.array([3, 4, 2]))
+        self.assertEqual(len(self.array), 3)
+
+    def test_tolist(self):
+        self.assertEqual(self.array.tolist(), self.faces)
+
+    def test_getitem(self):
+        self.assert_numpy_arrays_equal(self.array[1], np.array([0, 2, 3, 4]))
+        self.assert_numpy_arrays_equal(self.array[-1], np.array([5, 6]))
+        self.assertEqual(self.array[1:].tolist(), self.faces[1:])
+
+    def test_take(self):
+        self.assertEqual(self.array.take([2, 0]).tolist(), [[5, 6], [0, 1, 2]])
+
+    def test_shift(self):
+        self.assertEqual((self.array + 10).tolist(), [[10, 11, 12], [10, 12, 13, 14], [15, 16]])
+
+    def test_concatenate(self):
+        result = RaggedArray.concatenate([self.array, self.array])
+        self.assertEqual(result.tolist(), self.faces + self.faces)
+
+    def test_regular(self):
+        tris = RaggedArray.from_array(np.array([[0, 1, 2], [2, 3, 0]]))
+        self.assertTrue(tris.is_regular())
+        self.assertFalse(self.array.is_regular())
+        self.assert_numpy_arrays_equal(tris.to_array(), np.array([[0, 1, 2], [2, 3, 0]]))
+
+    def test_ragged_to_lists(self):
+        self.assertEqual(ragged_to_lists([self.array, [[1, 2]]]), [self.faces, [[1, 2]]])
+
+class RaggedMatchTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.inputs = [RaggedArray.from_list([[1, 2, 3], [4], [7, 8]]),
+                       RaggedArray.from_list([[10], [20, 21]])]
+
+    def test_match_long_repeat(self):
+        result = [a.tolist() for a in ragged_match_long_repeat(self.inputs)]
+        expected = [[[1, 2, 3], [4, 4], [7, 8]], [[10, 10, 10], [20, 21], [20, 21]]]
+        self.assertEqual(result, expected)
+
+    def test_match_long_cycle(self):
+        result = [a.tolist() for a in ragged_match_long_cycle(self.inputs)]
+        expected = [[[1, 2, 3], [4, 4], [7, 8]], [[10, 10, 10], [20, 21], [10, 10]]]
+        self.assertEqual(result, expected)
+
+    def test_match_short(self):
+        result = [a.tolist() for a in ragged_match_short(self.inputs)]
+        expected = [[[1], [4]], [[10], [20]]]
+        self.assertEqual(result, expected)
+
+    def test_match_cross(self):
+        inputs = [RaggedArray.from_list([[1, 2]]), RaggedArray.from_list([[5, 6, 7]])]
+        result = [a.tolist() for a in ragged_match_cross(inputs)]
+        expected = [[[1, 1, 1, 2, 2, 2]], [[5, 6, 7, 5, 6, 7]]]
+        self.assertEqual(result, expected)
+
+    def test_match_level_1(self):
+        result = ragged_match([np.array([1, 2, 3]), np.array([4])], "REPEAT", level=1)
+        self.assert_numpy_arrays_equal(result[1], np.array([4, 4, 4]))
@@ -0,0 +1,39 @@
+import numpy as np
+from sverchok.utils.testing import *
+from sverchok.utils.geom import LinearSpline, CubicSpline, Spline2D
+
+class Spline2DTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        self.vertices = [[(i, j, (i - 1.5) ** 2 - 0.3 * j * j) for j in range(4)] for i in range(5)]
+        self.uv = np.array([[0.0, 0.0], [0.1, 0.7], [0.5, 0.5], [0.9, 0.2], [1.0, 1.0], [0.3, 0.7]])
+
+    def test_batch_same_as_single(self):
+        for constructor in [CubicSpline, LinearSpline]:
+            for is_cyclic in [False, True]:
+                spline = Spline2D(self.vertices, u_spline_constructor=constructor,
+                            is_cyclic_u=is_cyclic, is_cyclic_v=is_cyclic)
+                points, normals = spline.points_and_normals(self.uv[:, 0], self.uv[:, 1])
+                expected_points = np.array([spline.eval(u, v) for u, v in self.uv])
+                expected_normals = np.array([spline.normal(u, v) for u, v in self.uv])
+                self.assert_numpy_arrays_equal(points, expected_points, precision=8)
+                self.assert_numpy_arrays_equal(normals, expected_normals, precision=8)
+
+    def test_grid(self):
+        spline = Spline2D(self.vertices, metric="POINTS")
+        us, vs = np.array([0.0, 0.5, 1.0]), np.array([0.25, 0.75])
+        grid = spline.eval_grid(us, vs)
+        self.assertEqual(grid.shape, (2, 3, 3))
+        self.assert_numpy_arrays_equal(grid[1, 2], np.array(spline.eval(1.0, 0.75)), precision=8)
+        # analytic normals are close to numeric ones with small step
+        normals = spline.normals_grid(us, vs, h=None)
+        numeric = spline.normals_grid(us, vs, h=1e-6)
+        self.assert_numpy_arrays_equal(normals, numeric, precision=4)
+
+    def test_cache_is_bounded(self):
+        spline = Spline2D(self.vertices)
+        spline.CACHE_SIZE = 10
+        for i in range(100):
+            spline.eval(0.5, i / 100.0)
+        self.assertEqual(len(spline._eval_cache), 10)
+        self.assertEqual(len(spline._u_splines), 10)
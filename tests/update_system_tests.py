@@ -1,12 +1,141 @@
 
 import collections
+import csv
+import json
+import os
+import tempfile
+import threading
+import tracemalloc
 import unittest
 
+import numpy as np
+
 from sverchok.utils.testing import *
 from sverchok.utils.logging import debug, info
-from sverchok.core.update_system import make_dep_dict, make_update_list
+from sverchok import data_structure
+from sverchok.core import update_system
+from sverchok.utils import node_stats
+from sverchok.core.update_system import make_dep_dict, make_update_list, do_update_general, do_update_threaded
+from sverchok.core.socket_data import SvSetSocket, SvGetSocket, reset_socket_cache, sv_fingerprint
+from sverchok.utils.ragged_array import RaggedArray
 #from sverchok.tests.mocks import *
 
+
+class FakeSocket:
+    def __init__(self, node, name, is_output):
+        self.node = node
+        self.name = name
+        self.is_output = is_output
+        self.socket_id = "{}.{}".format(node.name, name)
+        self.links = []
+
+    @property
+    def id_data(self):
+        return self.node.id_data
+
+    @property
+    def is_linked(self):
+        return bool(self.links)
+
+    @property
+    def other(self):
+        return data_structure.get_other_socket(self)
+
+    def sv_set(self, data):
+        SvSetSocket(self, data)
+
+    def sv_get(self, deepcopy=True):
+        return SvGetSocket(self, deepcopy)
+
+
+class FakeLink:
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+        self.is_valid = True
+        self.is_hidden = False
+
+
+class FakeNode:
+    """
+    Node calling function(node) from process(), with numbered sockets
+    """
+    bl_idname = 'FakeNode'
+
+    def __init__(self, tree, name, function, inputs=0, outputs=1, thread_safe=False):
+        self.id_data = tree
+        self.name = name
+        self.function = function
+        self.sv_thread_safe = thread_safe
+        self.inputs = [FakeSocket(self, str(i), False) for i in range(inputs)]
+        self.outputs = [FakeSocket(self, str(i), True) for i in range(outputs)]
+        self.use_custom_color = False
+        self.color = (0.0, 0.0, 0.0)
+        self.processed = 0
+
+    def process(self):
+        self.processed += 1
+        self.function(self)
+
+
+class FakeNodes(dict):
+    pass
+
+
+class FakeTree(dict):
+    """
+    Just enough of a node tree for the update system; custom properties
+    ("error nodes") are kept as dict items.
+    """
+    bl_idname = 'SverchCustomTreeType'
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.nodes = FakeNodes()
+        self.nodes.id_data = self
+        self.links = []
+
+    def add_node(self, name, function, **kwargs):
+        node = FakeNode(self, name, function, **kwargs)
+        self.nodes[name] = node
+        return node
+
+    def link(self, from_node, to_node, output=0, input=0):
+        link = FakeLink(self.nodes[from_node].outputs[output], self.nodes[to_node].inputs[input])
+        link.from_socket.links.append(link)
+        link.to_socket.links.append(link)
+        self.links.append(link)
+        return link
+
+    def unlink(self, link):
+        link.from_socket.links.remove(link)
+        link.to_socket.links.remove(link)
+        self.links.remove(link)
+
+
+class FakeTreeTestCase(SverchokTestCase):
+    """
+    Tests of the update system on FakeTree, without Blender node trees
+    """
+    settings = {'INCREMENTAL_UPDATE': False, 'CHECK_INPUT_MUTATION': False}
+
+    def setUp(self):
+        super().setUp()
+        self.old_settings = {name: getattr(data_structure, name) for name in self.settings}
+        for name, value in self.settings.items():
+            setattr(data_structure, name, value)
+        self.tree = FakeTree("FakeTree")
+        reset_socket_cache(self.tree)
+
+    def tearDown(self):
+        for name, value in self.old_settings.items():
+            setattr(data_structure, name, value)
+        super().tearDown()
+
+
 class UpdateSystemTests(ReferenceTreeTestCase):
 
     reference_file_name = "complex_1_ref.blend.gz"
@@ -36,3 +165,284 @@ class UpdateSystemTests(ReferenceTreeTestCase):
                 dep_idx = result.index(dep)
                 self.assertTrue(dep_idx < node_idx)
 
+
+
+class FingerprintTests(SverchokTestCase):
+    def test_equal_data(self):
+        data = [[(0.1, 0.2, 0.3), (1.0, 2.0, 3.0)]]
+        self.assertEqual(sv_fingerprint(data), sv_fingerprint([[(0.1, 0.2, 0.3), (1.0, 2.0, 3.0)]]))
+        self.assertNotEqual(sv_fingerprint(data), sv_fingerprint([[(0.1, 0.2, 0.3), (1.0, 2.0, 3.5)]]))
+
+    def test_types_differ(self):
+        fingerprints = [sv_fingerprint(data) for data in
+                        [1, 1.0, True, [[1]], [[1.0]], [[True]], [[(1, 2)]], [[(1.0, 2)]], [[[1, 2]]],
+                         [[(1, 2), (3,)]], [[(1, 2, 3)]], [np.array([1, 2])], [np.array([1.0, 2.0])]]]
+        self.assertEqual(len(set(fingerprints)), len(fingerprints))
+
+    def test_size(self):
+        data = [[(float(i), 0.0, 1.0) for i in range(10000)]]
+        self.assertEqual(len(sv_fingerprint(data)), 20)
+
+    def test_not_fingerprintable(self):
+        self.assertIsNone(sv_fingerprint([[object()]]))
+
+
+class IncrementalUpdateTests(FakeTreeTestCase):
+    settings = {'INCREMENTAL_UPDATE': True, 'CHECK_INPUT_MUTATION': False}
+
+    def make_chain(self, middle):
+        """
+        Source -> Middle -> Sink; Source outputs a new value on each update,
+        middle(value) is what Middle outputs
+        """
+        counter = [0]
+        def source(node):
+            counter[0] += 1
+            node.outputs[0].sv_set([[counter[0]]])
+        self.tree.add_node("Source", source)
+        self.tree.add_node("Middle", lambda node: node.outputs[0].sv_set(middle(node.inputs[0].sv_get()[0][0])), inputs=1)
+        self.tree.add_node("Sink", lambda node: node.inputs[0].sv_get(), inputs=1, outputs=0)
+        self.tree.link("Source", "Middle")
+        self.tree.link("Middle", "Sink")
+        return ["Source", "Middle", "Sink"]
+
+    def test_skip_unchanged(self):
+        update_list = self.make_chain(lambda value: [[value > 100]])
+        nodes = self.tree.nodes
+        do_update_general(update_list, nodes)
+        do_update_general(update_list, nodes, roots={"Source"})
+        self.assertEqual([nodes[name].processed for name in update_list], [2, 2, 1])
+
+    def test_changed_type(self):
+        update_list = self.make_chain(lambda value: [[1] if value == 1 else [1.0]])
+        nodes = self.tree.nodes
+        do_update_general(update_list, nodes)
+        do_update_general(update_list, nodes, roots={"Source"})
+        self.assertEqual(nodes["Sink"].processed, 2)
+
+
+class ThreadedUpdateTests(FakeTreeTestCase):
+    def make_branch(self, prefix, thread_safe, log, fail=None):
+        """
+        Chain of nodes prefix0 -> prefix1 -> prefix2, each appends
+        (name, thread id) to log; node named fail raises an exception
+        """
+        def function(node):
+            log.append((node.name, threading.get_ident()))
+            if node.name == fail:
+                raise ValueError("failed")
+            node.outputs[0].sv_set([[node.name]])
+        names = [prefix + str(i) for i in range(3)]
+        for name, safe in zip(names, thread_safe):
+            self.tree.add_node(name, function, inputs=1, thread_safe=safe)
+        for name, next_name in zip(names, names[1:]):
+            self.tree.link(name, next_name)
+        return names
+
+    def test_thread_safe_in_workers(self):
+        log = []
+        branches = [self.make_branch("A", [True, True, True], log),
+                    self.make_branch("B", [True, False, True], log)]
+        do_update_threaded(branches, self.tree.nodes)
+        threads = dict(log)
+        main = threading.main_thread().ident
+        self.assertEqual(set(threads), {"A0", "A1", "A2", "B0", "B1", "B2"})
+        # nodes which are not thread safe are processed in the main thread
+        self.assertEqual(threads["B1"], main)
+        for name in ["A0", "A1", "A2", "B0", "B2"]:
+            self.assertNotEqual(threads[name], main)
+        # each branch is processed in order
+        for branch in branches:
+            self.assertEqual([name for name, _ in log if name in branch], branch)
+
+    def test_sequential_fallback(self):
+        log = []
+        branches = [self.make_branch("A", [False, False, False], log),
+                    self.make_branch("B", [False, False, False], log)]
+        do_update_threaded(branches, self.tree.nodes)
+        main = threading.main_thread().ident
+        self.assertEqual(len(log), 6)
+        self.assertTrue(all(thread == main for _, thread in log))
+        self.assertEqual(SvGetSocket(self.tree.nodes["B2"].inputs[0]), [["B1"]])
+
+    def test_exception_stops_own_branch(self):
+        log = []
+        branches = [self.make_branch("A", [True, True, True], log, fail="A1"),
+                    self.make_branch("B", [True, False, True], log, fail="B1")]
+        branches.append(self.make_branch("C", [True, False, True], log))
+        do_update_threaded(branches, self.tree.nodes)
+        processed = {name for name, _ in log}
+        self.assertEqual(processed, {"A0", "A1", "B0", "B1", "C0", "C1", "C2"})
+        self.assertIn("A1", self.tree["error nodes"])
+
+
+class SocketDataTests(FakeTreeTestCase):
+    def test_shared_without_check(self):
+        source = np.zeros((3, 3))
+        self.tree.add_node("Source", lambda node: node.outputs[0].sv_set([source]))
+        self.tree.add_node("Pass", lambda node: node.outputs[0].sv_set(node.inputs[0].sv_get(deepcopy=False)), inputs=1)
+        self.tree.link("Source", "Pass")
+
+        do_update_general(["Source", "Pass"], self.tree.nodes)
+        passed = SvGetSocket(self.tree.nodes["Pass"].inputs[0], deepcopy=False)
+        self.assertIs(passed[0], source)
+        self.assertTrue(passed[0].flags.writeable)
+
+    def test_ragged_faces(self):
+        faces = [[0, 1, 2], [2, 3, 4, 5]]
+        self.tree.add_node("Source", lambda node: node.outputs[0].sv_set([RaggedArray.from_list(faces)]))
+        read = {}
+        self.tree.add_node("Lists", lambda node: read.update(lists=node.inputs[0].sv_get()), inputs=1)
+        ragged = self.tree.add_node("Ragged", lambda node: read.update(ragged=node.inputs[0].sv_get(deepcopy=False)), inputs=1)
+        ragged.sv_accepts_ragged = True
+        self.tree.link("Source", "Lists")
+        self.tree.link("Source", "Ragged")
+
+        do_update_general(["Source", "Lists", "Ragged"], self.tree.nodes)
+        self.assertEqual(read['lists'], [faces])
+        self.assertIsInstance(read['ragged'][0], RaggedArray)
+        self.assertEqual(read['ragged'][0].tolist(), faces)
+
+    def test_readonly_pass_through(self):
+        data_structure.CHECK_INPUT_MUTATION = True
+        source = np.zeros((3, 3))
+        self.tree.add_node("Source", lambda node: node.outputs[0].sv_set([source]))
+        # passes read-only views of its input to the output
+        self.tree.add_node("Pass", lambda node: node.outputs[0].sv_set(node.inputs[0].sv_get(deepcopy=False)), inputs=1)
+        def modify(node):
+            data = node.inputs[0].sv_get()
+            data[0][0, 0] = 1.0
+            node.outputs[0].sv_set(data)
+        self.tree.add_node("Modify", modify, inputs=1)
+        self.tree.link("Source", "Pass")
+        self.tree.link("Pass", "Modify")
+
+        do_update_general(["Source", "Pass", "Modify"], self.tree.nodes)
+        self.assertEqual(self.tree.nodes["Modify"].processed, 1)
+        self.assertFalse("error nodes" in self.tree)
+        self.assertEqual(source[0, 0], 0.0)
+        passed = SvGetSocket(self.tree.nodes["Modify"].inputs[0], deepcopy=False)
+        self.assertFalse(passed[0].flags.writeable)
+        with self.assertRaises(ValueError):
+            passed[0][0, 0] = 2.0
+
+
+class NodeStatsTests(FakeTreeTestCase):
+    settings = dict(FakeTreeTestCase.settings, COLLECT_NODE_STATS=True, TRACE_NODE_MEMORY=True)
+
+    def setUp(self):
+        super().setUp()
+        node_stats.reset_stats(self.tree.name)
+        self.tree.add_node("Source", lambda node: node.outputs[0].sv_set([[1, 2, 3], [4, 5]]))
+        self.tree.add_node("Sink", lambda node: node.outputs[0].sv_set([[sum(o)] for o in node.inputs[0].sv_get()]), inputs=1)
+        self.tree.link("Source", "Sink")
+
+    def tearDown(self):
+        node_stats.reset_stats(self.tree.name)
+        node_stats.stop_tracing()
+        super().tearDown()
+
+    def test_records(self):
+        do_update_general(["Source", "Sink"], self.tree.nodes)
+        records = node_stats.get_node_stats(self.tree.name)
+        self.assertEqual([(r["node"], r["bl_idname"], r["output_count"], r["cache_hit"]) for r in records],
+                         [("Source", "FakeNode", 5, False), ("Sink", "FakeNode", 2, False)])
+        for record in records:
+            self.assertEqual(set(record.keys()), set(node_stats.STATS_FIELDS))
+            self.assertGreaterEqual(record["duration"], 0.0)
+            self.assertIsNotNone(record["peak_memory"])
+        summary = node_stats.get_summary(self.tree.name)
+        self.assertEqual(summary[(self.tree.name, "Source")]["updates"], 1)
+        self.assertEqual(summary[(self.tree.name, "Source")]["cache_misses"], 1)
+
+    def test_export(self):
+        do_update_general(["Source", "Sink"], self.tree.nodes)
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "stats.csv")
+            json_path = os.path.join(directory, "stats.json")
+            node_stats.export_csv(csv_path, self.tree.name)
+            node_stats.export_json(json_path, self.tree.name)
+            with open(csv_path, newline='') as f:
+                reader = csv.DictReader(f)
+                self.assertEqual(reader.fieldnames, node_stats.STATS_FIELDS)
+                rows = list(reader)
+            with open(json_path) as f:
+                records = json.load(f)
+        self.assertEqual([(r["node"], r["output_count"], r["cache_hit"]) for r in rows],
+                         [("Source", "5", "False"), ("Sink", "2", "False")])
+        self.assertEqual([(r["node"], r["output_count"], r["cache_hit"]) for r in records],
+                         [("Source", 5, False), ("Sink", 2, False)])
+        self.assertEqual(set(records[0].keys()), set(node_stats.STATS_FIELDS))
+
+    def test_memory_tracing_off(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc was started outside of the test")
+        do_update_general(["Source", "Sink"], self.tree.nodes)
+        self.assertTrue(tracemalloc.is_tracing())
+        data_structure.TRACE_NODE_MEMORY = False
+        do_update_general(["Source", "Sink"], self.tree.nodes)
+        self.assertFalse(tracemalloc.is_tracing())
+        for name in ("Source", "Sink"):
+            records = [r for r in node_stats.get_node_stats(self.tree.name) if r["node"] == name]
+            self.assertEqual([r["peak_memory"] is None for r in records], [False, True])
+
+
+class TreeStructureTests(FakeTreeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.old_cache_size = update_system.STRUCTURE_CACHE_SIZE
+        update_system.structure_cache.clear()
+        update_system.tree_structure_cache.clear()
+        for name in "ABCD":
+            self.tree.add_node(name, lambda node: None, inputs=1)
+        self.tree.link("A", "B")
+        self.cd_link = self.tree.link("C", "D")
+
+    def tearDown(self):
+        update_system.STRUCTURE_CACHE_SIZE = self.old_cache_size
+        update_system.structure_cache.clear()
+        update_system.tree_structure_cache.clear()
+        super().tearDown()
+
+    def update_list_of(self, structure, name):
+        for update_list in structure.update_lists:
+            if name in update_list:
+                return update_list
+
+    def test_undo_redo_reuses_structure(self):
+        first = update_system.update_tree_structure(self.tree)
+        self.tree.unlink(self.cd_link)
+        second = update_system.update_tree_structure(self.tree)
+        self.assertIsNot(second, first)
+        # undo
+        self.cd_link = self.tree.link("C", "D")
+        self.assertIs(update_system.update_tree_structure(self.tree), first)
+        # redo
+        self.tree.unlink(self.cd_link)
+        self.assertIs(update_system.update_tree_structure(self.tree), second)
+
+    def test_unaffected_lists_kept(self):
+        first = update_system.update_tree_structure(self.tree)
+        first.partial_update_lists["A"] = ["A", "B"]
+        first.partial_update_lists["C"] = ["C", "D"]
+        self.tree.unlink(self.cd_link)
+        self.tree.link("D", "C")
+        second = update_system.update_tree_structure(self.tree)
+        self.assertIs(self.update_list_of(second, "A"), self.update_list_of(first, "A"))
+        self.assertEqual(self.update_list_of(second, "C"), ["D", "C"])
+        self.assertIs(second.partial_update_lists["A"], first.partial_update_lists["A"])
+        self.assertNotIn("C", second.partial_update_lists)
+
+    def test_lru_eviction(self):
+        update_system.STRUCTURE_CACHE_SIZE = 2
+        first = update_system.update_tree_structure(self.tree)
+        self.tree.unlink(self.cd_link)
+        second = update_system.update_tree_structure(self.tree)
+        link = self.tree.link("B", "C")
+        update_system.update_tree_structure(self.tree)
+        self.assertEqual(len(update_system.structure_cache), 2)
+        # the most recently used structures are kept, the first one is dropped
+        self.tree.unlink(link)
+        self.assertIs(update_system.update_tree_structure(self.tree), second)
+        self.cd_link = self.tree.link("C", "D")
+        self.assertIsNot(update_system.update_tree_structure(self.tree), first)
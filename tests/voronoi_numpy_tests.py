@@ -0,0 +1,50 @@
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.voronoi_numpy import delaunay_triangulation, circumcenters, Voronoi2D
+
+class DelaunayTests(SverchokTestCase):
+    def test_empty_circumcircles(self):
+        points = np.random.default_rng(3).random((200, 2))
+        triangles, halfedges, hull = delaunay_triangulation(points)
+        self.assertEqual(len(triangles), 2 * len(points) - 2 - len(hull))
+        centers = circumcenters(points, triangles)
+        radii = np.sum((points[triangles[:, 0]] - centers) ** 2, axis=1)
+        distances = np.sum((points[np.newaxis] - centers[:, np.newaxis]) ** 2, axis=2)
+        self.assertTrue(np.all(distances >= radii[:, np.newaxis] * (1 - 1e-9)))
+
+    def test_halfedges(self):
+        points = np.array([[x, y] for x in range(4) for y in range(4)], dtype=np.float64)
+        triangles, halfedges, hull = delaunay_triangulation(points)
+        self.assertEqual(len(triangles), 18)
+        self.assertEqual(len(hull), 12)
+        inner = halfedges != -1
+        self.assert_numpy_arrays_equal(halfedges[halfedges[inner]], np.arange(len(halfedges))[inner])
+
+    def test_collinear(self):
+        triangles, _, _ = delaunay_triangulation(np.array([[0, 0], [1, 1], [2, 2]]))
+        self.assertEqual(len(triangles), 0)
+
+class Voronoi2DTests(SverchokTestCase):
+    def test_square(self):
+        points = np.array([[0, 0], [2, 0], [0, 2], [2, 2]], dtype=np.float64)
+        diagram = Voronoi2D(points)
+        self.assert_numpy_arrays_equal(diagram.vertices, np.array([[1.0, 1.0]]))
+        self.assertEqual(len(diagram.edges), 0)
+        self.assertEqual(len(diagram.ray_starts), 4)
+
+    def test_clip_box(self):
+        points = np.array([[0, 0], [2, 0], [0, 2], [2, 2]], dtype=np.float64)
+        verts, edges = Voronoi2D(points).clip_box(-1, -1, 3, 3)
+        self.assertEqual(len(verts), 5)
+        self.assertEqual(len(edges), 4)
+        verts, edges = Voronoi2D(points).clip_box(-1, -1, 3, 3, draw_bounds=True)
+        self.assertEqual(len(verts), 9)
+        self.assertEqual(len(edges), 12)
+
+    def test_collinear_lines(self):
+        points = np.array([[0, 0], [1, 0], [2, 0]], dtype=np.float64)
+        verts, edges = Voronoi2D(points).clip_box(-1, -1, 3, 1)
+        self.assert_numpy_arrays_equal(np.sort(verts[:, 0]), np.array([0.5, 0.5, 1.5, 1.5]))
+        self.assertEqual(len(edges), 2)
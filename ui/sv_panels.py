@@ -294,6 +294,11 @@ class SV_PT_ToolsMenu(bpy.types.Panel):
                 row.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
                 profile_col.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        if addon.preferences.collect_node_stats:
+            stats_row = layout.row(align=True)
+            stats_row.operator("node.sverchok_node_stats_export", text="Save node stats", icon="FILE_TICK")
+            stats_row.operator("node.sverchok_node_stats_reset", text="", icon="X")
+
     def draw_interaction_template(self, layout):
         col = box.column(align=True)
         row = col.row(align=True)
@@ -121,11 +121,11 @@ def app_handler_ops(append=None, remove=None):
 utils_modules = [
     # non UI tools
     "cad_module", "cad_module_class", "sv_bmesh_utils", "sv_viewer_utils", "sv_curve_utils",
-    "voronoi", "sv_script", "sv_itertools", "script_importhelper", "sv_oldnodes_parser",
-    "csg_core", "csg_geom", "geom", "sv_easing_functions", "sv_text_io_common", "sv_obj_baker",
+    "voronoi", "voronoi_numpy", "sv_script", "sv_itertools", "script_importhelper", "sv_oldnodes_parser",
+    "csg_core", "csg_geom", "csg_numpy", "geom", "sv_easing_functions", "sv_text_io_common", "sv_obj_baker",
     "snlite_utils", "snlite_importhelper", "context_managers", "sv_node_utils", "sv_noise_utils",
     "profile", "logging", "testing", "sv_prefs", "sv_requests", "sv_examples_utils", "sv_shader_sources",
-    "avl_tree",
+    "avl_tree", "ragged_array", "node_stats", "points_inside_mesh",
     # UI text editor ui
     "text_editor_submenu", "text_editor_plugins",
     # UI operators and tools
@@ -0,0 +1,213 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Speed benchmark of node trees shipped in json_examples/.
+
+Each example is imported into a temporary tree and processed several times;
+median total time and median time of each node are recorded. Results can be
+stored as a baseline and later runs compared against it; a run fails if
+total time of any example grew by more than the threshold, if any example
+could not be processed, or if there is no baseline to compare with
+(unless the run is asked to store a new baseline with --save-baseline).
+
+Run from command line (see run_benchmark.sh):
+
+$ blender -b --addons sverchok --python utils/benchmark.py -- --iterations 5
+
+or from python console:
+
+from sverchok.utils.benchmark import run_benchmarks
+results, failures = run_benchmarks(iterations=3)
+"""
+
+import argparse
+import json
+import sys
+import time
+from os.path import basename, join, dirname, exists
+from pathlib import Path
+from statistics import median
+
+import bpy
+
+import sverchok
+from sverchok.core import update_system
+from sverchok.utils.logging import info, error, exception
+from sverchok.utils.sv_IO_panel_tools import import_tree
+from sverchok.utils.sv_examples_utils import examples_paths
+from sverchok.utils.testing import create_node_tree, remove_node_tree
+
+# examples which need .blend data or 3rd party modules
+BENCHMARK_BLACKLIST = [
+    "GreacePencil_injection.json",
+    "pointsONface_gather_lines.json",
+    "Generative_Art_Lsystem.json",
+    "Elfnor_topology_nodes.json",
+    "l-systems.json",
+    "waffle.json"
+]
+
+BENCHMARK_TREE_NAME = "BenchmarkTree"
+
+# node timings below this (in seconds) are noise, they are not compared
+MIN_COMPARED_TIME = 0.001
+
+def get_default_baseline_path():
+    return join(dirname(sverchok.__file__), "tests", "references", "benchmark_baseline.json")
+
+def get_examples(blacklist=BENCHMARK_BLACKLIST):
+    """
+    Paths to json examples, sorted by category and name.
+    """
+    paths = []
+    for category in sorted(examples_paths):
+        for path in sorted(Path(examples_paths[category]).iterdir()):
+            if path.suffix == ".json" and path.name not in blacklist:
+                paths.append(str(path))
+    return paths
+
+def benchmark_tree(ng, iterations):
+    """
+    Process the tree several times.
+    Returns median total time and dict of median time per node.
+    """
+    totals = []
+    node_times = {}
+    update_system.build_update_list(ng)
+    for i in range(iterations):
+        start = time.perf_counter()
+        update_system.process_tree(ng)
+        totals.append(time.perf_counter() - start)
+        for graph in update_system.graphs:
+            for record in graph:
+                node_times.setdefault(record["name"], []).append(record["duration"])
+    return median(totals), {name: median(times) for name, times in node_times.items()}
+
+def benchmark_example(path, iterations):
+    """
+    Import example into temporary tree and benchmark it.
+    """
+    ng = create_node_tree(BENCHMARK_TREE_NAME)
+    try:
+        # do not process the tree while it is being imported
+        ng.sv_process = False
+        import_tree(ng, path)
+        ng.sv_process = True
+        total, nodes = benchmark_tree(ng, iterations)
+        return {"total": total, "nodes": nodes}
+    finally:
+        remove_node_tree(BENCHMARK_TREE_NAME)
+
+def run_benchmarks(iterations=3, paths=None):
+    """
+    Benchmark all examples (or listed ones).
+    Returns dict: example name -> {"total": seconds, "nodes": {node name: seconds}}
+    and list of names of examples which failed.
+    """
+    if paths is None:
+        paths = get_examples()
+    results = {}
+    failures = []
+    for path in paths:
+        name = basename(path)
+        try:
+            results[name] = benchmark_example(path, iterations)
+            info("Benchmark %s: %.4f s", name, results[name]["total"])
+        except Exception as e:
+            exception("Can't benchmark %s: %s", name, e)
+            failures.append(name)
+    return results, failures
+
+def compare_with_baseline(results, baseline, threshold=0.2, min_time=MIN_COMPARED_TIME):
+    """
+    Compare results with baseline results.
+    Returns list of regressions, each as a tuple
+    (example name, node name or None for the total, baseline time, current time);
+    an item is a regression if it got slower by more than threshold (0.2 = 20%).
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        reference = baseline[name]
+        items = [(None, reference["total"], result["total"])]
+        for node_name, node_time in result["nodes"].items():
+            if node_name in reference["nodes"]:
+                items.append((node_name, reference["nodes"][node_name], node_time))
+        for node_name, old_time, new_time in items:
+            if max(old_time, new_time) < min_time:
+                continue
+            if new_time > old_time * (1.0 + threshold):
+                regressions.append((name, node_name, old_time, new_time))
+    return regressions
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+def save_results(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    info("Benchmark results saved to %s", path)
+
+def format_regressions(regressions):
+    lines = []
+    for name, node_name, old_time, new_time in regressions:
+        what = name if node_name is None else "{} / {}".format(name, node_name)
+        lines.append("{}: {:.4f} s -> {:.4f} s ({:+.0%})".format(what, old_time, new_time, new_time / old_time - 1.0))
+    return "\n".join(lines)
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark Sverchok json examples")
+    parser.add_argument("--iterations", type=int, default=3, help="How many times to process each tree")
+    parser.add_argument("--baseline", default=get_default_baseline_path(), help="Path to baseline results")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown, 0.2 means 20%%")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as new baseline")
+    parser.add_argument("--output", help="Path to save results of this run")
+    args = parser.parse_args(argv)
+
+    results, failures = run_benchmarks(args.iterations)
+    if args.output:
+        save_results(args.output, results)
+    return check_results(results, failures, args.baseline, args.threshold, args.save_baseline)
+
+def check_results(results, failures, baseline_path, threshold=0.2, save_baseline=False):
+    """
+    Decide if a benchmark run passes. With save_baseline, results are stored
+    as the new baseline and the run passes; otherwise it fails if any example
+    failed, if there is no baseline, or if any example got slower than
+    the baseline by more than threshold.
+    """
+    if failures:
+        error("Failed examples: %s", ", ".join(failures))
+    if save_baseline:
+        save_results(baseline_path, results)
+        return True
+    if not exists(baseline_path):
+        error("No baseline at %s, run with --save-baseline to create it", baseline_path)
+        return False
+
+    # only totals decide if the run fails, node timings are too noisy
+    regressions = compare_with_baseline(results, load_results(baseline_path), threshold)
+    node_regressions = [r for r in regressions if r[1] is not None]
+    total_regressions = [r for r in regressions if r[1] is None]
+    if node_regressions:
+        info("Slower nodes:\n%s", format_regressions(node_regressions))
+    if total_regressions:
+        error("Performance regressions:\n%s", format_regressions(total_regressions))
+        return False
+    return not failures
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    try:
+        success = main(argv)
+    except Exception as e:
+        exception("Benchmark failed: %s", e)
+        success = False
+    sys.exit(0 if success else 1)
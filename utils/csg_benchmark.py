@@ -0,0 +1,106 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Speed comparison of CSG boolean engines: BSP trees (csg_core)
+and NumPy arrays (csg_numpy), on sphere / box booleans of increasing
+sphere resolution.
+
+Run from command line:
+
+$ blender -b --addons sverchok --python utils/csg_benchmark.py
+
+or from python console:
+
+from sverchok.utils.csg_benchmark import run_csg_benchmark
+results = run_csg_benchmark(resolutions=[8, 16, 32])
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from sverchok.utils.csg_core import CSG
+from sverchok.utils.csg_numpy import NumpyCSG
+from sverchok.utils.logging import info
+
+ENGINES = {
+    "BSP": CSG,
+    "NUMPY": NumpyCSG
+}
+
+# BSP engine takes too long on bigger meshes
+BSP_MAX_FACES = 2048
+
+def uv_sphere(radius, segments, rings, center=(0, 0, 0)):
+    """
+    UV sphere: triangle fans at poles, quads elsewhere.
+    """
+    theta = np.pi * np.arange(1, rings) / rings - np.pi / 2
+    phi = 2 * np.pi * np.arange(segments) / segments
+    theta, phi = np.meshgrid(theta, phi, indexing='ij')
+    ring_verts = np.stack((np.cos(theta) * np.cos(phi), np.cos(theta) * np.sin(phi), np.sin(theta)), axis=-1)
+    verts = np.concatenate(([[0, 0, -1]], ring_verts.reshape((-1, 3)), [[0, 0, 1]])) * radius + center
+    top = len(verts) - 1
+
+    faces = [[0, 1 + (i + 1) % segments, 1 + i] for i in range(segments)]
+    for j in range(rings - 2):
+        for i in range(segments):
+            a = 1 + j * segments + i
+            b = 1 + j * segments + (i + 1) % segments
+            faces.append([a, b, b + segments, a + segments])
+    last = 1 + (rings - 2) * segments
+    faces.extend([last + i, last + (i + 1) % segments, top] for i in range(segments))
+    return verts.tolist(), faces
+
+def box(size, center=(0, 0, 0)):
+    verts = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]) * size / 2 + center
+    faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+    return verts.tolist(), faces
+
+def time_engine(engine, verts_a, faces_a, verts_b, faces_b, operation):
+    """
+    Seconds taken by one boolean operation, building of the engine objects included.
+    """
+    engine_class = ENGINES[engine]
+    start = time.perf_counter()
+    a = engine_class.Obj_from_pydata(verts_a, faces_a)
+    b = engine_class.Obj_from_pydata(verts_b, faces_b)
+    getattr(a, operation)(b)
+    return time.perf_counter() - start
+
+def run_csg_benchmark(resolutions=(8, 16, 32, 64), operations=('union', 'subtract', 'intersect')):
+    """
+    Boolean of a UV sphere (2*n segments, n rings for each n in resolutions)
+    with a box crossing it. Returns list of dicts with
+    resolution, number of sphere faces, operation and time of each engine
+    (None if the engine was skipped).
+    """
+    verts_b, faces_b = box(1.5, (0.5, 0.3, 0.2))
+    results = []
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(10000)
+    try:
+        for resolution in resolutions:
+            verts_a, faces_a = uv_sphere(1.0, 2 * resolution, resolution)
+            for operation in operations:
+                record = {"resolution": resolution, "faces": len(faces_a), "operation": operation}
+                for engine in ENGINES:
+                    if engine == "BSP" and len(faces_a) > BSP_MAX_FACES:
+                        record[engine] = None
+                    else:
+                        record[engine] = time_engine(engine, verts_a, faces_a, verts_b, faces_b, operation)
+                results.append(record)
+                info("CSG %s, %s sphere faces: %s", operation, len(faces_a),
+                     ", ".join("{} {}".format(e, "skipped" if record[e] is None else "%.3f s" % record[e]) for e in ENGINES))
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    return results
+
+if __name__ == "__main__":
+    run_csg_benchmark()
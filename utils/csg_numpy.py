@@ -0,0 +1,426 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Boolean operations on meshes stored as NumPy arrays, without BSP trees.
+
+Instead of building a BSP tree from every polygon (as csg_core does),
+each mesh is cut only where it can touch the other one:
+
+1. Pairs of triangles of both meshes whose bounding boxes overlap are
+   found with a uniform grid (spatial hash).
+2. Triangles having such pairs are split by the planes of the triangles
+   of the other mesh, one plane per round, all fragments of a round
+   being classified and split at once.
+3. Each fragment is then entirely inside, outside or coplanar with the
+   other mesh; this is decided by the winding number (ray crossings)
+   at points slightly in front of and behind the fragment.
+   Polygons which were not split are grouped in connected patches, one
+   winding number test is enough for the whole patch.
+
+Like csg_core, meshes are expected to be closed and made of convex
+polygons; the result has the same T-junctions as the BSP engine output.
+
+usage:
+a = NumpyCSG.Obj_from_pydata(verts_a, faces_a)
+b = NumpyCSG.Obj_from_pydata(verts_b, faces_b)
+verts, faces = a.subtract(b).to_pydata()
+"""
+
+from itertools import chain
+
+import numpy as np
+
+# tolerances, relative to the size of both meshes
+SPLIT_EPSILON = 1e-9
+OFFSET_EPSILON = 1e-6
+WELD_EPSILON = 1e-7
+
+# direction of rays cast to count crossings, chosen to not go through
+# edges of symmetric or axis aligned geometry from its special points
+RAY_DIRECTION = np.array([0.2113249, -0.5477226, 0.8095694])
+
+OUTSIDE, INSIDE, COPLANAR_SAME, COPLANAR_OPPOSITE = range(4)
+
+# operation -> (kept classes of first mesh, kept classes of second mesh, flip second mesh)
+OPERATION_RULES = {
+    'union': ({OUTSIDE, COPLANAR_SAME}, {OUTSIDE}, False),
+    'intersect': ({INSIDE, COPLANAR_SAME}, {INSIDE}, False),
+    'subtract': ({OUTSIDE, COPLANAR_OPPOSITE}, {INSIDE}, True)
+}
+
+
+def triangulate_fan(faces):
+    """
+    Split convex polygons in triangles.
+    Returns triangles (n, 3) array and index of source polygon of each triangle.
+    """
+    tris = []
+    tri_face = []
+    for idx, face in enumerate(faces):
+        for i in range(1, len(face) - 1):
+            tris.append((face[0], face[i], face[i + 1]))
+            tri_face.append(idx)
+    return np.array(tris, dtype=np.int64).reshape((-1, 3)), np.array(tri_face, dtype=np.int64)
+
+
+def _expand_boxes(lo, hi, dims):
+    """
+    Grid cells covered by boxes given as (n, 3) integer cell ranges.
+    Returns box index, cell and cell key of each covered cell.
+    """
+    sizes = hi - lo + 1
+    counts = np.prod(sizes, axis=1)
+    box = np.repeat(np.arange(len(lo)), counts)
+    local = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    sx = sizes[box, 0]
+    sy = sizes[box, 1]
+    cells = lo[box] + np.stack((local % sx, (local // sx) % sy, local // (sx * sy)), axis=-1)
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    return box, cells, keys
+
+
+def overlapping_boxes(min_a, max_a, min_b, max_b, tolerance=0.0):
+    """
+    Find pairs of overlapping axis aligned boxes of two sets, using
+    a uniform grid. Returns (n, 2) array of pairs (index in a, index in b),
+    sorted by index in a.
+    """
+    if len(min_a) == 0 or len(min_b) == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    min_a = min_a - tolerance
+    max_a = max_a + tolerance
+    origin = np.minimum(min_a.min(axis=0), min_b.min(axis=0))
+    extent = np.concatenate((max_a - min_a, max_b - min_b))
+    cell = max(np.mean(np.max(extent, axis=1)), tolerance, 1e-12)
+
+    lo_a = np.floor((min_a - origin) / cell).astype(np.int64)
+    hi_a = np.floor((max_a - origin) / cell).astype(np.int64)
+    lo_b = np.floor((min_b - origin) / cell).astype(np.int64)
+    hi_b = np.floor((max_b - origin) / cell).astype(np.int64)
+    dims = np.maximum(hi_a.max(axis=0), hi_b.max(axis=0)) + 1
+
+    box_a, cells_a, keys_a = _expand_boxes(lo_a, hi_a, dims)
+    box_b, _, keys_b = _expand_boxes(lo_b, hi_b, dims)
+    order = np.argsort(keys_b, kind='stable')
+    keys_b = keys_b[order]
+    box_b = box_b[order]
+
+    start = np.searchsorted(keys_b, keys_a, side='left')
+    counts = np.searchsorted(keys_b, keys_a, side='right') - start
+    local = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    entry = np.repeat(np.arange(len(box_a)), counts)
+    first = box_a[entry]
+    second = box_b[np.repeat(start, counts) + local]
+
+    # boxes sharing several cells are reported only in the first common cell
+    unique = np.all(cells_a[entry] == np.maximum(lo_a[first], lo_b[second]), axis=1)
+    first, second = first[unique], second[unique]
+    overlap = np.all((min_a[first] <= max_b[second]) & (min_b[second] <= max_a[first]), axis=1)
+    first, second = first[overlap], second[overlap]
+    order = np.lexsort((second, first))
+    return np.stack((first[order], second[order]), axis=-1)
+
+
+def winding_numbers(points, triangles):
+    """
+    Winding number of closed mesh (triangles (n, 3, 3) array) around each
+    of points: 1 inside, 0 outside (for outwards facing normals).
+    Signed crossings of a ray from each point are counted, only triangles
+    from the grid column of the point are tested.
+    """
+    result = np.zeros(len(points), dtype=np.int64)
+    if len(triangles) == 0 or len(points) == 0:
+        return result
+    # rotate everything so the rays go along +Z
+    z = RAY_DIRECTION / np.linalg.norm(RAY_DIRECTION)
+    x = np.cross(z, [1.0, 0.0, 0.0])
+    x /= np.linalg.norm(x)
+    rotation = np.array([x, np.cross(z, x), z])
+    points = points @ rotation.T
+    triangles = triangles @ rotation.T
+
+    # triangles are binned by their XY bounds
+    flat_points = points.copy()
+    tri_min = triangles.min(axis=1)
+    tri_max = triangles.max(axis=1)
+    flat_points[:, 2] = tri_min[:, 2] = tri_max[:, 2] = 0
+    pairs = overlapping_boxes(flat_points, flat_points, tri_min, tri_max)
+    point, tri = pairs[:, 0], pairs[:, 1]
+
+    p = points[point]
+    a, b, c = triangles[tri, 0], triangles[tri, 1], triangles[tri, 2]
+    # signed areas of XY projections give barycentric coordinates
+    def area(u, v, w):
+        return (v[:, 0] - u[:, 0]) * (w[:, 1] - u[:, 1]) - (v[:, 1] - u[:, 1]) * (w[:, 0] - u[:, 0])
+    full = area(a, b, c)
+    wa, wb, wc = area(p, b, c), area(a, p, c), area(a, b, p)
+    hit = (full != 0) & (np.sign(wa) == np.sign(full)) & (np.sign(wb) == np.sign(full)) & (np.sign(wc) == np.sign(full))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (wa * a[:, 2] + wb * b[:, 2] + wc * c[:, 2]) / full
+    hit &= z > p[:, 2]
+    np.add.at(result, point[hit], np.sign(full[hit]).astype(np.int64))
+    return result
+
+
+def split_triangles(tris, normals, ws, epsilon):
+    """
+    Split triangles ((n, 3, 3) array) by planes (one per triangle).
+    Returns new triangles and index of source triangle of each of them.
+    """
+    dist = np.einsum('ijk,ik->ij', tris, normals) - ws[:, np.newaxis]
+    side = np.where(dist > epsilon, 1, np.where(dist < -epsilon, -1, 0))
+    # triangles not crossing the plane (coplanar ones too) go to front side as they are
+    spanning = np.any(side > 0, axis=1) & np.any(side < 0, axis=1)
+    side[~spanning] = 1
+
+    # clip each triangle by both half spaces (Sutherland-Hodgman),
+    # every edge gives its start point and maybe an intersection point
+    nxt = [1, 2, 0]
+    dist_next = dist[:, nxt]
+    side_next = side[:, nxt]
+    crossing = side * side_next < 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(crossing, dist / (dist - dist_next), 0.0)
+    cut_points = tris + (tris[:, nxt, :] - tris) * t[:, :, np.newaxis]
+
+    points = np.stack((tris, cut_points), axis=2).reshape((-1, 6, 3))
+    result = []
+    source = []
+    for keep in (side >= 0, side <= 0):
+        valid = np.stack((keep, crossing), axis=2).reshape((-1, 6))
+        count = np.sum(valid, axis=1)
+        # move valid points to the front, keeping their order
+        order = np.argsort(~valid, axis=1, kind='stable')[:, :4]
+        polygon = np.take_along_axis(points, order[:, :, np.newaxis], axis=1)
+        for corners, min_count in (((0, 1, 2), 3), ((0, 2, 3), 4)):
+            mask = count >= min_count
+            result.append(polygon[mask][:, corners, :])
+            source.append(np.nonzero(mask)[0])
+    return np.concatenate(result), np.concatenate(source)
+
+
+def triangle_planes(tris):
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0] = 1
+    normals /= lengths[:, np.newaxis]
+    return normals, np.einsum('ij,ij->i', normals, tris[:, 0])
+
+
+def cut_triangles(tris, pairs, other_tris, epsilon):
+    """
+    Split triangles by planes of triangles of the other mesh they may touch
+    (pairs of overlapping bounding boxes, sorted by triangle index).
+    In each round every fragment is split by its first candidate plane,
+    remaining candidates go to the parts they still overlap.
+    Returns fragments and index of source triangle of each fragment.
+    """
+    other_normals, other_ws = triangle_planes(other_tris)
+    other_min = other_tris.min(axis=1) - epsilon
+    other_max = other_tris.max(axis=1) + epsilon
+
+    fragments = tris
+    source = np.arange(len(tris))
+    pair_frag, pair_other = pairs[:, 0], pairs[:, 1]
+    done = []
+    done_source = []
+    while True:
+        # fragments without candidates left are final
+        has_pairs = np.zeros(len(fragments), dtype=bool)
+        has_pairs[pair_frag] = True
+        done.append(fragments[~has_pairs])
+        done_source.append(source[~has_pairs])
+        if not len(pair_frag):
+            break
+        new_index = np.cumsum(has_pairs) - 1
+        fragments = fragments[has_pairs]
+        source = source[has_pairs]
+        pair_frag = new_index[pair_frag]
+
+        first = np.ones(len(pair_frag), dtype=bool)
+        first[1:] = pair_frag[1:] != pair_frag[:-1]
+        cut_by = pair_other[first]
+        rest_frag, rest_other = pair_frag[~first], pair_other[~first]
+        children, parent = split_triangles(fragments, other_normals[cut_by], other_ws[cut_by], epsilon)
+
+        # remaining candidates of each fragment go to its parts they overlap
+        rest_count = np.bincount(rest_frag, minlength=len(fragments))
+        rest_start = np.cumsum(rest_count) - rest_count
+        counts = rest_count[parent]
+        child = np.repeat(np.arange(len(children)), counts)
+        local = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        other = rest_other[np.repeat(rest_start[parent], counts) + local]
+        overlap = np.all((children.min(axis=1)[child] <= other_max[other]) &
+                         (other_min[other] <= children.max(axis=1)[child]), axis=1)
+        pair_frag, pair_other = child[overlap], other[overlap]
+        fragments = children
+        source = source[parent]
+
+    return np.concatenate(done), np.concatenate(done_source)
+
+
+def classify_points(points, normals, other_tris, offset):
+    """
+    Classify points of a surface with given normals against the other mesh:
+    OUTSIDE, INSIDE, or COPLANAR_SAME / COPLANAR_OPPOSITE if the point lies
+    on a surface of the other mesh facing the same / opposite direction.
+    """
+    inside_front = winding_numbers(points + normals * offset, other_tris) > 0.5
+    inside_back = winding_numbers(points - normals * offset, other_tris) > 0.5
+    result = np.full(len(points), OUTSIDE)
+    result[inside_front & inside_back] = INSIDE
+    result[~inside_front & inside_back] = COPLANAR_SAME
+    result[inside_front & ~inside_back] = COPLANAR_OPPOSITE
+    return result
+
+
+def face_patches(faces, n_verts, mask):
+    """
+    Label connected patches of faces (sharing an edge) among masked faces.
+    """
+    labels = np.arange(len(faces))
+    edges = []
+    edge_face = []
+    for idx, face in enumerate(faces):
+        if mask[idx]:
+            edges.extend(zip(face, face[1:] + face[:1]))
+            edge_face.extend([idx] * len(face))
+    if not edges:
+        return labels
+    edges = np.sort(np.array(edges, dtype=np.int64), axis=1)
+    edge_face = np.array(edge_face, dtype=np.int64)
+    keys = edges[:, 0] * n_verts + edges[:, 1]
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    edge_face = edge_face[order]
+    shared = keys[1:] == keys[:-1]
+    f0, f1 = edge_face[:-1][shared], edge_face[1:][shared]
+
+    # propagate smallest label, with pointer jumping
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, f0, labels[f1])
+        np.minimum.at(new_labels, f1, labels[f0])
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+class NumpyCSG:
+    """
+    Mesh taking part in boolean operations, same API as csg_core.CSG
+    """
+    def __init__(self, verts, faces):
+        self.verts = np.asarray(verts, dtype=np.float64).reshape((-1, 3))
+        self.faces = [list(f) for f in faces if len(f) > 2]
+        self.tris, self.tri_face = triangulate_fan(self.faces)
+        self.tri_points = self.verts[self.tris]
+
+    @classmethod
+    def Obj_from_pydata(cls, verts, faces):
+        return cls(verts, faces)
+
+    def to_pydata(self):
+        return self.verts.tolist(), self.faces
+
+    def union(self, csg):
+        return self._boolean(csg, 'union')
+
+    def subtract(self, csg):
+        return self._boolean(csg, 'subtract')
+
+    def intersect(self, csg):
+        return self._boolean(csg, 'intersect')
+
+    def inverse(self):
+        return NumpyCSG(self.verts, [f[::-1] for f in self.faces])
+
+    def _kept_parts(self, other, pairs, kept_classes, scale):
+        """
+        Faces of this mesh to keep: list of untouched faces and array of
+        fragments (triangles) of the faces touching the other mesh.
+        """
+        other_tris = other.tri_points
+        touched_tris = np.zeros(len(self.tris), dtype=bool)
+        touched_tris[pairs[:, 0]] = True
+        touched_faces = np.zeros(len(self.faces), dtype=bool)
+        touched_faces[self.tri_face[touched_tris]] = True
+
+        # untouched faces: one test per connected patch
+        free = ~touched_faces
+        labels = face_patches(self.faces, len(self.verts), free)
+        first_tri = np.searchsorted(self.tri_face, np.arange(len(self.faces)))
+        patches, representative = np.unique(labels[free], return_index=True)
+        patch_faces = np.nonzero(free)[0][representative]
+        patch_tris = first_tri[patch_faces]
+        centers = self.tri_points[patch_tris].mean(axis=1)
+        inside = winding_numbers(centers, other_tris) > 0.5
+        patch_class = np.where(inside, INSIDE, OUTSIDE)
+        face_class = np.full(len(self.faces), -1)
+        face_class[free] = patch_class[np.searchsorted(patches, labels[free])]
+        faces = [f for f, c in zip(self.faces, face_class) if c in kept_classes]
+
+        # faces touching the other mesh: cut and test each fragment
+        tri_idx = np.nonzero(touched_faces[self.tri_face])[0]
+        tri_map = np.full(len(self.tris), -1)
+        tri_map[tri_idx] = np.arange(len(tri_idx))
+        local_pairs = pairs[touched_faces[self.tri_face[pairs[:, 0]]]].copy()
+        local_pairs[:, 0] = tri_map[local_pairs[:, 0]]
+        fragments, source = cut_triangles(self.tri_points[tri_idx], local_pairs, other_tris, SPLIT_EPSILON * scale)
+
+        normals, _ = triangle_planes(self.tri_points[tri_idx])
+        areas = np.linalg.norm(np.cross(fragments[:, 1] - fragments[:, 0], fragments[:, 2] - fragments[:, 0]), axis=1)
+        fragments = fragments[areas > (SPLIT_EPSILON * scale) ** 2]
+        source = source[areas > (SPLIT_EPSILON * scale) ** 2]
+        fragment_class = classify_points(fragments.mean(axis=1), normals[source], other_tris, OFFSET_EPSILON * scale)
+        kept = np.isin(fragment_class, list(kept_classes))
+        return faces, fragments[kept]
+
+    def _boolean(self, csg, operation):
+        kept_a, kept_b, flip_b = OPERATION_RULES[operation]
+        all_verts = np.concatenate((self.verts, csg.verts))
+        if len(all_verts) == 0:
+            return NumpyCSG([], [])
+        scale = max(np.linalg.norm(all_verts.max(axis=0) - all_verts.min(axis=0)), 1e-12)
+
+        pairs = overlapping_boxes(
+                    self.tri_points.min(axis=1), self.tri_points.max(axis=1),
+                    csg.tri_points.min(axis=1), csg.tri_points.max(axis=1),
+                    SPLIT_EPSILON * scale)
+        faces_a, fragments_a = self._kept_parts(csg, pairs, kept_a, scale)
+        faces_b, fragments_b = csg._kept_parts(self, pairs[:, ::-1][np.argsort(pairs[:, 1], kind='stable')], kept_b, scale)
+        if flip_b:
+            faces_b = [f[::-1] for f in faces_b]
+            fragments_b = fragments_b[:, ::-1, :]
+
+        # join everything and weld vertices
+        n_a = len(self.verts)
+        n_frag = n_a + len(csg.verts)
+        fragments = np.concatenate((fragments_a, fragments_b)).reshape((-1, 3))
+        verts = np.concatenate((all_verts, fragments))
+        faces = faces_a + [[i + n_a for i in f] for f in faces_b]
+        faces.extend(np.arange(n_frag, len(verts)).reshape((-1, 3)).tolist())
+
+        lengths = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=np.sum(lengths))
+        used, flat = np.unique(flat, return_inverse=True)
+        keys = np.round(verts[used] / (WELD_EPSILON * scale)).astype(np.int64)
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        flat = inverse.reshape(-1)[flat.reshape(-1)]
+
+        # faces with merged neighbour vertices are dropped
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        next_idx = np.arange(len(flat)) + 1
+        next_idx[ends - 1] = starts
+        merged = np.zeros(len(faces), dtype=np.int64)
+        np.add.at(merged, np.repeat(np.arange(len(faces)), lengths), flat == flat[next_idx])
+        flat = flat.tolist()
+        new_faces = [flat[start:end] for start, end, m in zip(starts.tolist(), ends.tolist(), merged.tolist()) if m == 0]
+        return NumpyCSG(verts[used][first], new_faces)
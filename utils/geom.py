@@ -28,6 +28,7 @@ only for speed, never for aesthetics or line count or cleverness.
 
 import math
 from math import sin, cos, sqrt
+from collections import OrderedDict
 import numpy as np
 from numpy import linalg
 from functools import wraps
@@ -43,6 +44,7 @@ from mathutils.geometry import interpolate_bezier, intersect_line_line, intersec
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh
 from sverchok.data_structure import match_long_repeat
+from sverchok.utils.ragged_array import RaggedArray
 from sverchok.utils.logging import debug, info
 
 identity_matrix = Matrix()
@@ -447,6 +449,100 @@ grids = vectorize(grid)
 # factored out from interpolation_mk3 node
 ################################################
 
+def _cache_get(cache, key):
+    """
+    Get item of OrderedDict used as LRU cache, marking it as recently used.
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _cache_put(cache, key, value, size):
+    """
+    Put item to OrderedDict used as LRU cache, dropping least recently used
+    items beyond size.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > size:
+        cache.popitem(last=False)
+
+def _normalized(vectors):
+    """
+    Unit vectors along vectors ((n, 3) array), zero vectors are kept.
+    """
+    norms = np.linalg.norm(vectors, axis=1)
+    result = np.zeros(vectors.shape)
+    nonzero = norms > 0
+    result[nonzero] = vectors[nonzero] / norms[nonzero, np.newaxis]
+    return result
+
+def _reflections(vectors):
+    """
+    Householder reflection matrices (n, 3, 3) for each of vectors,
+    identity for zero vectors.
+    """
+    squares = np.sum(vectors * vectors, axis=1)
+    result = np.broadcast_to(np.eye(3), (len(vectors), 3, 3)).copy()
+    nonzero = squares > 1e-24
+    v = vectors[nonzero]
+    result[nonzero] -= 2 * v[:, :, np.newaxis] * v[:, np.newaxis, :] / squares[nonzero, np.newaxis, np.newaxis]
+    return result
+
+def parallel_transport(points, tangents, normal=None):
+    """
+    Normals of rotation minimizing frames along a curve sampled at points
+    (in order along the curve), with unit tangents at these points.
+    The rotation from each point to the next one is calculated by the
+    double reflection method (Wang, Juttler, Zheng, Liu, "Computation of
+    Rotation Minimizing Frames", 2008), and the rotations are accumulated
+    by a parallel prefix product of matrices, so there is no Python loop
+    over points.
+    normal: normal at the first point; by default perpendicular to the
+            first tangent and to the coordinate axis closest to it.
+    returns (n, 3) array of unit normals.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    tangents = np.asarray(tangents, dtype=np.float64)
+    count = len(points)
+    if count == 0:
+        return np.zeros((0, 3))
+    first = tangents[0]
+    if normal is None:
+        normal = np.eye(3)[np.argmin(np.abs(first))]
+    normal = np.asarray(normal, dtype=np.float64)
+    normal = normal - np.dot(normal, first) * first
+
+    # rotation between consecutive points: reflection in the plane normal
+    # to the chord, then in the plane which puts the reflected tangent to the next one
+    first_reflections = _reflections(points[1:] - points[:-1])
+    reflected = np.einsum('nij,nj->ni', first_reflections, tangents[:-1])
+    rotations = _reflections(tangents[1:] - reflected) @ first_reflections
+
+    # rotations[i] becomes the product of all rotations up to the step i
+    step = 1
+    while step < len(rotations):
+        rotations[step:] = rotations[step:] @ rotations[:-step]
+        step *= 2
+
+    normals = np.empty((count, 3))
+    normals[0] = normal
+    normals[1:] = rotations @ normal
+    # remove errors accumulated by the products
+    normals -= np.sum(normals * tangents, axis=1)[:, np.newaxis] * tangents
+    return _normalized(normals)
+
+def frames_to_matrices(tangents, normals, binormals, axes=(2, 0, 1)):
+    """
+    Rotation matrices ((n, 3, 3) array) which turn coordinate axes with
+    indices axes[0], axes[1], axes[2] to tangents, normals and binormals;
+    binormals are flipped if needed for the result to be a rotation.
+    """
+    basis = np.eye(3)[:, list(axes)]
+    frames = np.stack((tangents, normals, binormals * np.linalg.det(basis)), axis=-1)
+    return frames @ basis.T
+
 class Spline(object):
     """
     Base abstract class for LinearSpline and CubicSpline.
@@ -482,10 +578,13 @@ class Spline(object):
 
         return tknots
 
+    # limit of number of items in the cache of eval_at_point
+    CACHE_SIZE = 4096
+
     def __init__(self):
         # Caches
         # t -> vertex
-        self._single_eval_cache = {}
+        self._single_eval_cache = OrderedDict()
 
     def length(self, t_in):
         """
@@ -504,15 +603,59 @@ class Spline(object):
         t: float in [0,1].
         Returns vector in Sverchok format (tuple of floats).
         """
-        result = self._single_eval_cache.get(t, None)
+        result = _cache_get(self._single_eval_cache, t)
         if result is not None:
             return result
         else:
             result = self.eval(np.array([t]))
             result = tuple(result[0])
-            self._single_eval_cache[t] = result
+            _cache_put(self._single_eval_cache, t, result, self.CACHE_SIZE)
             return result
 
+    def unit_tangent(self, t_in):
+        """
+        Unit tangent vectors (normalized derivative) at t_in;
+        zero vectors where the derivative vanishes.
+        """
+        return _normalized(self.derivative(t_in))
+
+    def curvature(self, t_in):
+        """
+        Curvature of the spline at t_in.
+        """
+        d1 = self.derivative(t_in)
+        d2 = self.second_derivative(t_in)
+        speed = np.linalg.norm(d1, axis=1)
+        result = np.zeros(len(speed))
+        moving = speed > 0
+        result[moving] = np.linalg.norm(np.cross(d1[moving], d2[moving]), axis=1) / speed[moving] ** 3
+        return result
+
+    def frenet_frames(self, t_in):
+        """
+        Frenet frames at t_in: arrays of unit tangents, normals and binormals.
+        Normals and binormals are zero where the curvature is zero (for example
+        along linear segments); parallel_transport_frames does not have this problem.
+        """
+        tangents = self.unit_tangent(t_in)
+        binormals = _normalized(np.cross(self.derivative(t_in), self.second_derivative(t_in)))
+        normals = np.cross(binormals, tangents)
+        return tangents, normals, binormals
+
+    def parallel_transport_frames(self, t_in, normal=None):
+        """
+        Rotation minimizing frames at t_in: arrays of unit tangents, normals
+        and binormals. The normal is transported from the smallest of t_in
+        along the spline without twisting, see parallel_transport().
+        normal: normal at the smallest of t_in; by default perpendicular to
+                the tangent and to one of coordinate axes.
+        """
+        t_values, inverse = np.unique(np.asarray(t_in, dtype=np.float64), return_inverse=True)
+        tangents = self.unit_tangent(t_values)
+        normals = parallel_transport(self.eval(t_values), tangents, normal)
+        binormals = np.cross(tangents, normals)
+        return tangents[inverse], normals[inverse], binormals[inverse]
+
 class CubicSpline(Spline):
     def __init__(self, vertices, tknots = None, metric = None, is_cyclic = False):
         """
@@ -627,6 +770,398 @@ class CubicSpline(Spline):
         tanget[t_less_than_0 | t_great_than_1] *= 2
         return tanget
 
+    def _coefficients(self, t_in):
+        index = self.tknots.searchsorted(t_in, side='left') - 1
+        index = index.clip(0, len(self.splines) - 1)
+        return np.swapaxes(self.splines[index], 0, 1)
+
+    def derivative(self, t_in):
+        """
+        Analytic first derivative of the spline by t at t_in
+        """
+        ax, bx, cx, dx, tx = self._coefficients(t_in)
+        t_r = t_in[:, np.newaxis] - tx
+        return bx + t_r * (2 * cx + 3 * t_r * dx)
+
+    def second_derivative(self, t_in):
+        """
+        Analytic second derivative of the spline by t at t_in
+        """
+        ax, bx, cx, dx, tx = self._coefficients(t_in)
+        t_r = t_in[:, np.newaxis] - tx
+        return 2 * cx + 6 * t_r * dx
+
+def _local_index(lengths):
+    """
+    Index of each value of ragged items (given by lengths) within its item.
+    """
+    starts = np.cumsum(lengths) - lengths
+    return np.arange(np.sum(lengths), dtype=np.int64) - np.repeat(starts, lengths)
+
+class _JaggedLayout(object):
+    """
+    Layout of values of ragged items for recurrences along the items:
+    items are sorted by decreasing length and values are grouped by their
+    index within the item, so values number i of all items longer than i
+    form one contiguous block, with items in the same order in each block.
+    For items of the same length this is just a transposition.
+    """
+    def __init__(self, lengths):
+        lengths = np.asarray(lengths, dtype=np.int64)
+        self.lengths = lengths
+        self.regular = len(lengths) == 0 or lengths.min() == lengths.max()
+        max_length = lengths.max() if len(lengths) else 0
+        self.counts = len(lengths) - np.cumsum(np.bincount(lengths, minlength=max_length + 1))[:max_length]
+        self.starts = np.cumsum(self.counts) - self.counts
+        if not self.regular:
+            order = np.argsort(-lengths, kind='stable')
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            self.positions = self.starts[_local_index(lengths)] + np.repeat(rank, lengths)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def block(self, i, count=None):
+        """
+        Slice of values number i of the first count items (all items longer than i by default)
+        """
+        return slice(self.starts[i], self.starts[i] + (self.counts[i] if count is None else count))
+
+    def to_layout(self, values):
+        if self.regular:
+            if len(self.lengths) == 0:
+                return values.copy()
+            shape = (len(self.lengths), self.lengths[0]) + values.shape[1:]
+            return np.ascontiguousarray(values.reshape(shape).swapaxes(0, 1)).reshape(values.shape)
+        result = np.empty_like(values)
+        result[self.positions] = values
+        return result
+
+    def from_layout(self, values):
+        if self.regular:
+            if len(self.lengths) == 0:
+                return values.copy()
+            shape = (self.lengths[0], len(self.lengths)) + values.shape[1:]
+            return np.ascontiguousarray(values.reshape(shape).swapaxes(0, 1)).reshape(values.shape)
+        return values[self.positions]
+
+def _ragged_cumsum(values, lengths):
+    """
+    Cumulative sums of values within each of ragged items.
+    """
+    layout = _JaggedLayout(lengths)
+    jagged = layout.to_layout(values)
+    for i in range(1, len(layout)):
+        jagged[layout.block(i)] += jagged[layout.block(i - 1, layout.counts[i])]
+    return layout.from_layout(jagged)
+
+def _ragged_searchsorted(knots, item, values, side='left'):
+    """
+    np.searchsorted(knots[item[j]], values[j], side) for each j,
+    by bisection of all items at once.
+    knots: RaggedArray with sorted items.
+    """
+    lo = knots.offsets[:-1][item]
+    hi = knots.offsets[1:][item]
+    base = lo
+    for _ in range(int(np.max(hi - lo, initial=0)).bit_length()):
+        mid = (lo + hi) // 2
+        knot = knots.values[np.minimum(mid, len(knots.values) - 1)]
+        less = knot < values if side == 'left' else knot <= values
+        less &= mid < hi
+        lo = np.where(less, mid + 1, lo)
+        hi = np.where(less, hi, mid)
+    return lo - base
+
+class SplineBatch(object):
+    """
+    Base class for CubicSplineBatch and LinearSplineBatch: many splines
+    (one per curve), built and evaluated together.
+
+    Parameters of methods are either one array t_in, evaluated on every
+    curve (results have shape (len(self),) + t_in.shape), or array t_in
+    with array curve of indices of curves, of the same shape (results
+    have the shape of t_in).
+    """
+    @staticmethod
+    def _vertices(vertices):
+        if not isinstance(vertices, RaggedArray):
+            vertices = RaggedArray.from_list(vertices, dtype=np.float64)
+        return np.asarray(vertices.values, dtype=np.float64).reshape((-1, 3)), vertices.lengths, vertices.offsets
+
+    @staticmethod
+    def _given_knots(tknots):
+        if isinstance(tknots, RaggedArray):
+            return np.asarray(tknots.values, dtype=np.float64)
+        return np.concatenate([np.asarray(t, dtype=np.float64) for t in tknots]) if len(tknots) else np.zeros(0)
+
+    def __len__(self):
+        return len(self.knots)
+
+    @classmethod
+    def create_knots(cls, pts, lengths, metric="DISTANCE"):
+        """
+        Knots of all curves at once, as Spline.create_knots does for one curve.
+        pts: (n, 3) array of vertices of all curves, lengths: number of vertices of each curve
+        """
+        local = _local_index(lengths)
+        offsets = np.cumsum(lengths) - lengths
+        first = np.repeat(offsets, lengths)
+        last = np.repeat(offsets + lengths - 1, lengths)
+        if metric in {"X", "Y", "Z"}:
+            tknots = pts[:, "XYZ".index(metric)]
+            tknots = tknots - tknots[first]
+            return tknots / tknots[last]
+        if metric == "POINTS":
+            tknots = local * (1.0 / np.maximum(np.repeat(lengths, lengths) - 1, 1))
+            tknots[local == np.repeat(lengths, lengths) - 1] = 1.0
+            return tknots
+
+        steps = np.zeros_like(pts)
+        steps[1:] = pts[:-1] - pts[1:]
+        steps[local == 0] = 0.0
+        if metric == "DISTANCE":
+            tmp = np.linalg.norm(steps, axis=1)
+        elif metric == "MANHATTAN":
+            tmp = np.sum(np.absolute(steps), 1)
+        elif metric == "CHEBYSHEV":
+            tmp = np.max(np.absolute(steps), 1)
+        else:
+            raise Exception("Unsupported metric: {}".format(metric))
+        tknots = _ragged_cumsum(tmp, lengths)
+        return tknots / tknots[last]
+
+    def _broadcast(self, t_in, curve):
+        t_in = np.asarray(t_in, dtype=np.float64)
+        if curve is None:
+            return np.tile(t_in.ravel(), len(self)), np.repeat(np.arange(len(self)), t_in.size), (len(self),) + t_in.shape
+        t_in, curve = np.broadcast_arrays(t_in, np.asarray(curve, dtype=np.int64))
+        return t_in.ravel(), curve.ravel(), t_in.shape
+
+    def arc_length_table(self, resolution = 50):
+        """
+        Accumulated length of each curve, sampled at resolution points per segment.
+        Returns RaggedArray of parameter values and RaggedArray of lengths from
+        the start of the curve; they are cached for each resolution.
+        """
+        table = self._arc_length_cache.get(resolution)
+        if table is not None:
+            return table
+        samples = np.maximum(self.segment_counts, 1) * resolution + 1
+        local = _local_index(samples)
+        t_values = local / np.repeat(samples - 1, samples)
+        points = self.eval(t_values, np.repeat(np.arange(len(self)), samples))
+        steps = np.zeros(len(points))
+        steps[local > 0] = np.linalg.norm(points[1:] - points[:-1], axis=1)[local[1:] > 0]
+        table = (RaggedArray.from_lengths(t_values, samples),
+                 RaggedArray.from_lengths(_ragged_cumsum(steps, samples), samples))
+        self._arc_length_cache[resolution] = table
+        return table
+
+    def curve_lengths(self, resolution = 50):
+        """
+        Approximate length of each curve.
+        """
+        _, lengths = self.arc_length_table(resolution)
+        return lengths.values[lengths.offsets[1:] - 1]
+
+    def _length_parameters(self, s_in, curve, resolution):
+        t_table, length_table = self.arc_length_table(resolution)
+        total = self.curve_lengths(resolution)
+        s = s_in * total[curve]
+        index = _ragged_searchsorted(length_table, curve, s)
+        index = index.clip(1, length_table.lengths[curve] - 1) + length_table.offsets[:-1][curve]
+        s0, s1 = length_table.values[index - 1], length_table.values[index]
+        t0, t1 = t_table.values[index - 1], t_table.values[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(s1 > s0, (s - s0) / (s1 - s0), 0.0)
+        return t0 + ratio.clip(0, 1) * (t1 - t0)
+
+    def length_parameters(self, s_in, curve = None, resolution = 50):
+        """
+        Parameters of points at relative arc lengths s_in (values in [0,1])
+        from the start of the curve, by linear interpolation in arc_length_table.
+        curve has the same meaning as for eval().
+        """
+        s_in, curve, shape = self._broadcast(s_in, curve)
+        return self._length_parameters(s_in, curve, resolution).reshape(shape)
+
+    def eval_by_length(self, s_in, curve = None, resolution = 50):
+        """
+        Evaluate the splines at relative arc lengths s_in (values in [0,1]),
+        so that points evenly spaced in s_in are evenly spaced along the curve.
+        """
+        s_in, curve, shape = self._broadcast(s_in, curve)
+        t_in = self._length_parameters(s_in, curve, resolution)
+        return self.eval(t_in, curve).reshape(shape + (3,))
+
+class CubicSplineBatch(SplineBatch):
+    """
+    Many cubic splines, built and evaluated together. The splines are the
+    same as CubicSpline would build for each of the curves, but all
+    tridiagonal systems are solved at once, and parameters for all curves
+    are evaluated in one call.
+
+    usage:
+    splines = CubicSplineBatch(curves, metric="DISTANCE")
+    points = splines.eval(t_in)  # shape (len(curves), len(t_in), 3)
+    points = splines.eval(t_values, curve_indices)  # shape (len(t_values), 3)
+    """
+    def __init__(self, vertices, tknots = None, metric = None, is_cyclic = False):
+        """
+        vertices: list of curves, each being vertices in Sverchok's format,
+                  or RaggedArray of vertices (values of shape (n, 3) and offsets),
+                  use RaggedArray.from_array for curves padded to the same length
+        tknots: list of np.arrays or RaggedArray of knots for each of curves.
+                If not provided - calculated automatically based on metric
+        metric: string, one of "DISTANCE", "MANHATTAN", "POINTS", "CHEBYSHEV", "X", "Y", "Z".
+                Mandatory if tknots is not provided
+        is_cyclic: whether the splines are cyclic
+        """
+        locs, lengths, vertex_offsets = self._vertices(vertices)
+        if len(lengths) and lengths.min() < 2:
+            raise Exception("Cubic spline can't be build from less than 3 vertices")
+
+        if is_cyclic:
+            # as in CubicSpline, 4 vertices from the other end are added at both ends
+            wrap = np.minimum(lengths, 4)
+            index = _local_index(lengths + 2 * wrap)
+            count = np.repeat(lengths, lengths + 2 * wrap)
+            locs = locs[(index - np.repeat(wrap, lengths + 2 * wrap)) % count + np.repeat(vertex_offsets[:-1], lengths + 2 * wrap)]
+        # number of segments between t = 0 and t = 1
+        self.segment_counts = lengths if is_cyclic else lengths - 1
+        if is_cyclic:
+            lengths = lengths + 2 * wrap
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        if tknots is None:
+            if metric is None:
+                raise Exception("CubicSplineBatch: either tknots or metric must be specified")
+            tknots = self.create_knots(locs, lengths, metric)
+            if is_cyclic:
+                first, last = offsets[:-1] + 4, offsets[1:] - 4
+                scale = 1 / (tknots[last] - tknots[first])
+                base = tknots[first]
+                tknots -= np.repeat(base, lengths)
+                tknots *= np.repeat(scale, lengths)
+        else:
+            tknots = self._given_knots(tknots)
+
+        self.is_cyclic = is_cyclic
+        self.knots = RaggedArray(tknots, offsets)
+        self.splines = self._solve(locs, tknots, lengths)
+        self.segment_offsets = offsets[:-1] - np.arange(len(lengths))
+        self._arc_length_cache = {}
+
+    @staticmethod
+    def _solve(locs, tknots, lengths):
+        """
+        Coefficients of all spline segments, in the same format as CubicSpline.splines;
+        the tridiagonal systems of all curves are solved together, vertex by vertex.
+        """
+        count = len(locs)
+        local = _local_index(lengths)
+        has_next = local < np.repeat(lengths, lengths) - 1
+        not_interior = ~has_next | (local == 0)
+
+        # values are calculated for all vertices as if all curves were one,
+        # and then dropped where they mix different curves
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            h = np.zeros(count)
+            h[:-1] = tknots[1:] - tknots[:-1]
+            h[h == 0] = 1e-8
+            steps = np.zeros((count, 3))
+            steps[:-1] = locs[1:] - locs[:-1]
+            q = np.zeros((count, 3))
+            q[1:] = 3 / h[1:, np.newaxis] * steps[1:] - 3 / h[:-1, np.newaxis] * steps[:-1]
+            q[not_interior] = 0.0
+            diagonal = np.zeros(count)
+            diagonal[1:-1] = 2 * (tknots[2:] - tknots[:-2])
+            diagonal[not_interior] = 0.0
+
+        layout = _JaggedLayout(lengths)
+        h_j = layout.to_layout(h)
+        q = layout.to_layout(q)
+        diagonal = layout.to_layout(diagonal)
+        u = np.zeros(count)
+        z = np.zeros((count, 3))
+        c = np.zeros((count, 3))
+
+        # rows of vertex i of curves which have vertex i + 1
+        counts = layout.counts
+        for i in range(1, len(layout) - 1):
+            row, prev = layout.block(i, counts[i + 1]), layout.block(i - 1, counts[i + 1])
+            l = diagonal[row] - h_j[prev] * u[prev]
+            l[l == 0] = 1e-8
+            u[row] = h_j[row] / l
+            z[row] = (q[row] - h_j[prev, np.newaxis] * z[prev]) / l[:, np.newaxis]
+
+        for i in range(len(layout) - 2, -1, -1):
+            row = layout.block(i, counts[i + 1])
+            c[row] = z[row] - u[row, np.newaxis] * c[layout.block(i + 1)]
+        c = layout.from_layout(c)
+
+        c_next = np.zeros((count, 3))
+        c_next[:-1] = c[1:]
+        h = h[has_next, np.newaxis]
+        c_next, c = c_next[has_next], c[has_next]
+        b = steps[has_next] / h - h * (c_next + 2 * c) / 3
+        d = (c_next - c) / (3 * h)
+
+        splines = np.zeros((len(h), 5, 3))
+        splines[:, 0] = locs[has_next]
+        splines[:, 1] = b
+        splines[:, 2] = c
+        splines[:, 3] = d
+        splines[:, 4] = tknots[has_next, np.newaxis]
+        return splines
+
+    def eval(self, t_in, curve = None):
+        """
+        Evaluate the splines at parameters t_in (values in [0,1]).
+        curve: index of curve for each of t_in. If not provided, all curves
+               are evaluated at all t_in and the result has shape (len(self), len(t_in), 3)
+        returns np.array of points, of shape (len(t_in), 3)
+        """
+        t_in, curve, shape = self._broadcast(t_in, curve)
+        ax, bx, cx, dx, tx = self._segments(t_in, curve)
+        t_r = t_in[:, np.newaxis] - tx
+        out = ax + t_r * (bx + t_r * (cx + t_r * dx))
+        return out.reshape(shape + (3,))
+
+    def _segments(self, t_in, curve):
+        index = _ragged_searchsorted(self.knots, curve, t_in) - 1
+        index = index.clip(0, self.knots.lengths[curve] - 2)
+        to_calc = self.splines[self.segment_offsets[curve] + index]
+        return np.swapaxes(to_calc, 0, 1)
+
+    def derivative(self, t_in, curve = None):
+        """
+        Analytic first derivative of the splines by t.
+        """
+        t_in, curve, shape = self._broadcast(t_in, curve)
+        ax, bx, cx, dx, tx = self._segments(t_in, curve)
+        t_r = t_in[:, np.newaxis] - tx
+        out = bx + t_r * (2 * cx + 3 * t_r * dx)
+        return out.reshape(shape + (3,))
+
+    def tangent(self, t_in, curve = None, h = 0.001):
+        """
+        Numerical tangents, as CubicSpline.tangent calculates them.
+        """
+        t_in, curve, shape = self._broadcast(t_in, curve)
+        t_ph = t_in + h
+        t_mh = t_in - h
+        t_less_than_0 = t_mh < 0.0
+        t_great_than_1 = t_ph > 1.0
+        t_mh[t_less_than_0] += h
+        t_ph[t_great_than_1] -= h
+        tanget = self.eval(t_ph, curve) - self.eval(t_mh, curve)
+        tanget[t_less_than_0 | t_great_than_1] *= 2
+        return tanget.reshape(shape + (3,))
+
 class LinearSpline(Spline):
     def __init__(self, vertices, tknots = None, metric = None, is_cyclic = False):
         """
@@ -654,6 +1189,8 @@ class LinearSpline(Spline):
         self.pts = pts
         self.tknots = tknots
         self.is_cyclic = is_cyclic
+        # (start of each segment as part of the path length, vector of the segment)
+        self._tangent_table = None
 
     def eval(self, t_in, tknots = None):
         """
@@ -671,11 +1208,107 @@ class LinearSpline(Spline):
         return out.T
 
     def tangent(self, t_in, tknots = None, h = None):
+        """
+        Segment vectors (from the end of segment to its start) at t_in;
+        segments are found by t_in as part of the path length, whatever
+        the metric is. Values out of [0, 1) get the last segment.
+        """
+        if self._tangent_table is None:
+            segments = self.pts[:-1] - self.pts[1:]
+            lengths = np.sqrt(segments[:, 0] * segments[:, 0] + segments[:, 1] * segments[:, 1] + segments[:, 2] * segments[:, 2])
+            summed_lengths = np.cumsum(lengths)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                buckets = np.concatenate(([0.0], summed_lengths[:-1])) / summed_lengths[-1:]
+            self._tangent_table = (buckets, segments)
+        buckets, segments = self._tangent_table
+        if len(segments) == 0:
+            return np.zeros((len(t_in), 3))
+        index = buckets.searchsorted(t_in, side='right') - 1
+        last = len(segments) - 1
+        return segments[np.where((index >= 0) & (index < last), index, last)]
+
+    def derivative(self, t_in):
+        """
+        First derivative of the spline by t at t_in, constant along each segment
+        (at knots, the derivative of the following segment)
+        """
+        if len(self.pts) < 2:
+            return np.zeros((len(t_in), 3))
+        index = self.tknots.searchsorted(t_in, side='right') - 1
+        index = index.clip(0, len(self.pts) - 2)
+        dt = self.tknots[index + 1] - self.tknots[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = (self.pts[index + 1] - self.pts[index]) / dt[:, np.newaxis]
+        result[dt == 0] = 0.0
+        return result
+
+    def second_derivative(self, t_in):
+        return np.zeros((len(t_in), 3))
+
+class LinearSplineBatch(SplineBatch):
+    """
+    Many linear splines, built and evaluated together; evaluation is
+    the same as of LinearSpline for each of the curves.
+    """
+    def __init__(self, vertices, tknots = None, metric = None, is_cyclic = False):
+        """
+        Parameters are the same as of CubicSplineBatch.
+        """
+        pts, lengths, offsets = self._vertices(vertices)
+        self.segment_counts = lengths if is_cyclic else lengths - 1
+        if is_cyclic:
+            # as in LinearSpline, the first vertex is added at the end
+            index = _local_index(lengths + 1)
+            pts = pts[index % np.repeat(np.maximum(lengths, 1), lengths + 1) + np.repeat(offsets[:-1], lengths + 1)]
+            lengths = lengths + 1
         if tknots is None:
-            tknots = self.tknots
+            if metric is None:
+                raise Exception("LinearSplineBatch: either tknots or metric must be specified")
+            tknots = self.create_knots(pts, lengths, metric)
+        else:
+            tknots = self._given_knots(tknots)
 
-        lookup_segments = GenerateLookup(self.is_cyclic, self.pts.tolist())
-        return np.array([lookup_segments.find_bucket(f) for f in t_in])
+        self.is_cyclic = is_cyclic
+        self.pts = RaggedArray.from_lengths(pts, lengths)
+        self.knots = RaggedArray.from_lengths(tknots, lengths)
+        self._arc_length_cache = {}
+
+    def _segments(self, t_in, curve):
+        """
+        Vertices and knots at both ends of segments containing t_in;
+        as for np.interp, knots equal to t_in start the segment.
+        """
+        lengths = self.knots.lengths[curve]
+        index = _ragged_searchsorted(self.knots, curve, t_in, side='right') - 1
+        index = index.clip(0, np.maximum(lengths - 2, 0)) + self.knots.offsets[:-1][curve]
+        following = np.minimum(index + 1, self.knots.offsets[1:][curve] - 1)
+        values, points = self.knots.values, self.pts.values
+        return values[index], values[following], points[index], points[following]
+
+    def eval(self, t_in, curve = None):
+        """
+        Evaluate the splines at parameters t_in (values in [0,1]).
+        """
+        t_in, curve, shape = self._broadcast(t_in, curve)
+        t0, t1, p0, p1 = self._segments(t_in, curve)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (p1 - p0) / (t1 - t0)[:, np.newaxis]
+            out = slope * (t_in - t0)[:, np.newaxis] + p0
+        # as np.interp, keep values out of knots range at the ends
+        out = np.where((t_in <= t0)[:, np.newaxis], p0, out)
+        out = np.where((t_in >= t1)[:, np.newaxis], p1, out)
+        return out.reshape(shape + (3,))
+
+    def derivative(self, t_in, curve = None):
+        """
+        First derivative by t, constant along each segment.
+        """
+        t_in, curve, shape = self._broadcast(t_in, curve)
+        t0, t1, p0, p1 = self._segments(t_in, curve)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out = (p1 - p0) / (t1 - t0)[:, np.newaxis]
+        out[t1 == t0] = 0.0
+        return out.reshape(shape + (3,))
 
 class Spline2D(object):
     """
@@ -685,9 +1318,13 @@ class Spline2D(object):
     U and V splines can both be either linear or cubic.
     The spline can optionally be cyclic in U and/or V directions
     (so it can form a cylindrical or thoroidal surface).
-    This is implemented partly in pure python, partly in numpy, so the performance
-    is not very good. The performance is not very bad either, because of caching.
+    Single points are evaluated by eval() and normal(), which cache their
+    results; whole arrays of points are evaluated by eval_points(),
+    eval_grid() and normals(), which build all U splines at once.
     """
+    # limit of number of items in each of caches
+    CACHE_SIZE = 4096
+
     def __init__(self, vertices,
             u_spline_constructor = CubicSpline, v_spline_constructor = None,
             metric = "DISTANCE",
@@ -710,23 +1347,24 @@ class Spline2D(object):
         self.is_cyclic_v = is_cyclic_v
 
         self._v_splines = [v_spline_constructor(verts, is_cyclic=is_cyclic_v, metric=metric) for verts in vertices]
+        self._v_batch = None
 
-        # Caches
+        # Caches, least recently used items are dropped after CACHE_SIZE
         # v -> Spline
-        self._u_splines = {}
+        self._u_splines = OrderedDict()
         # (u,v) -> vertex
-        self._eval_cache = {}
+        self._eval_cache = OrderedDict()
         # (u,v) -> normal
-        self._normal_cache = {}
+        self._normal_cache = OrderedDict()
 
     def get_u_spline(self, v, vertices):
         """Get a spline along U direction for specified value of V coordinate"""
-        spline = self._u_splines.get(v, None)
+        spline = _cache_get(self._u_splines, v)
         if spline is not None:
             return spline
         else:
             spline = self.u_spline_constructor(vertices, is_cyclic=self.is_cyclic_u, metric=self.metric)
-            self._u_splines[v] = spline
+            _cache_put(self._u_splines, v, spline, self.CACHE_SIZE)
             return spline
 
     def eval(self, u, v):
@@ -737,14 +1375,14 @@ class Spline2D(object):
         Evaluate the spline at single point.
         """
 
-        result = self._eval_cache.get((u,v), None)
+        result = _cache_get(self._eval_cache, (u,v))
         if result is not None:
             return result
         else:
             spline_vertices = [spline.eval_at_point(v) for spline in self._v_splines]
             u_spline = self.get_u_spline(v, spline_vertices)
             result = u_spline.eval_at_point(u)
-            self._eval_cache[(u,v)] = result
+            _cache_put(self._eval_cache, (u,v), result, self.CACHE_SIZE)
             return result
 
     def normal(self, u, v, h=0.001):
@@ -756,7 +1394,7 @@ class Spline2D(object):
         Get the normal vector for spline at specific point.
         """
 
-        result = self._normal_cache.get((u,v), None)
+        result = _cache_get(self._normal_cache, (u,v))
         if result is not None:
             return result
         else:
@@ -771,9 +1409,104 @@ class Spline2D(object):
                 n = n / norm
             #debug("DU: {}, DV: {}, N: {}".format(du, dv, n))
             result = tuple(n)
-            self._normal_cache[(u,v)] = result
+            _cache_put(self._normal_cache, (u,v), result, self.CACHE_SIZE)
             return result
 
+    def _batch_constructor(self, constructor):
+        return {CubicSpline: CubicSplineBatch, LinearSpline: LinearSplineBatch}.get(constructor)
+
+    def _u_batch(self, v_values, derivative=False):
+        """
+        U splines (one per value of v) and, if derivative is True, U splines through
+        derivatives of V splines by v, with the same knots.
+        """
+        if self._v_batch is None:
+            self._v_batch = self._batch_constructor(self.v_spline_constructor)(
+                    RaggedArray.from_array(self.vertices), is_cyclic=self.is_cyclic_v, metric=self.metric)
+        u_constructor = self._batch_constructor(self.u_spline_constructor)
+        # columns of vertices of V splines at each v are the U curves
+        columns = np.swapaxes(self._v_batch.eval(v_values), 0, 1)
+        u_splines = u_constructor(RaggedArray.from_array(columns), is_cyclic=self.is_cyclic_u, metric=self.metric)
+        if not derivative:
+            return u_splines, None
+        columns = np.swapaxes(self._v_batch.derivative(v_values), 0, 1)
+        return u_splines, u_constructor(RaggedArray.from_array(columns), tknots=u_splines.knots, is_cyclic=self.is_cyclic_u)
+
+    def _has_batch(self):
+        return self._batch_constructor(self.u_spline_constructor) is not None \
+                and self._batch_constructor(self.v_spline_constructor) is not None \
+                and self.vertices.ndim == 3
+
+    def eval_points(self, u, v):
+        """
+        u, v: arrays (or floats) of the same shape, values in [0, 1].
+        Returns np.array of points of shape u.shape + (3,).
+
+        Evaluate the spline at many points at once.
+        """
+        u, v = np.broadcast_arrays(np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64))
+        if not self._has_batch():
+            return np.array([self.eval(u_, v_) for u_, v_ in zip(u.ravel().tolist(), v.ravel().tolist())]).reshape(u.shape + (3,))
+        v_values, curve = np.unique(v.ravel(), return_inverse=True)
+        u_splines, _ = self._u_batch(v_values)
+        return u_splines.eval(u.ravel(), curve).reshape(u.shape + (3,))
+
+    def eval_grid(self, u, v):
+        """
+        u, v: 1D arrays of values in [0, 1].
+        Returns np.array of shape (len(v), len(u), 3).
+        """
+        vs, us = np.meshgrid(v, u, indexing='ij')
+        return self.eval_points(us, vs)
+
+    def points_and_normals(self, u, v, h=0.001):
+        """
+        u, v: arrays (or floats) of the same shape, values in [0, 1].
+        h: step for numeric differentials calculation, as for normal();
+           if None, the normals are calculated from analytic derivatives of splines.
+           The derivative by v is exact for "POINTS" metric; for other metrics
+           knots of U splines depend on v, this dependency is not taken into account.
+        Returns two np.arrays of shape u.shape + (3,): points and unit normals.
+        """
+        u, v = np.broadcast_arrays(np.asarray(u, dtype=np.float64), np.asarray(v, dtype=np.float64))
+        shape = u.shape + (3,)
+        u, v = u.ravel(), v.ravel()
+        if not self._has_batch():
+            points = [self.eval(u_, v_) for u_, v_ in zip(u.tolist(), v.tolist())]
+            normals = [self.normal(u_, v_, h=h or 0.001) for u_, v_ in zip(u.tolist(), v.tolist())]
+            return np.array(points).reshape(shape), np.array(normals).reshape(shape)
+        if h is None:
+            v_values, curve = np.unique(v, return_inverse=True)
+            u_splines, v_derivatives = self._u_batch(v_values, derivative=True)
+            point = u_splines.eval(u, curve)
+            du = u_splines.derivative(u, curve)
+            dv = v_derivatives.eval(u, curve)
+        else:
+            count = len(u)
+            points = self.eval_points(np.concatenate((u, u + h, u)), np.concatenate((v, v, v + h)))
+            point, point_u, point_v = points[:count], points[count:2*count], points[2*count:]
+            du = (point_u - point)/h
+            dv = (point_v - point)/h
+        n = np.cross(du, dv)
+        norm = np.linalg.norm(n, axis=1)
+        nonzero = norm != 0
+        n[nonzero] /= norm[nonzero, np.newaxis]
+        return point.reshape(shape), n.reshape(shape)
+
+    def normals(self, u, v, h=0.001):
+        """
+        Unit normals at many points at once, see points_and_normals().
+        """
+        return self.points_and_normals(u, v, h)[1]
+
+    def normals_grid(self, u, v, h=0.001):
+        """
+        u, v: 1D arrays of values in [0, 1].
+        Returns np.array of unit normals of shape (len(v), len(u), 3).
+        """
+        vs, us = np.meshgrid(v, u, indexing='ij')
+        return self.normals(us, vs, h)
+
 class GenerateLookup():
 
     def __init__(self, cyclic, vlist):
@@ -11,7 +11,8 @@ import numpy as np
 from numpy.linalg import norm as np_norm
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.modules.matrix_utils import matrix_normal, vectors_center_axis_to_matrix
-from sverchok.utils.modules.vertex_utils import vertex_shell_factor, adjacent_edg_pol, adjacent_edg_pol_num
+from sverchok.utils.modules.vertex_utils import vertex_shell_factor
+from sverchok.utils.modules.mesh_adjacency import adjacency_index
 from sverchok.nodes.analyzer.mesh_filter import Edges
 
 def edges_aux(vertices):
@@ -77,15 +78,8 @@ def connected_edges(verts, edges):
     edges: list as [edge, edge,..], being each edge [int, int].
     returns edges connected to each edge as [[edge, edge,...],[edge,...],...]
     '''
-    v_adjacent = adjacent_edg_pol(verts, edges)
-    vals = []
-    for edge in edges:
-        adj_edges = []
-        for v_ind in edge:
-            adj_edges.extend(v_adjacent[v_ind])
-            adj_edges.remove(edge)
-        vals.append(adj_edges)
-    return vals
+    connected = adjacency_index(edges).vert_neighbours(unique=False).tolist()
+    return [[edges[i] for i in adj_edges] for adj_edges in connected]
 
 
 def connected_edges_num(verts, edges):
@@ -95,15 +89,17 @@ def connected_edges_num(verts, edges):
     edges: list as [edge, edge,..], being each edge [int, int].
     returns number of edges connected to each edge as [int, int,...]
     '''
-    v_adja = adjacent_edg_pol_num(verts, edges)
-    vals = []
-    for edge in edges:
-        adj = 0
-        for c in edge:
-            adj += v_adja[c] - 1
-        vals.append(adj)
-    return vals
+    return adjacency_index(edges).vert_neighbours(unique=False).lengths.tolist()
+
 
+def adjacent_faces_idx(edges, pols):
+    '''
+    indices of faces adjacent to each edge as RaggedArray
+    edges: list as [edge, edge,..], being each edge [int, int].
+    pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
+    '''
+    index = adjacency_index(pols)
+    return index.edge_items(index.find_edges(edges))
 
 def adjacent_faces_number(edges, pols):
     '''
@@ -112,15 +108,9 @@ def adjacent_faces_number(edges, pols):
     pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
     returns number of faces connected to each edge as [int, int,...]
     '''
-    e_sorted = [sorted(e) for e in edges]
-    ad_faces = [0 for e in edges]
-    for pol in pols:
-        for edge in zip(pol, pol[1:] + [pol[0]]):
-            e_s = sorted(edge)
-            if e_s in e_sorted:
-                idx = e_sorted.index(e_s)
-                ad_faces[idx] += 1
-    return ad_faces
+    if not edges:
+        return []
+    return adjacent_faces_idx(edges, pols).lengths.tolist()
 
 def adjacent_faces(edges, pols):
     '''
@@ -129,15 +119,9 @@ def adjacent_faces(edges, pols):
     pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
     returns polygon connected to each edge as [[polygon, polygon, ...], [polygon, ...],...]
     '''
-    e_sorted = [sorted(e) for e in edges]
-    ad_faces = [[] for e in edges]
-    for pol in pols:
-        for edge in zip(pol, pol[1:] + [pol[0]]):
-            e_s = sorted(edge)
-            if e_s in e_sorted:
-                idx = e_sorted.index(e_s)
-                ad_faces[idx] += [pol]
-    return ad_faces
+    if not edges:
+        return []
+    return [[pols[i] for i in ad_faces] for ad_faces in adjacent_faces_idx(edges, pols).tolist()]
 
 
 def faces_angle_full(vertices, edges, faces):
@@ -163,15 +147,9 @@ def faces_angle(normals, edges, pols):
     faces: list as [polygon, polygon,..], being each polygon [int, int, ...].
     returns angle of faces (in radians) connected to each edge as [int, int,...]
     '''
-    ad_faces = adjacent_faces_number(edges, pols)
-    e_sorted = [sorted(e) for e in edges]
-    ad_faces = [[] for e in edges]
-    for idp, pol in enumerate(pols):
-        for edge in zip(pol, pol[1:] + [pol[0]]):
-            e_s = sorted(edge)
-            if e_s in e_sorted:
-                idx = e_sorted.index(e_s)
-                ad_faces[idx].append(idp)
+    if not edges:
+        return []
+    ad_faces = adjacent_faces_idx(edges, pols).tolist()
     angles = []
     for edg in ad_faces:
         if len(edg) > 1:
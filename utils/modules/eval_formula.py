@@ -17,6 +17,10 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+import math
+from functools import lru_cache
+
+import numpy as np
 
 from sverchok.utils.script_importhelper import safe_names
 from sverchok.utils import logging
@@ -111,7 +115,11 @@ def get_variables(string):
     result = visitor.variables
     return result.difference(safe_names.keys())
 
+@lru_cache(maxsize=1024)
 def sv_compile(string):
+    """
+    Compile expression; compiled code is cached by the text of expression.
+    """
     try:
         root = ast.parse(string, mode='eval')
         return compile(root, "<expression>", 'eval')
@@ -140,14 +148,187 @@ def safe_eval(string, variables):
     Evaluate expression, allowing only functions known to be "safe"
     to be used.
     """
-    try:
-        env = dict()
-        env.update(safe_names)
-        env.update(variables)
+    return safe_eval_compiled(sv_compile(string), variables)
+
+def _float_power(x, y):
+    # math.pow always returns float
+    return np.power(np.asarray(x, dtype=np.float64), y)
+
+def _log(x, base=None):
+    if base is None:
+        return np.log(x)
+    return np.log(x) / np.log(base)
+
+def _to_int(function):
+    # math.floor & co return integers
+    def wrapped(x):
+        return function(x).astype(np.int64)
+    return wrapped
+
+def _elementwise(function):
+    return np.vectorize(function, otypes=[np.float64])
+
+# NumPy counterparts of safe_names, working on whole arrays;
+# formulas using other names are evaluated value by value
+np_safe_names = dict(
+    acos=np.arccos, acosh=np.arccosh, asin=np.arcsin, asinh=np.arcsinh,
+    atan=np.arctan, atan2=np.arctan2, atanh=np.arctanh,
+    ceil=_to_int(np.ceil), copysign=np.copysign, cos=np.cos, cosh=np.cosh,
+    degrees=np.degrees, erf=_elementwise(math.erf), erfc=_elementwise(math.erfc),
+    exp=np.exp, expm1=np.expm1, fabs=np.fabs, floor=_to_int(np.floor),
+    fmod=np.fmod, gamma=_elementwise(math.gamma), hypot=np.hypot,
+    isfinite=np.isfinite, isinf=np.isinf, isnan=np.isnan, ldexp=np.ldexp,
+    lgamma=_elementwise(math.lgamma), log=_log, log10=np.log10, log1p=np.log1p,
+    log2=np.log2, pow=_float_power, radians=np.radians, sin=np.sin, sinh=np.sinh,
+    sqrt=np.sqrt, tan=np.tan, tanh=np.tanh, trunc=_to_int(np.trunc),
+    abs=np.abs, sign=_to_int(np.sign),
+    e=math.e, pi=math.pi)
+
+_vector_operators = (
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq)
+
+def is_vectorizable(root):
+    """
+    Check if expression can be evaluated on whole NumPy arrays with the same
+    result as value by value: only arithmetics, single comparisons, numbers,
+    variables and calls of np_safe_names are allowed.
+    """
+    for node in ast.walk(root):
+        if isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load)):
+            continue
+        if isinstance(node, _vector_operators):
+            continue
+        if isinstance(node, ast.Compare):
+            if len(node.ops) == 1:
+                continue
+            return False
+        if isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name) and node.func.id in np_safe_names \
+                    and not node.keywords and not any(isinstance(arg, ast.Starred) for arg in node.args):
+                continue
+            return False
+        if isinstance(node, ast.Name):
+            if node.id in np_safe_names or node.id not in safe_names:
+                continue
+            return False
+        if isinstance(node, getattr(ast, 'Constant', ())) or isinstance(node, getattr(ast, 'Num', ())):
+            value = node.n if hasattr(node, 'n') else node.value
+            if isinstance(value, (int, float)):
+                continue
+            return False
+        return False
+    return True
+
+class Formula(object):
+    """
+    Formula compiled once, which can be evaluated either for one set of values
+    of variables, or for whole lists of values at once.
+    Use compile_formula() to get an instance, it is cached by the text of formula.
+    """
+    def __init__(self, string):
+        self.string = string
+        self.code = sv_compile(string)
+        self.variables = get_variables(string)
+        self.vectorizable = is_vectorizable(ast.parse(string, mode='eval'))
+
+    def __repr__(self):
+        return "Formula({})".format(self.string)
+
+    def eval_(self, variables):
+        """
+        Evaluate for one value of each variable
+        """
+        return safe_eval_compiled(self.code, variables)
+
+    def evaluate(self, variables):
+        """
+        Evaluate for lists of values.
+        variables: dictionary of name -> list (or 1D array) of values;
+            as in zip_long_repeat, shorter lists are extended by repeating
+            their last value, and if any of lists is empty the result is empty.
+        Returns NumPy array of results if the formula could be evaluated on
+        whole arrays, otherwise list of results.
+        """
+        lengths = [len(values) for values in variables.values()]
+        if not lengths:
+            count = 1
+        elif min(lengths) == 0:
+            count = 0
+        else:
+            count = max(lengths)
+        if self.vectorizable:
+            result = self._evaluate_arrays(variables, count)
+            if result is not None:
+                return result
+        names = list(variables.keys())
+        columns = [self._extend(values, count) for values in variables.values()]
+        if not names:
+            return [self.eval_({})] * count
+        return [self.eval_(dict(zip(names, values))) for values in zip(*columns)]
+
+    @staticmethod
+    def _extend(values, count):
+        if len(values) == count:
+            return values
+        if isinstance(values, np.ndarray):
+            return values[np.minimum(np.arange(count), len(values) - 1)]
+        return list(values) + [values[-1]] * (count - len(values))
+
+    def _evaluate_arrays(self, variables, count):
+        arrays = dict()
+        for name, values in variables.items():
+            try:
+                array = np.asarray(values)
+            except ValueError:
+                return None
+            # bools are left to python: for NumPy True + True is True
+            if array.ndim != 1 or array.dtype.kind not in 'if':
+                return None
+            arrays[name] = self._extend(array, count)
+        result = self._eval_arrays(arrays)
+        if result is not None and result.dtype.kind == 'i':
+            # python integers do not overflow, int64 silently do
+            check = self._eval_arrays({name: array.astype(np.float64) for name, array in arrays.items()})
+            if check is None or np.any(np.abs(check) >= 2.0 ** 63):
+                return None
+        if result is None:
+            return None
+        if result.shape == ():
+            return np.full(count, result[()])
+        if result.shape != (count,):
+            return None
+        return result
+
+    def _eval_arrays(self, arrays):
+        env = dict(np_safe_names)
+        env.update(arrays)
         env["__builtins__"] = {}
-        root = ast.parse(string, mode='eval')
-        return eval(compile(root, "<expression>", 'eval'), env)
-    except SyntaxError as e:
-        logging.exception(e)
-        raise Exception("Invalid expression syntax: " + str(e))
+        try:
+            # on errors (like math module would raise) formula is evaluated
+            # value by value, so the error is reported as usual
+            with np.errstate(divide='raise', over='raise', invalid='raise'):
+                return np.asarray(eval(self.code, env))
+        except (ArithmeticError, ValueError, TypeError):
+            return None
+
+@lru_cache(maxsize=1024)
+def compile_formula(string):
+    """
+    Formula object for the expression, cached by the text of expression.
+    """
+    return Formula(string.strip())
+
 
+def evaluate_formulas(strings, variables):
+    """
+    Evaluate several formulas (for example components of vectors) for the
+    same lists of values of variables, as Formula.evaluate does.
+    Returns (n, len(strings)) NumPy array if all formulas could be evaluated
+    on whole arrays, otherwise list of tuples.
+    """
+    results = [compile_formula(string).evaluate(variables) for string in strings]
+    if all(isinstance(result, np.ndarray) for result in results):
+        return np.stack(results, axis=-1)
+    return list(zip(*results))
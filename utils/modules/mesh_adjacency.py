@@ -0,0 +1,175 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+'''
+Adjacency index of a mesh, shared by the analyzers of vertex_utils,
+edge_utils and polygon_utils.
+
+The index is built once from the polygons (or edges, which are treated
+as 2-sided polygons) with NumPy. Each polygon corner is a "loop";
+maps from edges and vertices to loops are stored CSR-style as RaggedArray:
+values are loop indices sorted by edge / vertex, offsets delimit the items.
+'''
+
+from collections import OrderedDict
+
+import numpy as np
+
+from sverchok.utils.ragged_array import RaggedArray
+
+# number of meshes kept by adjacency_index
+CACHE_SIZE = 8
+
+_cache = OrderedDict()
+
+
+class MeshAdjacency:
+    '''
+    items: list as [polygon, polygon,..], being each polygon [int, int, ...]
+           or [edge, edge,..], being each edge [int, int].
+    loops: RaggedArray of vertex indices of each item
+    loop_item: item of each loop
+    vert_loops: RaggedArray, loops of each vertex
+    edges: (E, 2) array of unique sides of items, as sorted vertex pairs
+    loop_edge: index in edges of the side starting at each loop
+    edge_loops: RaggedArray, loops of each edge
+    '''
+    def __init__(self, items):
+        self.loops = items if isinstance(items, RaggedArray) else RaggedArray.from_list(items, dtype=np.int64)
+        self.loop_item = self.loops.item_index
+        verts = self.loops.values
+        self.vert_count = int(verts.max()) + 1 if len(verts) else 0
+        self.vert_loops = self._csr(verts, self.vert_count)
+        self._edges = None
+
+    @staticmethod
+    def _csr(keys, count):
+        order = np.argsort(keys, kind='stable')
+        return RaggedArray.from_lengths(order, np.bincount(keys, minlength=count))
+
+    def _build_edges(self):
+        verts = self.loops.values
+        offsets = self.loops.offsets
+        # next vertex of each loop, the last loop of a polygon is followed by the first
+        next_loop = np.arange(1, len(verts) + 1)
+        ends = offsets[1:][self.loops.lengths > 0] - 1
+        next_loop[ends] = offsets[:-1][self.loops.lengths > 0]
+        pairs = np.sort(np.stack((verts, verts[next_loop]), axis=-1), axis=1)
+        keys, self.loop_edge = np.unique(self._edge_keys(pairs), return_inverse=True)
+        self.loop_edge = self.loop_edge.reshape(-1)
+        self._edges = np.stack(np.divmod(keys, max(self.vert_count, 1)), axis=-1)
+        self._edge_key_values = keys
+        self.edge_loops = self._csr(self.loop_edge, len(keys))
+
+    def _edge_keys(self, pairs):
+        return pairs[:, 0] * self.vert_count + pairs[:, 1]
+
+    @property
+    def edges(self):
+        if self._edges is None:
+            self._build_edges()
+        return self._edges
+
+    def find_edges(self, edges):
+        '''
+        index of each of given edges ([[int, int],..]) in self.edges, -1 if no item has such side
+        '''
+        if self._edges is None:
+            self._build_edges()
+        pairs = np.sort(np.array(edges, dtype=np.int64).reshape((-1, 2)), axis=1)
+        found = np.full(len(pairs), -1, dtype=np.int64)
+        valid = pairs[:, 1] < self.vert_count
+        if not np.any(valid) or not len(self._edge_key_values):
+            return found
+        keys = self._edge_keys(pairs[valid])
+        pos = np.minimum(np.searchsorted(self._edge_key_values, keys), len(self._edge_key_values) - 1)
+        found[valid] = np.where(self._edge_key_values[pos] == keys, pos, -1)
+        return found
+
+    def edge_items(self, edge_indices=None):
+        '''
+        RaggedArray of items having each edge as a side (in the order of items),
+        edges not found (-1) get no items
+        '''
+        if self._edges is None:
+            self._build_edges()
+        if edge_indices is None:
+            return RaggedArray(self.loop_item[self.edge_loops.values], self.edge_loops.offsets)
+        edge_indices = np.asarray(edge_indices, dtype=np.int64)
+        found = edge_indices >= 0
+        # only found edges are taken, so there is nothing to index when items have no sides
+        items = self.edge_loops.take(edge_indices[found])
+        lengths = np.zeros(len(edge_indices), dtype=np.int64)
+        lengths[found] = items.lengths
+        return RaggedArray.from_lengths(self.loop_item[items.values], lengths)
+
+    def vert_items(self, vert_count):
+        '''
+        RaggedArray of items using each of vert_count vertices, in the order of items
+        '''
+        lengths = np.zeros(vert_count, dtype=np.int64)
+        known = min(vert_count, self.vert_count)
+        lengths[:known] = self.vert_loops.lengths[:known]
+        values = self.vert_loops.values[:self.vert_loops.offsets[known]]
+        return RaggedArray.from_lengths(self.loop_item[values], lengths)
+
+    def _neighbour_items(self, loop_keys, key_loops):
+        '''
+        for each loop, items of other loops with the same key (edge or vertex),
+        returns (item of loop, item of other loop) pairs in the order of loops
+        '''
+        counts = key_loops.lengths[loop_keys]
+        loop = np.repeat(np.arange(len(loop_keys)), counts)
+        local = np.arange(len(loop)) - np.repeat(np.cumsum(counts) - counts, counts)
+        other = key_loops.values[np.repeat(key_loops.offsets[:-1][loop_keys], counts) + local]
+        not_self = other != loop
+        return self.loop_item[loop[not_self]], self.loop_item[other[not_self]]
+
+    def _group(self, items, values):
+        return RaggedArray.from_lengths(values, np.bincount(items, minlength=len(self.loops)))
+
+    def edge_neighbours(self):
+        '''
+        RaggedArray: for each item, items sharing its sides,
+        once per shared side
+        '''
+        if self._edges is None:
+            self._build_edges()
+        return self._group(*self._neighbour_items(self.loop_edge, self.edge_loops))
+
+    def vert_neighbours(self, unique=True):
+        '''
+        RaggedArray: for each item, items sharing its vertices,
+        unique - each item only once and never the item itself
+        '''
+        items, others = self._neighbour_items(self.loops.values, self.vert_loops)
+        if unique:
+            keys = items * len(self.loops) + others
+            _, first = np.unique(keys, return_index=True)
+            first = np.sort(first)
+            first = first[items[first] != others[first]]
+            items, others = items[first], others[first]
+        return self._group(items, others)
+
+
+def adjacency_index(items):
+    '''
+    MeshAdjacency of items (polygons or edges), cached by the content of items,
+    so analyzers called with the same mesh build the index once
+    '''
+    loops = items if isinstance(items, RaggedArray) else RaggedArray.from_list(items, dtype=np.int64)
+    data = loops.values.tobytes() + loops.offsets.tobytes()
+    key = (len(loops.values), hash(data))
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == data:
+        _cache.move_to_end(key)
+        return cached[1]
+    index = MeshAdjacency(loops)
+    _cache[key] = (data, index)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return index
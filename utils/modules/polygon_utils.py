@@ -6,66 +6,88 @@
 # License-Filename: LICENSE
 
 
+import numpy as np
 from mathutils import Vector
-from mathutils.geometry import area_tri as area
-from mathutils.geometry import tessellate_polygon as tessellate
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.modules.matrix_utils import vectors_center_axis_to_matrix
-from sverchok.utils.modules.vertex_utils import vertex_shell_factor, adjacent_edg_pol
+from sverchok.utils.modules.vertex_utils import vertex_shell_factor
+from sverchok.utils.modules.mesh_adjacency import adjacency_index
+from sverchok.utils.ragged_array import RaggedArray
 from sverchok.nodes.analyzer.mesh_filter import Faces
 
 
-def areas_from_polygons(verts, polygons, sum_faces=False):
+def pols_by_sides(polygons):
+    '''
+    groups polygons by number of sides into regular index arrays
+    polygons: list as [polygon, polygon,..], being each polygon [int, int, ...]. Also accepts numpy arrays with two axis
+    returns [(sides, polygon indices, (number of polygons, sides) array of vertex indices), ...]
+    '''
+    if isinstance(polygons, np.ndarray):
+        return [(polygons.shape[1], np.arange(len(polygons)), polygons)] if len(polygons) else []
+    loops = RaggedArray.from_list(polygons, dtype=np.int64)
+    lengths = loops.lengths
+    groups = []
+    for sides in np.unique(lengths).tolist():
+        idx = np.flatnonzero(lengths == sides)
+        groups.append((sides, idx, loops.take(idx).values.reshape((len(idx), sides))))
+    return groups
+
+def _pols_corners(verts, polygons):
+    '''
+    yields (polygon indices, (number of polygons, sides, 3) array of corners) for each number of sides,
+    empty polygons are skipped (their values stay zero)
+    '''
+    np_verts = np.asarray(verts, dtype=np.float64)
+    for sides, idx, indices in pols_by_sides(polygons):
+        if sides:
+            yield idx, np_verts[indices]
+
+def _pols_vector_areas(corners):
+    '''
+    sum of cross products of consecutive corners (Newell's method),
+    its length is the area of planar polygons (concave too), its direction is the normal
+    '''
+    return np.cross(corners, np.roll(corners, -1, axis=1)).sum(axis=1) / 2
+
+def areas_from_polygons(verts, polygons, sum_faces=False, output_numpy=False):
     '''
     returns pols area as [float, float,...]
     vertices: list as [vertex, vertex, ...], being each vertex [float, float, float].
     faces: list as [polygon, polygon,..], being each polygon [int, int, ...].
     sum_faces if True it will return the sum of the areas as [float]
-    '''
-    areas = []
-    concat_area = areas.append
-
-    for polygon in polygons:
-        num = len(polygon)
-        if num == 3:
-            concat_area(area(verts[polygon[0]], verts[polygon[1]], verts[polygon[2]]))
-        elif num == 4:
-            area_1 = area(verts[polygon[0]], verts[polygon[1]], verts[polygon[2]])
-            area_2 = area(verts[polygon[0]], verts[polygon[2]], verts[polygon[3]])
-            concat_area(area_1 + area_2)
-        elif num > 4:
-            ngon_area = 0.0
-            subcoords = [Vector(verts[idx]) for idx in polygon]
-            for tri in tessellate([subcoords]):
-                ngon_area += area(*[verts[polygon[i]] for i in tri])
-            concat_area(ngon_area)
-        else:
-            concat_area(0)
+    output_numpy: if True returns numpy array
+    '''
+    areas = np.zeros(len(polygons))
+    for idx, corners in _pols_corners(verts, polygons):
+        sides = corners.shape[1]
+        if sides == 4:
+            # area of two triangles split by 0-2 diagonal, as for non planar quads
+            diagonal = corners[:, 2] - corners[:, 0]
+            areas[idx] = (np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], diagonal), axis=1) +
+                          np.linalg.norm(np.cross(diagonal, corners[:, 3] - corners[:, 0]), axis=1)) / 2
+        elif sides > 2:
+            areas[idx] = np.linalg.norm(_pols_vector_areas(corners), axis=1)
 
     if sum_faces:
-        areas = [sum(areas)]
+        areas = np.sum(areas)[np.newaxis]
 
-    return areas
+    return areas if output_numpy else areas.tolist()
 
 
-def pols_perimeters(verts, polygons, sum_perimeters=False):
+def pols_perimeters(verts, polygons, sum_perimeters=False, output_numpy=False):
     '''
     returns pols perimeter as [float, float,...]
     vertices: list as [vertex, vertex, ...], being each vertex [float, float, float].
     faces: list as [polygon, polygon,..], being each polygon [int, int, ...].
     sum_perimeters if True it will return the sum of the perimenters as [float]
+    output_numpy: if True returns numpy array
     '''
-    perimeters = []
-    concat_perimeters = perimeters.append
-
-    for polygon in polygons:
-        perimeter = 0
-        for v_id, v_id2 in zip(polygon, polygon[1:]+[polygon[0]]):
-            perimeter += (Vector(verts[v_id]) - Vector(verts[v_id2])).magnitude
-        concat_perimeters(perimeter)
+    perimeters = np.zeros(len(polygons))
+    for idx, corners in _pols_corners(verts, polygons):
+        perimeters[idx] = np.linalg.norm(corners - np.roll(corners, -1, axis=1), axis=2).sum(axis=1)
     if sum_perimeters:
-        perimeters = [sum(perimeters)]
-    return perimeters
+        perimeters = np.sum(perimeters)[np.newaxis]
+    return perimeters if output_numpy else perimeters.tolist()
 
 def pols_vertices(vertices, faces):
     '''
@@ -113,91 +135,58 @@ def pols_sides(faces, sum_sides=False):
 
 def pols_adjacent(pols):
     '''
-    returns the polygons that share a vertex with each polygon [[pol, pol,..], [pol,..]]
+    returns the polygons that share a edge with each polygon [[pol, pol,..], [pol,..]]
     pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
     '''
-    vals = []
-    edges = []
-    pols_eds = []
-    for pol in pols:
-        pol_edgs = []
-        for edge in zip(pol, pol[1:] + [pol[0]]):
-            e_s = tuple(sorted(edge))
-            pol_edgs.append(e_s)
-            edges.append(e_s)
-        pols_eds.append(pol_edgs)
-    edges = list(set(edges))
-
-    ad_faces = [[] for e in edges]
-    for pol, eds in zip(pols, pols_eds):
-        for edge in eds:
-            idx = edges.index(edge)
-            ad_faces[idx] += [pol]
-
-    for pol, edgs in zip(pols, pols_eds):
-        col_pol = []
-        for edge in edgs:
-            idx = edges.index(edge)
-            col_pol.extend(ad_faces[idx])
-            col_pol.remove(pol)
-        vals.append(col_pol)
-
-    return vals
+    adjacent = adjacency_index(pols).edge_neighbours().tolist()
+    return [[pols[i] for i in pol_adj] for pol_adj in adjacent]
 
 def pols_adjacent_num(pols):
     '''
-    returns the number polygons that share a vertex with each polygon [int, int,..]]
+    returns the number polygons that share a edge with each polygon [int, int,..]]
     pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
     '''
-    return [len(p) for p in pols_adjacent(pols)]
+    return adjacency_index(pols).edge_neighbours().lengths.tolist()
 
 def pols_neighbor(verts, pols):
     '''
-    returns the polygons that share one edges with each polygon [[pol, pol,..], [pol,..]]
+    returns the polygons that share one vertex with each polygon [[pol, pol,..], [pol,..]]
     pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
     '''
-    v_adj = adjacent_edg_pol(verts, pols)
-    vals = []
-    for pol in pols:
-        pol_adj = []
-        for v_id in pol:
-            for related_pol in v_adj[v_id]:
-                if not related_pol in pol_adj:
-                    pol_adj.append(related_pol)
-
-        pol_adj.remove(pol)
-        vals.append(pol_adj)
-
-    return vals
+    neighbors = adjacency_index(pols).vert_neighbours().tolist()
+    return [[pols[i] for i in pol_adj] for pol_adj in neighbors]
 
 def pols_neighbor_num(verts, pols):
     '''
-    returns the number of polygons that share one edges with each polygon [int, int,...]
+    returns the number of polygons that share one vertex with each polygon [int, int,...]
     pols: list as [polygon, polygon,..], being each polygon [int, int, ...].
     '''
-    return [len(p) for p in pols_neighbor(verts, pols)]
+    return adjacency_index(pols).vert_neighbours().lengths.tolist()
 
-def pols_normals(vertices, faces):
+def pols_normals(vertices, faces, output_numpy=False):
     '''
     Returns Faces normals as [vector, vector,...]
     vertices: list as [vertex, vertex, ...], being each vertex [float, float, float].
     faces: list as [polygon, polygon,..], being each polygon [int, int, ...].
+    output_numpy: if True returns numpy array
     '''
-    bm = bmesh_from_pydata(vertices, [], faces, normal_update=True)
-    vals = [tuple(face.normal) for face in bm.faces]
-    bm.free()
-    return vals
+    normals = np.zeros((len(faces), 3))
+    for idx, corners in _pols_corners(vertices, faces):
+        normals[idx] = _pols_vector_areas(corners)
+    lengths = np.linalg.norm(normals, axis=1)
+    non_zero = lengths > 0
+    normals[non_zero] /= lengths[non_zero, np.newaxis]
+    return normals if output_numpy else normals.tolist()
 
-def pols_absolute_normals(vertices, faces):
+def pols_absolute_normals(vertices, faces, output_numpy=False):
     '''
     Returns Faces center + faces normals as [vector, vector,...]
     vertices: list as [vertex, vertex, ...], being each vertex [float, float, float].
     faces: list as [polygon, polygon,..], being each polygon [int, int, ...].
+    output_numpy: if True returns numpy array
     '''
-    bm = bmesh_from_pydata(vertices, [], faces, normal_update=True)
-    vals = [tuple(face.normal + face.calc_center_median()) for face in bm.faces]
-    bm.free()
-    return vals
+    vals = pols_normals(vertices, faces, output_numpy=True) + pols_center(vertices, faces, 'Median Center', output_numpy=True)
+    return vals if output_numpy else vals.tolist()
 
 def pols_shell_factor(vertices, faces):
     '''
@@ -217,19 +206,41 @@ def pols_shell_factor(vertices, faces):
 
     return vals
 
-def pols_center(vertices, faces, origin):
+def pols_center(vertices, faces, origin, output_numpy=False):
     '''
     Cemter of faces
     vertices: list as [vertex, vertex, ...], being each vertex [float, float, float].
     edges: list as [edge, edge,..], being each edge [int, int].
     faces: list as [polygon, polygon,..], being each polygon [int, int, ...].
     origin: String  that can be any key of pols_origin_modes_dict
+    output_numpy: if True returns numpy array
     returns vals as [float, float,...]
     '''
-    bm = bmesh_from_pydata(vertices, [], faces, normal_update=True)
-    vals = pols_origin_modes_dict[origin][1](bm.faces)
-    bm.free()
-    return vals
+    centers = np.zeros((len(faces), 3))
+    for idx, corners in _pols_corners(vertices, faces):
+        centers[idx] = np_pols_origin_modes_dict[origin](corners)
+    return centers if output_numpy else centers.tolist()
+
+def np_center_bounds(corners):
+    return (corners.min(axis=1) + corners.max(axis=1)) / 2
+
+def np_center_median(corners):
+    return corners.mean(axis=1)
+
+def np_center_median_weighted(corners):
+    # each corner is weighted by the length of its two edges
+    edge_lengths = np.linalg.norm(np.roll(corners, -1, axis=1) - corners, axis=2)
+    weights = edge_lengths + np.roll(edge_lengths, 1, axis=1)
+    # corners of faces without size are weighted equally
+    weights[weights.sum(axis=1) == 0] = 1
+    total = weights.sum(axis=1)
+    return (corners * weights[:, :, np.newaxis]).sum(axis=1) / total[:, np.newaxis]
+
+def np_first_vert(corners):
+    return corners[:, 0]
+
+def np_last_vert(corners):
+    return corners[:, -1]
 
 def pols_center_bounds(bm_faces):
     return [tuple(bm_face.calc_center_bounds()) for bm_face in bm_faces]
@@ -351,6 +362,15 @@ pols_origin_modes_dict = {
     'Last Vertex':            (34, pols_last_vert, 'First Vertex of Face'),
     }
 
+# same modes on (polygons, sides, 3) arrays of corners
+np_pols_origin_modes_dict = {
+    'Bounds Center':          np_center_bounds,
+    'Median Center':          np_center_median,
+    'Median Weighted Center': np_center_median_weighted,
+    'First Vertex':           np_first_vert,
+    'Last Vertex':            np_last_vert,
+    }
+
 # Name: (index, input_sockets, func_options, output_options, function, output_sockets, output_sockets_names, description)
 faces_modes_dict = {
     'Geometry':           (0,  'vp', '',   'u', pols_vertices,         'vs',  'Vertices, Faces', "Geometry of each face. (explode)"),
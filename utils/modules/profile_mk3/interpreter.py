@@ -57,6 +57,8 @@ class Expression(object):
     def __init__(self, expr, string):
         self.expr = expr
         self.string = string
+        # compiled once, the same expression is evaluated for each of segments
+        self.code = compile(expr, "<expression>", 'eval')
 
     def __repr__(self):
         return "Expr({})".format(self.string)
@@ -82,7 +84,7 @@ class Expression(object):
         env.update(safe_names)
         env.update(variables)
         env["__builtins__"] = {}
-        return eval(compile(self.expr, "<expression>", 'eval'), env)
+        return eval(self.code, env)
 
     def get_variables(self):
         result = {node.id for node in ast.walk(self.expr) if isinstance(node, ast.Name)}
@@ -8,6 +8,7 @@
 from mathutils import Vector
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata
 from sverchok.utils.modules.matrix_utils import matrix_normal
+from sverchok.utils.modules.mesh_adjacency import adjacency_index
 
 def center(verts):
     '''
@@ -45,12 +46,8 @@ def adjacent_edg_pol(verts, edgs_pols):
     edg_pol: list as [edge, edge,..], being each edge [int, int].
                   or [polygon, polygon,...] being each polygon [int, int, int, ...].
     '''
-    adj_edgs_pols = [[] for v in verts]
-    for ep in edgs_pols:
-        for v_id in ep:
-            adj_edgs_pols[v_id] += [ep]
-
-    return adj_edgs_pols
+    adjacent = adjacency_index(edgs_pols).vert_items(len(verts)).tolist()
+    return [[edgs_pols[i] for i in v_adj] for v_adj in adjacent]
 
 
 def adjacent_edg_pol_num(verts, edgs_pols):
@@ -60,12 +57,7 @@ def adjacent_edg_pol_num(verts, edgs_pols):
     edg_pol: list as [edge, edge,..], being each edge [int, int].
                   or [polygon, polygon,...] being each polygon [int, int, int, ...].
     '''
-    adj_edgs_pols = [0 for v in verts]
-    for edg_pol in edgs_pols:
-        for v_id in edg_pol:
-            adj_edgs_pols[v_id] += 1
-
-    return adj_edgs_pols
+    return adjacency_index(edgs_pols).vert_items(len(verts)).lengths.tolist()
 '''
 The functions bellow expect:
 vertices: list as [vertex, vertex, ...], being each vertex [float, float, float].
@@ -0,0 +1,240 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Per node statistics of tree updates.
+
+When "Collect node statistics" is enabled in preferences, the update system
+records for each processed node: wall time of process(), number of objects
+in each output socket, peak memory allocated during process() (only if
+"Trace memory" is enabled as well, since tracemalloc slows python down)
+and whether the node was actually processed or skipped by incremental
+update (cache hit). A rolling history of HISTORY_LENGTH records is kept
+per node.
+
+usage from python console:
+from sverchok.utils import node_stats
+node_stats.get_summary("NodeTree")
+node_stats.export_csv("/tmp/stats.csv")
+"""
+
+import csv
+import json
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+import bpy
+from bpy.props import EnumProperty, StringProperty
+from mathutils import Matrix
+
+from sverchok import data_structure
+from sverchok.core.socket_data import socket_data_cache
+from sverchok.utils.logging import info
+
+HISTORY_LENGTH = 100
+
+# tree name -> node name -> deque of records
+_node_stats = defaultdict(dict)
+
+# True if tracemalloc was started by start_tracing()
+_tracing_started = False
+
+STATS_FIELDS = ["tree", "node", "bl_idname", "timestamp", "duration", "output_count", "peak_memory", "cache_hit"]
+
+def is_enabled():
+    return data_structure.COLLECT_NODE_STATS
+
+def start_tracing():
+    """
+    To be called right before node.process().
+    Returns memory state which has to be passed to record_node().
+    """
+    global _tracing_started
+    if not data_structure.TRACE_NODE_MEMORY:
+        stop_tracing()
+        return None
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracing_started = True
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    return current
+
+def stop_tracing():
+    """
+    Stop tracemalloc if it was started by start_tracing(), to be called
+    when memory tracing is turned off, since tracing slows python down.
+    """
+    global _tracing_started
+    if _tracing_started and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _tracing_started = False
+
+def _peak_memory(memory_state):
+    if memory_state is None or not tracemalloc.is_tracing():
+        return None
+    current, peak = tracemalloc.get_traced_memory()
+    if not hasattr(tracemalloc, 'reset_peak'):
+        # without reset_peak() the peak can be older than this node,
+        # net allocation is the best estimation then
+        return max(current - memory_state, 0)
+    return max(peak - memory_state, 0)
+
+def _count_items(obj):
+    if isinstance(obj, Matrix):
+        return 1
+    try:
+        return len(obj)
+    except TypeError:
+        return 1
+
+def count_output_objects(node):
+    """
+    Number of items in output sockets data; for usual nested data
+    this is the number of vertices, edges etc. of all objects,
+    a matrix counts as one object.
+    """
+    tree_cache = socket_data_cache.get(node.id_data.name, {})
+    count = 0
+    for socket in node.outputs:
+        data = tree_cache.get(socket.socket_id)
+        if data is None:
+            continue
+        try:
+            count += sum(_count_items(obj) for obj in data)
+        except TypeError:
+            count += 1
+    return count
+
+def record_node(node, duration, memory_state=None, skipped=False):
+    """
+    Store statistics of one node update
+    """
+    tree_name = node.id_data.name
+    history = _node_stats[tree_name].get(node.name)
+    if history is None:
+        history = _node_stats[tree_name][node.name] = deque(maxlen=HISTORY_LENGTH)
+    history.append({
+        "tree": tree_name,
+        "node": node.name,
+        "bl_idname": node.bl_idname,
+        "timestamp": time.time(),
+        "duration": duration,
+        "output_count": count_output_objects(node),
+        "peak_memory": None if skipped else _peak_memory(memory_state),
+        "cache_hit": skipped
+    })
+
+def get_node_stats(tree_name=None):
+    """
+    All stored records, as a list of dicts,
+    for one tree or for all trees if tree_name is None.
+    """
+    tree_names = [tree_name] if tree_name else list(_node_stats.keys())
+    records = []
+    for name in tree_names:
+        for history in _node_stats.get(name, {}).values():
+            records.extend(history)
+    records.sort(key=lambda r: r["timestamp"])
+    return records
+
+def get_summary(tree_name=None):
+    """
+    Aggregated statistics: (tree name, node name) -> dict with
+    count of updates, mean/max/last duration, last output count,
+    max peak memory, cache hits and misses.
+    """
+    summary = {}
+    tree_names = [tree_name] if tree_name else list(_node_stats.keys())
+    for name in tree_names:
+        for node_name, history in _node_stats.get(name, {}).items():
+            processed = [r for r in history if not r["cache_hit"]]
+            durations = [r["duration"] for r in processed]
+            memory = [r["peak_memory"] for r in processed if r["peak_memory"] is not None]
+            summary[(name, node_name)] = {
+                "updates": len(history),
+                "mean_duration": sum(durations) / len(durations) if durations else 0.0,
+                "max_duration": max(durations) if durations else 0.0,
+                "last_duration": durations[-1] if durations else 0.0,
+                "output_count": history[-1]["output_count"],
+                "peak_memory": max(memory) if memory else None,
+                "cache_hits": len(history) - len(processed),
+                "cache_misses": len(processed)
+            }
+    return summary
+
+def export_json(path, tree_name=None):
+    with open(path, 'w') as f:
+        json.dump(get_node_stats(tree_name), f, indent=2)
+    info("Node statistics saved to %s", path)
+
+def export_csv(path, tree_name=None):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=STATS_FIELDS)
+        writer.writeheader()
+        writer.writerows(get_node_stats(tree_name))
+    info("Node statistics saved to %s", path)
+
+def reset_stats(tree_name=None):
+    if tree_name:
+        _node_stats.pop(tree_name, None)
+    else:
+        _node_stats.clear()
+
+
+class SvNodeStatsExport(bpy.types.Operator):
+    """Save collected node statistics to file"""
+    bl_idname = "node.sverchok_node_stats_export"
+    bl_label = "Save node statistics"
+    bl_options = {'INTERNAL'}
+
+    formats = [
+            ("CSV", "CSV", "Comma separated values", 0),
+            ("JSON", "JSON", "List of JSON records", 1)
+        ]
+
+    file_format: EnumProperty(name = "Format",
+            description = "Format of the file",
+            items = formats,
+            default = "CSV")
+
+    filepath: StringProperty(subtype="FILE_PATH")
+
+    def execute(self, context):
+        if self.file_format == "CSV":
+            export_csv(self.filepath)
+        else:
+            export_json(self.filepath)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class SvNodeStatsReset(bpy.types.Operator):
+    """Reset collected node statistics"""
+    bl_idname = "node.sverchok_node_stats_reset"
+    bl_label = "Reset node statistics"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        reset_stats()
+        info("Node statistics cleared.")
+        return {'FINISHED'}
+
+classes = [SvNodeStatsExport, SvNodeStatsReset]
+
+def register():
+    for class_name in classes:
+        bpy.utils.register_class(class_name)
+
+def unregister():
+    stop_tracing()
+    for class_name in reversed(classes):
+        bpy.utils.unregister_class(class_name)
@@ -0,0 +1,245 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Classification of points as inside or outside of a mesh, on NumPy arrays.
+
+Two tests are available:
+
+ray parity - a ray is cast from each point and its crossings with the
+    triangles of the mesh are counted, odd count means inside.
+    Triangles are projected on the plane normal to the ray and binned in
+    a 2D grid once per direction, then points are processed in chunks,
+    each point being tested only against the triangles of its grid cell.
+    Several ray directions can vote. The test is exact for closed meshes
+    (each edge used by an even number of faces), orientation of faces
+    does not matter.
+
+generalized winding number - sum of solid angles of all triangles seen
+    from the point, divided by 4*pi. It is close to 1 inside and 0 outside,
+    and degrades gracefully for meshes with holes or other non manifold
+    defects, but costs (points x triangles) operations.
+
+usage:
+mask = points_inside_mesh(verts, faces, points)
+"""
+
+import numpy as np
+
+from sverchok.utils.ragged_array import RaggedArray
+from sverchok.utils.modules.mesh_adjacency import adjacency_index
+from sverchok.utils.csg_numpy import RAY_DIRECTION
+
+# points per chunk of the ray parity test
+CHUNK_SIZE = 2 ** 16
+# point - triangle pairs per chunk of the winding number test
+WINDING_CHUNK = 2 ** 18
+
+# number of directions which must report the point as inside,
+# for each number of directions (as in the Multisample mode of Points Inside Mesh node)
+VOTES_NEEDED = {1: 1, 2: 1, 3: 2, 4: 3, 5: 4, 6: 4}
+
+
+def mesh_triangles(faces):
+    """
+    Fan triangulation of faces (list of polygons or RaggedArray),
+    returns (n, 3) array of vertex indices.
+    """
+    if not isinstance(faces, RaggedArray):
+        faces = RaggedArray.from_list(faces, dtype=np.int64)
+    counts = np.maximum(faces.lengths - 2, 0)
+    face = np.repeat(np.arange(len(faces)), counts)
+    local = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    first = faces.offsets[:-1][face]
+    values = faces.values
+    return np.stack((values[first], values[first + local + 1], values[first + local + 2]), axis=-1)
+
+
+def is_closed(faces):
+    """
+    True if each edge of the mesh is used by an even number of faces,
+    which is what the ray parity test needs to be exact.
+    """
+    if len(faces) == 0:
+        return True
+    return bool(np.all(adjacency_index(faces).edge_items().lengths % 2 == 0))
+
+
+def _ray_frame(direction):
+    """
+    Rotation matrix with rows (u, v, direction), u and v span the projection plane.
+    """
+    z = np.asarray(direction, dtype=np.float64)
+    z = z / np.linalg.norm(z)
+    helper = [1.0, 0.0, 0.0] if abs(z[0]) < 0.9 else [0.0, 1.0, 0.0]
+    x = np.cross(z, helper)
+    x /= np.linalg.norm(x)
+    return np.array([x, np.cross(z, x), z])
+
+
+class RayCrossings:
+    """
+    Triangles of a mesh projected along the ray direction and binned in a
+    uniform 2D grid; counts crossings of rays from any number of points.
+
+    Shared edges and vertices are assigned to exactly one of the triangles
+    (by the top-left rule of rasterizers), so a ray going through an edge
+    is counted once.
+    """
+    # grid cells per triangle along each axis of the grid
+    GRID_DENSITY = 2
+
+    def __init__(self, verts, triangles, direction):
+        self.frame = _ray_frame(direction)
+        projected = np.asarray(verts, dtype=np.float64) @ self.frame.T
+        count = len(triangles)
+        self.origin = projected[triangles.reshape(-1), :2].min(axis=0) if count else np.zeros(2)
+        uv = projected[:, :2] - self.origin
+        tri_uv = uv[triangles]
+
+        a, b, c = tri_uv[:, 0], tri_uv[:, 1], tri_uv[:, 2]
+        area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+        self.tri_uv = tri_uv
+        self.orientation = np.sign(area)
+        # direction of edges ab, bc, ca in counter-clockwise order,
+        # edges going down or horizontal to the left own the points on them
+        sides = (np.roll(tri_uv, -1, axis=1) - tri_uv) * self.orientation[:, np.newaxis, np.newaxis]
+        self.top_left = (sides[:, :, 1] < 0) | ((sides[:, :, 1] == 0) & (sides[:, :, 0] < 0))
+
+        # depth of the triangle plane as D + Dx * p.x + Dy * p.y
+        depth = projected[:, 2][triangles]
+        # the barycentric weight of a vertex is the edge function of the opposite edge,
+        # which is linear in p: (start - p) x (end - p) = C + A * p.x + B * p.y
+        start, end = np.roll(tri_uv, -1, axis=1), np.roll(tri_uv, 1, axis=1)
+        coefficients = (start[:, :, 0] * end[:, :, 1] - start[:, :, 1] * end[:, :, 0],
+                        start[:, :, 1] - end[:, :, 1],
+                        end[:, :, 0] - start[:, :, 0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.depth_plane = np.stack([np.sum(coef * depth, axis=1) / area for coef in coefficients], axis=-1)
+
+        self.resolution = max(1, int(self.GRID_DENSITY * np.sqrt(count)))
+        lo = tri_uv.min(axis=1)
+        hi = tri_uv.max(axis=1)
+        size = hi.max(axis=0) / self.resolution if count else np.ones(2)
+        self.cell_size = np.where(size > 0, size, 1.0)
+        self.cells = self._bin(self._cell(lo), self._cell(hi))
+
+    def _cell(self, uv):
+        return np.floor(uv / self.cell_size).astype(np.int64)
+
+    def _bin(self, lo, hi):
+        """
+        RaggedArray of triangles overlapping each cell, by their bounding boxes
+        """
+        n = self.resolution
+        lo = np.clip(lo, 0, n - 1)
+        hi = np.clip(hi, 0, n - 1)
+        sizes = hi - lo + 1
+        counts = sizes[:, 0] * sizes[:, 1]
+        tri = np.repeat(np.arange(len(lo)), counts)
+        local = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        width = sizes[tri, 0]
+        keys = (lo[tri, 1] + local // width) * n + lo[tri, 0] + local % width
+        order = np.argsort(keys, kind='stable')
+        return RaggedArray.from_lengths(tri[order], np.bincount(keys, minlength=n * n))
+
+    def count(self, points):
+        """
+        Number of triangles crossed by the ray from each of points
+        """
+        projected = np.asarray(points, dtype=np.float64).reshape((-1, 3)) @ self.frame.T
+        projected[:, :2] -= self.origin
+        result = np.zeros(len(projected), dtype=np.int64)
+        cell = self._cell(projected[:, :2])
+        valid = np.all((cell >= 0) & (cell < self.resolution), axis=1)
+        candidates = self.cells.take(cell[valid, 1] * self.resolution + cell[valid, 0])
+        point = np.repeat(np.flatnonzero(valid), candidates.lengths)
+        tri = candidates.values
+        if len(tri) == 0:
+            return result
+
+        corners = self.tri_uv[tri] - projected[point, np.newaxis, :2]
+        following = corners[:, [1, 2, 0]]
+        # (a - p) x (b - p) for edges ab, bc, ca: the same edge of the neighbour triangle
+        # gets exactly negated value, edges meeting at p get exactly zero
+        edge = corners[:, :, 0] * following[:, :, 1] - corners[:, :, 1] * following[:, :, 0]
+        orientation = self.orientation[tri]
+        edge *= orientation[:, np.newaxis]
+        covered = (edge > 0) | ((edge == 0) & self.top_left[tri])
+        hit = (orientation != 0) & np.all(covered, axis=1)
+
+        tri, point = tri[hit], point[hit]
+        plane = self.depth_plane[tri]
+        depth = plane[:, 0] + projected[point, 0] * plane[:, 1] + projected[point, 1] * plane[:, 2]
+        in_front = depth > projected[point, 2]
+        return result + np.bincount(point[in_front], minlength=len(result))
+
+
+def ray_parity_inside(verts, triangles, points, directions=None, votes=None, chunk_size=CHUNK_SIZE):
+    """
+    verts: (n, 3) array, triangles: (m, 3) array of vertex indices, points: (k, 3) array
+    directions: directions of rays, one ray per point per direction
+    votes: number of directions which must report the point as inside,
+           by default taken from VOTES_NEEDED (or a majority)
+    returns boolean array
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    directions = np.asarray(directions if directions is not None else [RAY_DIRECTION], dtype=np.float64).reshape((-1, 3))
+    if votes is None:
+        votes = VOTES_NEEDED.get(len(directions), len(directions) // 2 + 1)
+    total = np.zeros(len(points), dtype=np.int64)
+    if len(triangles) == 0:
+        return total > 0
+    for direction in directions:
+        crossings = RayCrossings(verts, triangles, direction)
+        for start in range(0, len(points), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            total[chunk] += crossings.count(points[chunk]) % 2
+    return total >= votes
+
+
+def generalized_winding_numbers(verts, triangles, points, chunk_size=WINDING_CHUNK):
+    """
+    Sum of signed solid angles of triangles seen from each point, divided by 4*pi
+    (formula of Van Oosterom and Strackee); 1 inside and 0 outside of a closed mesh
+    with outwards facing normals, -1 inside for inwards facing ones.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    tris = np.asarray(verts, dtype=np.float64)[triangles]
+    result = np.zeros(len(points))
+    if len(tris) == 0:
+        return result
+    step = max(1, chunk_size // len(tris))
+    for start in range(0, len(points), step):
+        chunk = points[start:start + step]
+        a, b, c = (tris[np.newaxis, :, i] - chunk[:, np.newaxis] for i in range(3))
+        la, lb, lc = (np.linalg.norm(x, axis=-1) for x in (a, b, c))
+        det = np.einsum('ijk,ijk->ij', a, np.cross(b, c))
+        dots = np.einsum('ijk,ijk->ij', a, b) * lc + np.einsum('ijk,ijk->ij', b, c) * la + np.einsum('ijk,ijk->ij', c, a) * lb
+        result[start:start + step] = np.sum(np.arctan2(det, la * lb * lc + dots), axis=1) / (2 * np.pi)
+    return result
+
+
+def points_inside_mesh(verts, faces, points, directions=None, method='AUTO', chunk_size=CHUNK_SIZE):
+    """
+    verts: list or array of vertices, faces: list of polygons, points: list or array of points
+    directions: directions of rays for the ray parity test
+    method: 'PARITY' - ray parity test,
+            'WINDING' - generalized winding number,
+            'AUTO' - ray parity for closed meshes, winding number otherwise;
+            the winding number visits every triangle for every point, so it is
+            much slower than ray parity for big meshes
+    returns boolean NumPy array, True for points inside of the mesh
+    """
+    if method == 'AUTO':
+        method = 'PARITY' if is_closed(faces) else 'WINDING'
+    triangles = mesh_triangles(faces)
+    if method == 'PARITY':
+        return ray_parity_inside(verts, triangles, points, directions, chunk_size=chunk_size)
+    if method == 'WINDING':
+        return np.abs(generalized_winding_numbers(verts, triangles, points)) >= 0.5
+    raise ValueError("Unsupported method: {}".format(method))
@@ -5,23 +5,24 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import os
+from glob import glob, escape
+
 import numpy as np
 
+from sverchok.utils.spatial_hash import neighbour_pairs
+
 def cross_indices3(n):
     '''create crossed indices'''
 
-    nu = np.sum(np.arange(n, dtype=np.int64))
-    ind = np.zeros((nu, 2), dtype=np.int16)
-    c = 0
-    for i in range(n-1):
-        l = n-i-1
-        np_i = np.full(n-i-1, i, dtype=np.int32)
-        np_j = np.arange(i+1, n, dtype=np.int32)
-        np_a = np.stack((np_i, np_j), axis=-1)
-        ind[c:c+l, :] = np_a
-        c += l
+    return np.stack(np.triu_indices(n, 1), axis=-1)
 
-    return ind
+
+def add_pair_forces(result, indices, forces):
+    '''sum forces into resultant of particles, indices may repeat'''
+    v_len = len(result)
+    for axis in range(3):
+        result[:, axis] += np.bincount(indices, weights=forces[:, axis], minlength=v_len)
 
 
 def numpy_match_long_repeat(p):
@@ -74,11 +75,16 @@ def self_react(params):
     '''behaviors between particles: collide, attract and fit'''
     ps, collision, sum_rad, gates, att_params, fit_params = params
     use_collide, use_attract, use_grow = gates
-    indexes = ps.params['indexes']
-    if use_grow:
+    if ps.params['sparse_pairs']:
+        # without attraction only particles closer than sum of radius interact
+        indexes = neighbour_pairs(ps.verts, 2 * np.max(ps.rads))
         sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
-        if use_attract:
-            att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
+    else:
+        indexes = ps.params['indexes']
+        if use_grow:
+            sum_rad = ps.rads[indexes[:, 0]] + ps.rads[indexes[:, 1]]
+    if use_grow and use_attract:
+        att_params[2] = ps.mass[indexes[:, 0]] * ps.mass[indexes[:, 1]]
     dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
     dist = np.linalg.norm(dif_v, axis=1)
     mask = sum_rad > dist
@@ -88,17 +94,14 @@ def self_react(params):
     some_attractions = use_attract and(len(index_inter) < len(indexes))
 
     if some_collisions or some_attractions:
-        result = np.zeros((ps.v_len, ps.v_len, 3), dtype=np.float64)
         dist_cor = np.clip(dist, 1e-6, 1e4)
         normal_v = dif_v/dist_cor[:, np.newaxis]
 
         if some_collisions:
-            self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, collision)
+            self_collision_force(ps.r, dist, sum_rad, index_inter, mask, normal_v, collision)
         if some_attractions:
             antimask = np.invert(mask)
-            attract_force(result, dist_cor, antimask, indexes, normal_v, att_params)
-
-        ps.r += np.sum(result, axis=1)
+            attract_force(ps.r, dist_cor, antimask, indexes, normal_v, att_params)
 
     if use_grow:
         fit_force(ps, index_inter, fit_params)
@@ -117,8 +120,8 @@ def self_collision_force(result, dist, sum_rad, index_inter, mask, normal_v, sel
     sf = self_collision[:, np.newaxis]
     len0, len1 = [sf[id1], sf[id0]] if variable_coll else [sf, sf]
 
-    result[id0, id1, :] = -no * le * len0
-    result[id1, id0, :] = no * le * len1
+    add_pair_forces(result, id0, -no * le * len0)
+    add_pair_forces(result, id1, no * le * len1)
 
 
 def attract_force(result, dist, mask, index, norm_v, att_params):
@@ -137,15 +140,15 @@ def attract_force(result, dist, mask, index, norm_v, att_params):
     att = attract
     len0, len1 = [att[id1], att[id0]] if variable_att else [att, att]
 
-    result[id0, id1, :] = - direction * len0
-    result[id1, id0, :] = direction * len1
+    add_pair_forces(result, id0, - direction * len0)
+    add_pair_forces(result, id1, direction * len1)
 
 
 def fit_force(ps, index_inter, fit_params):
     '''the untouched particles will grow, the ones that collide will shrink'''
     grow, min_rad, max_rad = fit_params
     touch = np.unique(index_inter)
-    free = np.setdiff1d(np.arange(ps.v_len, dtype=np.int16), touch)
+    free = np.setdiff1d(np.arange(ps.v_len), touch)
     v_grow = len(grow) > 1
     grow_un, grow_tou = [grow[free], grow[touch]] if v_grow else [grow, grow]
     ps.rads[free] += grow_un*0.1
@@ -172,8 +175,14 @@ def self_react_setup(ps, dicti, forces_composite):
     if not use_self_react:
         return
 
-    ps.params['indexes'] = cross_indices3(ps.v_len)
-    sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    # attraction acts between all particles, the other behaviors
+    # only between close ones, so only neighbour pairs are searched
+    ps.params['sparse_pairs'] = not use_attract
+    if use_attract:
+        ps.params['indexes'] = cross_indices3(ps.v_len)
+        sum_rad = ps.rads[ps.params['indexes'][:, 0]] + ps.rads[ps.params['indexes'][:, 1]]
+    else:
+        sum_rad = None
 
     att_params = att_setup(use_attract, ps, np_attract, att_decay)
     fit_params = fit_setup(use_grow, np_grow, min_rad, max_rad)
@@ -408,8 +417,8 @@ def random_setup(ps, dicti, forces_composite):
             random_force = np_random_force[:, np.newaxis]
             random_variation = np_random_variation[:, np.newaxis]
             random_variate = any(random_variation != 0)
-            np.random.seed(random_seed[0])
-            ps.random_v = random_force * np.random.random((ps.v_len, 3)) - random_force / 2
+            ps.random_state.seed(random_seed[0])
+            ps.random_v = random_force * ps.random_state.random_sample((ps.v_len, 3)) - random_force / 2
             random_params = [ps, random_force, random_variate, random_variation]
             forces_composite[0].append(local_func)
             forces_composite[1].append(random_params)
@@ -419,7 +428,7 @@ def random_force_apply(params):
     '''apply random vectors and change it'''
     ps, random_force, random_variate, random_variation = params
     if random_variate:
-        random_var = 2 * random_force * np.random.random((ps.v_len, 3)) - random_force
+        random_var = 2 * random_force * ps.random_state.random_sample((ps.v_len, 3)) - random_force
         ps.random_v = ps.random_v * (1 - random_variation) + random_var * random_variation
     ps.r += ps.random_v
 
@@ -639,6 +648,8 @@ class PulgaSystem():
         self.main_setup(init_params)
         self.mass = self.density * np.power(self.rads, 3)
         self.random_v = []
+        # own generator, so the simulation neither depends on nor changes numpy global state
+        self.random_state = np.random.RandomState()
         self.r = np.zeros((self.v_len, 3), dtype=np.float64)
         self.index = np.arange(self.v_len)
 
@@ -690,6 +701,32 @@ class PulgaSystem():
         else:
             self.hard_update(cache, size_change, pins_gates)
 
+    def get_state(self):
+        '''copy of the data changing between iterations'''
+        random_state = self.random_state.get_state()
+        return {
+            "verts": np.array(self.verts, dtype=np.float64),
+            "rads": np.array(self.rads, dtype=np.float64),
+            "vel": np.array(self.vel, dtype=np.float64),
+            "mass": np.array(self.mass, dtype=np.float64),
+            "random_v": np.array(self.random_v, dtype=np.float64),
+            "reactions": np.array(self.params["Pins Reactions"], dtype=np.float64),
+            "random_keys": random_state[1],
+            "random_pos": np.array(random_state[2:], dtype=np.float64)
+            }
+
+    def set_state(self, state):
+        '''continue from a state returned by get_state'''
+        self.verts = state["verts"].copy()
+        self.rads = state["rads"].copy()
+        self.vel = state["vel"].copy()
+        self.mass = state["mass"].copy()
+        if len(state["random_v"]) > 0:
+            self.random_v = state["random_v"].copy()
+        self.params["Pins Reactions"] = state["reactions"].copy()
+        pos, has_gauss, cached_gaussian = state["random_pos"]
+        self.random_state.set_state(("MT19937", state["random_keys"], int(pos), int(has_gauss), cached_gaussian))
+
     def apply_forces(self):
         '''resultant --> acceleration --> speed --> position'''
         acc = self.r / self.mass[:, np.newaxis]
@@ -796,7 +833,111 @@ def local_dict(dictionaries, name):
     return [dictionaries[0][name], dictionaries[1][name], dictionaries[2][name]]
 
 
-def pulga_system_init(params, parameters, gates, out_lists, cache):
+class PulgaSimulation():
+    '''
+    Keeps the state of a system between updates, so asking for more iterations
+    continues from the last computed one instead of starting from scratch.
+    Every snapshot_interval iterations the state is saved to a .npz file in
+    checkpoint_dir, asking for fewer iterations resumes from the nearest one.
+    The key identifies the inputs, when it changes stored states are dropped.
+    '''
+    def __init__(self):
+        self.key = None
+        self.checkpoint_dir = None
+        self.snapshot_interval = 0
+        self.iteration = 0
+        self.state = None
+        self.snapshots = None
+
+    def setup(self, key, checkpoint_dir, snapshot_interval):
+        '''drop stored states if inputs (key) or snapshots folder changed'''
+        if key != self.key or checkpoint_dir != self.checkpoint_dir:
+            self.clear()
+            self.key = key
+            self.checkpoint_dir = checkpoint_dir
+        self.snapshot_interval = snapshot_interval
+
+    def clear(self):
+        '''forget the state and remove snapshot files'''
+        if self.key is not None and self.checkpoint_dir:
+            for path in self.snapshot_files():
+                os.remove(path)
+        self.iteration = 0
+        self.state = None
+        self.snapshots = None
+
+    def snapshot_path(self, iteration):
+        return os.path.join(self.checkpoint_dir, "pulga_{}_{}.npz".format(self.key, iteration))
+
+    def snapshot_files(self):
+        return glob(os.path.join(escape(self.checkpoint_dir), "pulga_{}_*.npz".format(self.key)))
+
+    def get_snapshots(self):
+        '''iterations with a snapshot file, files of previous sessions included'''
+        if self.snapshots is None:
+            self.snapshots = set()
+            if self.checkpoint_dir:
+                for path in self.snapshot_files():
+                    iteration = os.path.splitext(path)[0].rsplit('_', 1)[1]
+                    if iteration.isdigit():
+                        self.snapshots.add(int(iteration))
+        return self.snapshots
+
+    def save_snapshot(self, ps, iteration):
+        if not self.checkpoint_dir:
+            return
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        np.savez(self.snapshot_path(iteration), **ps.get_state())
+        self.get_snapshots().add(iteration)
+
+    def iteration_done(self, ps, iteration):
+        '''to be called after each iteration'''
+        interval = self.snapshot_interval
+        if interval > 0 and iteration % interval == 0 and iteration not in self.get_snapshots():
+            self.save_snapshot(ps, iteration)
+
+    def store(self, ps, iteration):
+        '''keep the last computed state in memory'''
+        self.state = ps.get_state()
+        self.iteration = iteration
+
+    def restore(self, ps, target):
+        '''
+        put the latest stored state not beyond target iteration into the system,
+        returns the iteration of that state (0 if there was none)
+        '''
+        iteration = self.iteration if self.state is not None and self.iteration <= target else 0
+        snapshot = max((it for it in self.get_snapshots() if iteration < it <= target), default=0)
+        if snapshot:
+            with np.load(self.snapshot_path(snapshot)) as data:
+                ps.set_state({name: data[name] for name in data.files})
+            return snapshot
+        if iteration:
+            ps.set_state(self.state)
+        return iteration
+
+
+# node id, object index -> PulgaSimulation
+pulga_simulations = {}
+
+def get_simulation(sim_id, key, checkpoint_dir, snapshot_interval):
+    '''stored simulation of the object, dropping states if the key changed'''
+    simulation = pulga_simulations.get(sim_id)
+    if simulation is None:
+        simulation = pulga_simulations[sim_id] = PulgaSimulation()
+    simulation.setup(key, checkpoint_dir, snapshot_interval)
+    return simulation
+
+def drop_simulations(node_key, keep=0):
+    '''
+    forget stored states of the node (snapshot files stay on disk),
+    except for its first keep objects
+    '''
+    for sim_id in [sim_id for sim_id in pulga_simulations if sim_id[0] == node_key and sim_id[1] >= keep]:
+        del pulga_simulations[sim_id]
+
+
+def pulga_system_init(params, parameters, gates, out_lists, cache, simulation=None):
     '''the main function of the engine'''
 
     dictionaries = [FUNC_DICT, gates, {}]
@@ -817,18 +958,30 @@ def pulga_system_init(params, parameters, gates, out_lists, cache):
         if len(cache) > 0:
             ps.hard_update_list(cache, gates["self_react"][2], gates["Pins"])
 
-    iterate(iterations_max, force_map, force_parameters, out_params)
+    start = 0
+    if simulation is not None:
+        start = simulation.restore(ps, min(iterations))
+        if start > 0:
+            # the restored iteration may be one of the asked ones
+            output_data(start - 1, out_params)
+
+    iterate(iterations_max, force_map, force_parameters, out_params, start, simulation)
+
+    if simulation is not None:
+        simulation.store(ps, iterations_max)
 
     return ps.verts, ps.rads, ps.vel, ps.params["Pins Reactions"]
 
 
-def iterate(iterations_max, force_map, force_parameters, out_params):
+def iterate(iterations_max, force_map, force_parameters, out_params, start=0, simulation=None):
     ''' execute repeatedly the defined force map'''
     num_forces = len(force_map)
-    for it in range(iterations_max):
+    for it in range(start, iterations_max):
         for i in range(num_forces):
             force_map[i](force_parameters[i])
         output_data(it, out_params)
+        if simulation is not None:
+            simulation.iteration_done(out_params[1], it + 1)
 
 
 def output_data(it, params):
@@ -0,0 +1,277 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Offset encoded (CSR-like) storage for ragged data, such as faces of a mesh.
+
+All items are stored in one flat array of values, items boundaries are
+kept in offsets array of length len(items) + 1, so item i is
+values[offsets[i]:offsets[i+1]].
+
+usage:
+faces = RaggedArray.from_list([[0, 1, 2], [0, 2, 3, 4]])
+faces.lengths -> array([3, 4])
+faces[1] -> array([0, 2, 3, 4])
+(faces + 10).tolist() -> [[10, 11, 12], [10, 12, 13, 14]]
+
+RaggedArray can be passed through sockets as an item of object level list,
+(one RaggedArray per object); nodes which do not declare
+sv_accepts_ragged = True get it converted to lists by the socket system.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+
+class RaggedArray:
+
+    __slots__ = ('values', 'offsets')
+
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = offsets
+
+    @classmethod
+    def from_list(cls, items, dtype=None):
+        """
+        Build from list of lists (faces) or list of lists of vectors.
+        """
+        lengths = np.fromiter(map(len, items), dtype=np.int64, count=len(items))
+        flat = list(chain.from_iterable(items))
+        if flat:
+            values = np.array(flat, dtype=dtype)
+        else:
+            values = np.zeros(0, dtype=dtype or np.int64)
+        return cls.from_lengths(values, lengths)
+
+    @classmethod
+    def from_lengths(cls, values, lengths):
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(values, offsets)
+
+    @classmethod
+    def from_array(cls, array):
+        """
+        Build from regular 2D array (e.g. all faces are triangles).
+        """
+        array = np.asarray(array)
+        count, size = array.shape[:2]
+        offsets = np.arange(0, (count + 1) * size, size, dtype=np.int64)
+        return cls(array.reshape((count * size,) + array.shape[2:]), offsets)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """
+        Join several ragged arrays into one, items are kept as is.
+        """
+        if not arrays:
+            return cls(np.zeros(0, dtype=np.int64), np.zeros(1, dtype=np.int64))
+        values = np.concatenate([a.values for a in arrays])
+        lengths = np.concatenate([a.lengths for a in arrays])
+        return cls.from_lengths(values, lengths)
+
+    @property
+    def lengths(self):
+        return np.diff(self.offsets)
+
+    @property
+    def item_index(self):
+        """
+        Index of item, each of values belongs to.
+        """
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.lengths)
+
+    def is_regular(self):
+        """
+        True if all items have the same length.
+        """
+        lengths = self.lengths
+        return len(lengths) == 0 or bool(np.all(lengths == lengths[0]))
+
+    def to_array(self):
+        """
+        Return regular 2D array, items must be of the same length.
+        """
+        if not self.is_regular():
+            raise ValueError("Items of RaggedArray have different lengths")
+        count = len(self)
+        return self.values.reshape((count, -1) + self.values.shape[1:])
+
+    def tolist(self):
+        flat = self.values.tolist()
+        offsets = self.offsets.tolist()
+        return [flat[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def take(self, indices):
+        """
+        Select items by indices, returns new RaggedArray.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        lengths = self.lengths[indices]
+        starts = self.offsets[:-1][indices]
+        result_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=result_offsets[1:])
+        # index of each value within its item
+        local = np.arange(result_offsets[-1], dtype=np.int64) - np.repeat(result_offsets[:-1], lengths)
+        return RaggedArray(self.values[np.repeat(starts, lengths) + local], result_offsets)
+
+    def __add__(self, other):
+        """
+        Shift values (e.g. vertex indices) by a number.
+        """
+        return RaggedArray(self.values + other, self.offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self.take(np.arange(len(self))[idx])
+        if idx < 0:
+            idx += len(self)
+        return self.values[self.offsets[idx]:self.offsets[idx + 1]]
+
+    def __iter__(self):
+        values = self.values
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            yield values[start:end]
+
+    def __repr__(self):
+        return "<RaggedArray of {} items, {} values>".format(len(self), len(self.values))
+
+
+def ragged_to_lists(data):
+    """
+    Convert RaggedArray items of object level list to lists,
+    other data is returned as is.
+    Nodes put RaggedArray into each item of the list or into none of them,
+    so only the first item is checked and other data is not scanned.
+    """
+    if isinstance(data, RaggedArray):
+        return data.tolist()
+    if isinstance(data, (list, tuple)) and data and isinstance(data[0], RaggedArray):
+        return [item.tolist() if isinstance(item, RaggedArray) else item for item in data]
+    return data
+
+
+#####################################################
+################ list matching magic ################
+#####################################################
+
+# These are counterparts of match_long_repeat & co from data_structure.py,
+# working on RaggedArray without building python lists.
+# Level 1 means matching the number of items (objects), level 2 - matching
+# lengths of each pair of items, deeper levels work if values of
+# RaggedArray are RaggedArray in turn.
+
+def _take(data, indices):
+    if isinstance(data, RaggedArray):
+        return data.take(indices)
+    return data[indices]
+
+def _match_local_indices(lengths, mode):
+    """
+    lengths: list of integer arrays (one per input) of equal size.
+    Returns target lengths, target offsets and for each input the index
+    of source element within its item, for each element of the result.
+    """
+    stacked = np.stack([np.asarray(l, dtype=np.int64) for l in lengths])
+    if mode == "SHORT":
+        target = stacked.min(axis=0)
+    elif mode in {"REPEAT", "CYCLE"}:
+        # like in zip(), an empty item makes the whole matched item empty
+        target = np.where(stacked.min(axis=0) > 0, stacked.max(axis=0), 0)
+    elif mode in {"XREF", "XREF2"}:
+        target = stacked.prod(axis=0)
+    else:
+        raise ValueError("Unsupported list match mode: {}".format(mode))
+
+    target_offsets = np.zeros(len(target) + 1, dtype=np.int64)
+    np.cumsum(target, out=target_offsets[1:])
+    positions = np.arange(target_offsets[-1], dtype=np.int64) - np.repeat(target_offsets[:-1], target)
+
+    if mode == "XREF":
+        # first input changes slowest
+        strides = np.cumprod(stacked[::-1], axis=0)[::-1]
+        strides = np.concatenate((strides[1:], np.ones((1, stacked.shape[1]), dtype=np.int64)))
+    elif mode == "XREF2":
+        # first input changes fastest
+        strides = np.cumprod(stacked, axis=0)
+        strides = np.concatenate((np.ones((1, stacked.shape[1]), dtype=np.int64), strides[:-1]))
+
+    local_indices = []
+    for k, item_lengths in enumerate(stacked):
+        if mode == "SHORT":
+            local = positions
+        else:
+            repeated_lengths = np.repeat(item_lengths, target)
+            if mode == "REPEAT":
+                local = np.minimum(positions, repeated_lengths - 1)
+            elif mode == "CYCLE":
+                local = positions % repeated_lengths
+            else:
+                local = (positions // np.repeat(strides[k], target)) % repeated_lengths
+        local_indices.append(local)
+    return target, target_offsets, local_indices
+
+def ragged_match(arrays, mode="REPEAT", level=2):
+    """
+    Match list of RaggedArray (or numpy arrays, for level=1) in one of
+    list match modes ("SHORT", "CYCLE", "REPEAT", "XREF", "XREF2").
+    Returns list of matched arrays.
+
+    ragged_match([[[1,2,3], [4]], [[10], [20,21]]], "REPEAT")
+        -> [[[1,2,3], [4,4]], [[10,10,10], [20,21]]]  (as RaggedArray)
+    """
+    counts = [np.array([len(a)], dtype=np.int64) for a in arrays]
+    _, _, local_indices = _match_local_indices(counts, mode)
+    if mode in {"SHORT", "REPEAT", "CYCLE"}:
+        # items which are already of target count stay in place
+        arrays = [a if len(a) == len(idx) else _take(a, idx) for a, idx in zip(arrays, local_indices)]
+    else:
+        arrays = [_take(a, idx) for a, idx in zip(arrays, local_indices)]
+    if level <= 1:
+        return arrays
+
+    _, target_offsets, local_indices = _match_local_indices([a.lengths for a in arrays], mode)
+    target = np.diff(target_offsets)
+    values = [_take(a.values, np.repeat(a.offsets[:-1], target) + local)
+                for a, local in zip(arrays, local_indices)]
+    if level > 2:
+        values = ragged_match(values, mode, level - 1)
+    return [RaggedArray(v, target_offsets) for v in values]
+
+def ragged_match_long_repeat(arrays, level=2):
+    '''match RaggedArray items by repeating last value'''
+    return ragged_match(arrays, "REPEAT", level)
+
+def ragged_match_long_cycle(arrays, level=2):
+    '''match RaggedArray items by cycling values'''
+    return ragged_match(arrays, "CYCLE", level)
+
+def ragged_match_short(arrays, level=2):
+    '''match RaggedArray items by cutting to the shortest one'''
+    return ragged_match(arrays, "SHORT", level)
+
+def ragged_match_cross(arrays, level=2):
+    '''cross reference RaggedArray items'''
+    return ragged_match(arrays, "XREF", level)
+
+def ragged_match_cross2(arrays, level=2):
+    '''cross reference RaggedArray items, cycling the first array fastest'''
+    return ragged_match(arrays, "XREF2", level)
+
+ragged_list_match_func = {
+    "SHORT":  ragged_match_short,
+    "CYCLE":  ragged_match_long_cycle,
+    "REPEAT": ragged_match_long_repeat,
+    "XREF":   ragged_match_cross,
+    "XREF2":  ragged_match_cross2
+    }
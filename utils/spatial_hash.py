@@ -0,0 +1,60 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+from itertools import product
+
+import numpy as np
+
+
+def half_neighbours(dimensions):
+    '''cell offsets to half of the neighbour cells (the other half is reached
+    from the neighbours), so every pair of neighbour cells is visited only once'''
+    zero = (0,) * dimensions
+    return [offset for offset in product((-1, 0, 1), repeat=dimensions) if offset > zero]
+
+def neighbour_pairs(verts, radius):
+    '''
+    find pairs (i, j) of points that may be closer than radius,
+    using a spatial hash grid with cells of radius size;
+    points are rows of (n, d) array, or numbers of (n,) array
+    '''
+    verts = np.asarray(verts)
+    if len(verts) < 2 or radius <= 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    if verts.ndim == 1:
+        verts = verts[:, np.newaxis]
+    cells = np.floor(verts / radius).astype(np.int64)
+    cells -= cells.min(axis=0)
+    # one empty cell at each side so neighbour keys do not wrap
+    cells += 1
+    dims = cells.max(axis=0) + 2
+    # key of cell as number in mixed radix of dims
+    strides = np.ones(len(dims), dtype=np.int64)
+    strides[:-1] = np.cumprod(dims[:0:-1])[::-1]
+    keys = cells.dot(strides)
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    cell_keys, cell_start, cell_count = np.unique(sorted_keys, return_index=True, return_counts=True)
+
+    zero = (0,) * len(dims)
+    firsts, seconds = [], []
+    for offset in [zero] + half_neighbours(len(dims)):
+        target = sorted_keys + int(np.dot(offset, strides))
+        pos = np.minimum(np.searchsorted(cell_keys, target), len(cell_keys) - 1)
+        src = np.nonzero(cell_keys[pos] == target)[0]
+        counts = cell_count[pos[src]]
+        local = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        first = np.repeat(src, counts)
+        second = np.repeat(cell_start[pos[src]], counts) + local
+        if offset == zero:
+            own_cell = first < second
+            first, second = first[own_cell], second[own_cell]
+        firsts.append(first)
+        seconds.append(second)
+
+    return np.stack((order[np.concatenate(firsts)], order[np.concatenate(seconds)]), axis=-1)
@@ -5,36 +5,68 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from collections import OrderedDict
+
+import numpy as np
 from mathutils import kdtree
 from sverchok.data_structure import match_long_repeat as mlr
 
+# number of trees kept by cached_kdt
+CACHE_SIZE = 8
+
+_kdt_cache = OrderedDict()
+
 # documentation/blender_python_api_2_70_release/mathutils.kdtree.html
 def create_kdt(verts):
-    '''Basic kdt setup'''
-    size = len(verts)
-    kd = kdtree.KDTree(size)
+    '''Basic kdt setup, verts can be a list of vertices or (n, 3) NumPy array'''
+    if isinstance(verts, np.ndarray):
+        verts = verts.tolist()
+    kd = kdtree.KDTree(len(verts))
+    insert = kd.insert
     for i, xyz in enumerate(verts):
-        kd.insert(xyz, i)
+        insert(xyz, i)
     kd.balance()
 
     return kd
 
 
+def cached_kdt(verts):
+    '''
+    KDTree of verts, reused while the same vertices are passed again
+    (the last CACHE_SIZE vertex lists are remembered).
+    Vertices are compared by content, so a new list with the same
+    coordinates gets the tree built before, and a list changed in place
+    gets a new tree.
+    '''
+    array = np.asarray(verts, dtype=np.float64)
+    data = array.tobytes()
+    key = (array.shape, hash(data))
+    cached = _kdt_cache.get(key)
+    if cached is not None and cached[0] == data:
+        _kdt_cache.move_to_end(key)
+        return cached[1]
+    kd = create_kdt(array)
+    _kdt_cache[key] = (data, kd)
+    while len(_kdt_cache) > CACHE_SIZE:
+        _kdt_cache.popitem(last=False)
+    return kd
+
+
 def kdt_closest_verts_range(verts, v_find, dists, out):
     '''Find vertices in desired distance'''
-    kd = create_kdt(verts)
+    kd = cached_kdt(verts)
     out.extend([kd.find_range(vert, dist) for vert, dist in zip(*mlr([v_find, dists]))])
 
 
 def kdt_closest_verts_find_n(verts, v_find, nums, out):
     '''Find  the N closest vertices ordered by distance'''
-    kd = create_kdt(verts)
+    kd = cached_kdt(verts)
     out.extend([kd.find_n(vert, num) for vert, num in zip(*mlr([v_find, nums]))])
 
 
 def kdt_closest_path(verts, radius, start_index, result, cycle):
     '''Creates path joining each vertice with the closest free neighbor'''
-    kd = create_kdt(verts)
+    kd = cached_kdt(verts)
     edges = [[]]
     edge_set = set()
     seen = set()
@@ -72,7 +104,7 @@ def kdt_closest_edges(verts, socket_inputs, egdes_output):
     mindist, maxdist, maxNum, skip = socket_inputs
 
     # make kdtree
-    kd = create_kdt(verts)
+    kd = cached_kdt(verts)
 
     # set minimum values
     maxNum = max(maxNum, 1)
@@ -0,0 +1,141 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Shared cache of BVH trees of Sverchok meshes, and batch queries
+returning NumPy arrays.
+
+usage:
+bvh = cached_bvh(verts, faces)
+locations, normals, indices, distances = bvh_find_nearest(bvh, points)
+success, locations, normals, indices, distances = bvh_ray_cast(bvh, origins, directions)
+"""
+
+import sys
+from collections import OrderedDict
+
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+from sverchok.utils.ragged_array import RaggedArray
+
+# limits of cached_bvh: number of trees and estimated memory
+CACHE_SIZE = 16
+CACHE_MEMORY = 512 * 2 ** 20
+# rough estimate of memory used by the tree, per polygon corner
+TREE_BYTES_PER_LOOP = 64
+
+# points per chunk of batch queries
+CHUNK_SIZE = 2 ** 14
+
+_bvh_cache = OrderedDict()
+
+
+class _CachedBVH:
+    __slots__ = ('data', 'bvh', 'memory')
+
+    def __init__(self, data, bvh, memory):
+        self.data = data
+        self.bvh = bvh
+        self.memory = memory
+
+
+def cache_memory():
+    """Estimated memory (in bytes) used by cached trees"""
+    return sum(entry.memory for entry in _bvh_cache.values())
+
+
+def clear_bvh_cache():
+    _bvh_cache.clear()
+
+
+def cached_bvh(verts, faces, epsilon=0.0):
+    """
+    BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=epsilon),
+    reused while the same mesh is passed again.
+    Meshes are compared by content, so a rebuilt list with the same
+    coordinates and polygons gets the tree built before, and lists changed
+    in place get a new tree. Only the bytes of the mesh are kept, they are
+    counted in the memory of the entry.
+    Least recently used trees are dropped when there are more than CACHE_SIZE
+    of them or they take more than CACHE_MEMORY bytes.
+    """
+    vert_data = np.asarray(verts, dtype=np.float64).tobytes()
+    polygons = RaggedArray.from_list(faces, dtype=np.int64)
+    face_data = polygons.values.tobytes() + polygons.offsets.tobytes()
+    key = (epsilon, len(vert_data), len(face_data), hash(vert_data), hash(face_data))
+    entry = _bvh_cache.get(key)
+    if entry is not None and entry.data == (vert_data, face_data):
+        _bvh_cache.move_to_end(key)
+        return entry.bvh
+
+    bvh = BVHTree.FromPolygons(verts, faces, all_triangles=False, epsilon=epsilon)
+    memory = len(vert_data) + len(face_data) + TREE_BYTES_PER_LOOP * len(polygons.values)
+    _bvh_cache[key] = _CachedBVH((vert_data, face_data), bvh, memory)
+    total = cache_memory()
+    while len(_bvh_cache) > 1 and (len(_bvh_cache) > CACHE_SIZE or total > CACHE_MEMORY):
+        _, dropped = _bvh_cache.popitem(last=False)
+        total -= dropped.memory
+    return bvh
+
+
+def _collect(results, count):
+    """
+    Convert results of BVHTree queries (location, normal, index, distance)
+    to arrays; misses get zero vectors, index -1 and zero distance.
+    """
+    success = np.fromiter((r[0] is not None for r in results), dtype=bool, count=count)
+    locations = np.zeros((count, 3))
+    normals = np.zeros((count, 3))
+    indices = np.full(count, -1, dtype=np.int64)
+    distances = np.zeros(count)
+    hits = [r for r in results if r[0] is not None]
+    if hits:
+        locations[success] = [r[0][:] for r in hits]
+        normals[success] = [r[1][:] for r in hits]
+        indices[success] = [r[2] for r in hits]
+        distances[success] = [r[3] for r in hits]
+    return success, locations, normals, indices, distances
+
+
+def bvh_find_nearest(bvh, points, distance=sys.float_info.max, chunk_size=CHUNK_SIZE):
+    """
+    Nearest point of the tree for each of points, in chunks of chunk_size points.
+    Returns arrays: locations (n, 3), normals (n, 3), indices (n,) and distances (n,);
+    points farther than distance get index -1.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    find = bvh.find_nearest
+    chunks = []
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start:start + chunk_size].tolist()
+        chunks.append(_collect([find(p, distance) for p in chunk], len(chunk)))
+    if not chunks:
+        chunks.append(_collect([], 0))
+    return tuple(np.concatenate(arrays) for arrays in zip(*chunks))[1:]
+
+
+def bvh_ray_cast(bvh, origins, directions, distance=sys.float_info.max, chunk_size=CHUNK_SIZE):
+    """
+    Cast a ray from each of origins along the matching direction (both (n, 3)
+    arrays or lists, or one of them a single vector), in chunks of chunk_size rays.
+    Returns arrays: success (n,), locations (n, 3), normals (n, 3),
+    indices (n,) and distances (n,).
+    """
+    origins = np.asarray(origins, dtype=np.float64).reshape((-1, 3))
+    directions = np.asarray(directions, dtype=np.float64).reshape((-1, 3))
+    origins, directions = np.broadcast_arrays(origins, directions)
+    cast = bvh.ray_cast
+    chunks = []
+    for start in range(0, len(origins), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        rays = zip(origins[chunk].tolist(), directions[chunk].tolist())
+        results = [cast(origin, direction, distance) for origin, direction in rays]
+        chunks.append(_collect(results, len(results)))
+    if not chunks:
+        chunks.append(_collect([], 0))
+    return tuple(np.concatenate(arrays) for arrays in zip(*chunks))
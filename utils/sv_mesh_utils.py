@@ -16,7 +16,11 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import numpy as np
+
 from sverchok.data_structure import fullList_deep_copy
+from sverchok.utils.ragged_array import RaggedArray
+from sverchok.utils.spatial_hash import neighbour_pairs
 
 def mesh_join(vertices_s, edges_s, faces_s):
     '''Given list of meshes represented by lists of vertices, edges and faces,
@@ -72,6 +76,62 @@ def mesh_join_ext(vertices_s, edges_s, faces_s, wrap=False):
 
     return result_vertices, result_edges, result_faces
 
+def mesh_join_np(vertices_s, edges_s, faces_s):
+    '''Given list of meshes represented by vertices, edges and faces
+    (lists or numpy arrays, faces also as RaggedArray), produce one joined mesh
+    without rebuilding each index in Python: blocks are concatenated and indices
+    are shifted by one numpy addition.
+    Returns vertices as (n, 3) array, edges as (m, 2) array and faces as
+    RaggedArray (faces.values - flat index buffer, faces.offsets - start of
+    each face, faces.tolist() - usual list of faces).
+    Blocks repeated in the input (the same object, as for instanced parts)
+    are converted to arrays only once.'''
+
+    if len(edges_s) == 0:
+        edges_s = [[]] * len(faces_s)
+    if len(faces_s) == 0:
+        faces_s = [[]] * len(vertices_s)
+
+    converted = dict()
+    def convert(data, make_array):
+        # data is kept referenced, so its id can not be reused during the join
+        key = id(data)
+        if key not in converted:
+            converted[key] = (data, make_array(data))
+        return converted[key][1]
+
+    def ragged(faces):
+        if isinstance(faces, RaggedArray):
+            return faces
+        if isinstance(faces, np.ndarray):
+            return RaggedArray.from_array(faces.reshape((len(faces), -1)))
+        return RaggedArray.from_list(faces, dtype=np.int64)
+
+    count = min(len(vertices_s), len(edges_s), len(faces_s))
+    verts = [convert(v, lambda v: np.asarray(v, dtype=np.float64).reshape((-1, 3))) for v in vertices_s[:count]]
+    edges = [convert(e, lambda e: np.asarray(e, dtype=np.int64).reshape((-1, 2))) for e in edges_s[:count]]
+    faces = [convert(f, ragged) for f in faces_s[:count]]
+
+    vert_counts = np.array([len(v) for v in verts], dtype=np.int64)
+    offsets = np.cumsum(vert_counts) - vert_counts
+
+    if verts:
+        result_vertices = np.concatenate(verts)
+    else:
+        result_vertices = np.zeros((0, 3))
+
+    edge_counts = [len(e) for e in edges]
+    if sum(edge_counts):
+        result_edges = np.concatenate(edges) + np.repeat(offsets, edge_counts)[:, np.newaxis]
+    else:
+        result_edges = np.zeros((0, 2), dtype=np.int64)
+
+    result_faces = RaggedArray.concatenate(faces)
+    loop_counts = [len(f.values) for f in faces]
+    result_faces.values = result_faces.values + np.repeat(offsets, loop_counts)
+
+    return result_vertices, result_edges, result_faces
+
 def polygons_to_edges(obj, unique_edges=False):
     out = []
     for faces in obj:
@@ -87,3 +147,133 @@ def polygons_to_edges(obj, unique_edges=False):
         out.append(out_edges)
     return out
 
+
+
+def remove_doubles_numpy(vertices, tolerance=0.0):
+    '''Merge coincident vertices without bmesh.
+    Vertices are rows of any width, or numbers.
+    tolerance = 0: only exactly equal vertices are merged (sorting the rows);
+    tolerance > 0: vertices joined by a chain of pairs closer than tolerance
+    are merged into the first of them (pairs are searched with a spatial hash grid).
+    Returns (verts, index): remaining vertices in the order of their first
+    occurrence and the new index of each input vertex.'''
+
+    verts = np.asarray(vertices, dtype=np.float64)
+    n = len(verts)
+    if n == 0:
+        return verts.reshape((0, 3)), np.zeros(0, dtype=np.int64)
+    # -0.0 becomes 0.0
+    verts = verts + 0.0
+    rows = verts.reshape((n, -1))
+
+    if tolerance <= 0:
+        # sort by a hash of coordinate bits, equal rows end up next to each other;
+        # lexsort of the coordinates is only needed if the hash has collisions
+        bits = np.ascontiguousarray(rows).view(np.uint64)
+        hashes = np.zeros(n, dtype=np.uint64)
+        for column in bits.T:
+            hashes = hashes * np.uint64(0x9E3779B97F4A7C15) ^ column
+        order = np.argsort(hashes, kind='stable')
+        sorted_rows = rows[order]
+        same_rows = np.all(sorted_rows[1:] == sorted_rows[:-1], axis=1)
+        if np.any(same_rows != (hashes[order][1:] == hashes[order][:-1])):
+            order = np.lexsort(rows.T[::-1])
+            sorted_rows = rows[order]
+        new_group = np.ones(n, dtype=bool)
+        new_group[1:] = np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)
+        group = np.cumsum(new_group) - 1
+        firsts = np.minimum.reduceat(order, np.flatnonzero(new_group))
+        # number groups in the order of first occurrence
+        rank = np.empty(len(firsts), dtype=np.int64)
+        rank[np.argsort(firsts)] = np.arange(len(firsts))
+        index = np.empty(n, dtype=np.int64)
+        index[order] = rank[group]
+        return verts[np.sort(firsts)], index
+
+    pairs = neighbour_pairs(rows, tolerance)
+    close = np.sum((rows[pairs[:, 0]] - rows[pairs[:, 1]]) ** 2, axis=1) <= tolerance * tolerance
+    # component label is the smallest (first) vertex of the component
+    labels = mesh_components(n, pairs[close])
+    kept = labels == np.arange(n)
+    new_index = np.cumsum(kept) - 1
+    return verts[kept], new_index[labels]
+
+def rewire_mesh_indices(index, edges, faces):
+    '''Apply new vertex indices (as returned by remove_doubles_numpy) to edges and faces;
+    collapsed edges and faces with less than 3 distinct vertices are removed.'''
+
+    index = np.asarray(index).tolist()
+    new_edges = []
+    seen = set()
+    for edge in edges:
+        i, j = index[edge[0]], index[edge[1]]
+        key = (i, j) if i < j else (j, i)
+        if i != j and key not in seen:
+            seen.add(key)
+            new_edges.append([i, j])
+    new_faces = []
+    for face in faces:
+        new_face = [index[i] for i in face]
+        new_face = [i for k, i in enumerate(new_face) if i != new_face[k - 1]]
+        if len(set(new_face)) >= 3:
+            new_faces.append(new_face)
+    return new_edges, new_faces
+
+
+def item_pairs(items):
+    '''Pairs of consecutive vertex indices of edges or polygons (closed),
+    as (n, 2) array; enough to connect all vertices of each item.'''
+
+    loops = items if isinstance(items, RaggedArray) else RaggedArray.from_list(items, dtype=np.int64)
+    lengths = loops.lengths
+    verts = loops.values
+    next_loop = np.arange(1, len(verts) + 1)
+    closed = lengths > 0
+    next_loop[loops.offsets[1:][closed] - 1] = loops.offsets[:-1][closed]
+    return np.stack((verts, verts[next_loop]), axis=-1)
+
+def mesh_components(vert_count, pairs):
+    '''Connected components of a graph given by (n, 2) array of vertex pairs
+    (edges, or item_pairs of polygons). Union-find over arrays: each pair
+    hooks the bigger root under the smaller one, then paths are compressed
+    by pointer jumping, until no pair joins two different roots.
+    Returns label of each vertex - the smallest vertex index in its component.'''
+
+    labels = np.arange(vert_count)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape((-1, 2))
+    a, b = pairs[:, 0], pairs[:, 1]
+    while True:
+        root_a, root_b = labels[a], labels[b]
+        joined = root_a != root_b
+        if not np.any(joined):
+            return labels
+        np.minimum.at(labels, np.maximum(root_a[joined], root_b[joined]), np.minimum(root_a[joined], root_b[joined]))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        # keep only pairs which may still join components
+        a, b = a[joined], b[joined]
+
+def hop_distances(vert_count, pairs, sources, max_distance=None):
+    '''Number of edges on the shortest path from sources to each vertex
+    (breadth-first search, one array step per distance), -1 for vertices
+    not reached (or farther than max_distance).'''
+
+    pairs = np.asarray(pairs, dtype=np.int64).reshape((-1, 2))
+    starts = np.concatenate((pairs[:, 0], pairs[:, 1]))
+    ends = np.concatenate((pairs[:, 1], pairs[:, 0]))
+    order = np.argsort(starts, kind='stable')
+    neighbours = RaggedArray.from_lengths(ends[order], np.bincount(starts, minlength=vert_count))
+
+    distances = np.full(vert_count, -1, dtype=np.int64)
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+    distances[frontier] = 0
+    distance = 0
+    while len(frontier) and (max_distance is None or distance < max_distance):
+        distance += 1
+        reached = neighbours.take(frontier).values
+        frontier = np.unique(reached[distances[reached] < 0])
+        distances[frontier] = distance
+    return distances
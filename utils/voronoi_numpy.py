@@ -0,0 +1,518 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+2D Delaunay triangulation and Voronoi diagram on NumPy arrays.
+
+The triangulation is built by a radial sweep (the approach of the
+Delaunator library): sites are processed in order of distance from the
+first triangle, each new site is connected to the visible part of the
+convex hull and edges are flipped until they are locally Delaunay.
+Instead of one object per site / half-edge, the triangulation is stored
+in flat arrays:
+
+    triangles[e] - site at the start of half-edge e, half-edges 3t, 3t+1, 3t+2
+                   are the edges of triangle t (counter-clockwise)
+    halfedges[e] - opposite half-edge in the adjacent triangle, -1 on the hull
+
+The Voronoi diagram is derived from the triangulation with array
+operations: vertices are circumcenters of triangles, finite edges connect
+circumcenters of adjacent triangles, hull edges give rays.
+
+usage:
+diagram = Voronoi2D(points)   # points: (n, 2) or (n, 3) array, Z is ignored
+diagram.vertices, diagram.edges, diagram.cells
+verts, edges = diagram.clip_box(x_min, y_min, x_max, y_max)
+"""
+
+from math import ceil, floor, sqrt
+
+import numpy as np
+
+from sverchok.utils.ragged_array import RaggedArray
+
+# vertices closer than this (relative to the size of the input) are merged
+WELD_EPSILON = 1e-9
+
+
+def _pseudo_angle(dx, dy):
+    """monotonic in the angle of (dx, dy), in [0, 1)"""
+    p = dx / (abs(dx) + abs(dy))
+    return (3 - p if dy > 0 else 1 + p) / 4
+
+
+def _circumradius2(ax, ay, bx, by, cx, cy):
+    dx, dy = bx - ax, by - ay
+    ex, ey = cx - ax, cy - ay
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = dx * ey - dy * ex
+    if d == 0:
+        return float('inf')
+    x = (ey * bl - dy * cl) * 0.5 / d
+    y = (dx * cl - ex * bl) * 0.5 / d
+    return x * x + y * y
+
+
+def _circumcenter(ax, ay, bx, by, cx, cy):
+    dx, dy = bx - ax, by - ay
+    ex, ey = cx - ax, cy - ay
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = dx * ey - dy * ex
+    return ax + (ey * bl - dy * cl) * 0.5 / d, ay + (dx * cl - ex * bl) * 0.5 / d
+
+
+def delaunay_triangulation(points):
+    """
+    Delaunay triangulation of 2D points ((n, 2) array).
+    Returns (triangles, halfedges, hull):
+    triangles - (m, 3) array of site indices, counter-clockwise,
+    halfedges - (3m,) array, opposite half-edge of each edge or -1,
+    hull - site indices of the convex hull, counter-clockwise.
+    Duplicated points are ignored; collinear points give no triangles.
+    """
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    n = len(points)
+    empty = (np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    if n < 3:
+        return empty
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+
+    # seed triangle: point closest to the center of bounds, its nearest
+    # neighbour and the point making the smallest circumcircle with them
+    x_min, y_min = points.min(axis=0)
+    x_max, y_max = points.max(axis=0)
+    center = np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
+    i0 = int(np.argmin(np.sum((points - center) ** 2, axis=1)))
+    dist = np.sum((points - points[i0]) ** 2, axis=1)
+    dist[i0] = np.inf
+    i1 = int(np.argmin(dist))
+    if dist[i1] == 0:
+        dist[dist == 0] = np.inf
+        i1 = int(np.argmin(dist))
+    x0, y0, x1, y1 = xs[i0], ys[i0], xs[i1], ys[i1]
+    min_radius = float('inf')
+    i2 = -1
+    for i in range(n):
+        if i == i0 or i == i1:
+            continue
+        r = _circumradius2(x0, y0, x1, y1, xs[i], ys[i])
+        if r < min_radius:
+            i2 = i
+            min_radius = r
+    if min_radius == float('inf'):
+        return empty
+    x2, y2 = xs[i2], ys[i2]
+    if (x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0) < 0:
+        i1, i2 = i2, i1
+        x1, y1, x2, y2 = x2, y2, x1, y1
+    cx, cy = _circumcenter(x0, y0, x1, y1, x2, y2)
+
+    order = np.argsort((points[:, 0] - cx) ** 2 + (points[:, 1] - cy) ** 2, kind='stable').tolist()
+
+    max_triangles = max(2 * n - 5, 1)
+    triangles = [0] * (max_triangles * 3)
+    halfedges = [-1] * (max_triangles * 3)
+    triangles_len = 0
+
+    hash_size = max(int(ceil(sqrt(n))), 1)
+    hull_hash = [-1] * hash_size
+    hull_next = [0] * n
+    hull_prev = [0] * n
+    hull_tri = [0] * n
+
+    def hash_key(x, y):
+        return int(floor(_pseudo_angle(x - cx, y - cy) * hash_size)) % hash_size
+
+    def link(a, b):
+        halfedges[a] = b
+        if b != -1:
+            halfedges[b] = a
+
+    def add_triangle(i0, i1, i2, a, b, c):
+        nonlocal triangles_len
+        t = triangles_len
+        triangles[t] = i0
+        triangles[t + 1] = i1
+        triangles[t + 2] = i2
+        link(t, a)
+        link(t + 1, b)
+        link(t + 2, c)
+        triangles_len += 3
+        return t
+
+    edge_stack = []
+
+    def legalize(a):
+        """flip edges until they are locally Delaunay, returns the edge after a"""
+        nonlocal hull_start
+        while True:
+            b = halfedges[a]
+            a0 = a - a % 3
+            ar = a0 + (a + 2) % 3
+            if b == -1:
+                if not edge_stack:
+                    return ar
+                a = edge_stack.pop()
+                continue
+
+            b0 = b - b % 3
+            al = a0 + (a + 1) % 3
+            bl = b0 + (b + 2) % 3
+            p0 = triangles[ar]
+            pr = triangles[a]
+            pl = triangles[al]
+            p1 = triangles[bl]
+
+            # is p1 inside of circumcircle of (p0, pr, pl)
+            dx, dy = xs[p0] - xs[p1], ys[p0] - ys[p1]
+            ex, ey = xs[pr] - xs[p1], ys[pr] - ys[p1]
+            fx, fy = xs[pl] - xs[p1], ys[pl] - ys[p1]
+            ap = dx * dx + dy * dy
+            bp = ex * ex + ey * ey
+            cp = fx * fx + fy * fy
+            illegal = dx * (ey * cp - bp * fy) - dy * (ex * cp - bp * fx) + ap * (ex * fy - ey * fx) > 0
+
+            if illegal:
+                triangles[a] = p1
+                triangles[b] = p0
+                hbl = halfedges[bl]
+                if hbl == -1:
+                    # the flipped edge was on the hull, fix the reference to it
+                    e = hull_start
+                    while True:
+                        if hull_tri[e] == bl:
+                            hull_tri[e] = a
+                            break
+                        e = hull_prev[e]
+                        if e == hull_start:
+                            break
+                link(a, hbl)
+                link(b, halfedges[ar])
+                link(ar, bl)
+                edge_stack.append(b0 + (b + 1) % 3)
+            else:
+                if not edge_stack:
+                    return ar
+                a = edge_stack.pop()
+
+    hull_start = i0
+    hull_next[i0] = hull_prev[i2] = i1
+    hull_next[i1] = hull_prev[i0] = i2
+    hull_next[i2] = hull_prev[i1] = i0
+    hull_tri[i0] = 0
+    hull_tri[i1] = 1
+    hull_tri[i2] = 2
+    hull_hash[hash_key(x0, y0)] = i0
+    hull_hash[hash_key(x1, y1)] = i1
+    hull_hash[hash_key(x2, y2)] = i2
+    add_triangle(i0, i1, i2, -1, -1, -1)
+
+    xp = yp = None
+    for i in order:
+        x, y = xs[i], ys[i]
+        # skip duplicated points
+        if x == xp and y == yp:
+            continue
+        xp, yp = x, y
+        if i == i0 or i == i1 or i == i2:
+            continue
+
+        # find a visible edge of the hull, starting from the hash
+        key = hash_key(x, y)
+        start = 0
+        for j in range(hash_size):
+            start = hull_hash[(key + j) % hash_size]
+            if start != -1 and start != hull_next[start]:
+                break
+        start = hull_prev[start]
+        e = start
+        while True:
+            q = hull_next[e]
+            if (xs[q] - xs[e]) * (y - ys[e]) - (ys[q] - ys[e]) * (x - xs[e]) < 0:
+                break
+            e = q
+            if e == start:
+                e = -1
+                break
+        if e == -1:
+            # point is inside of the triangulation (a duplicate)
+            continue
+
+        t = add_triangle(e, i, hull_next[e], -1, -1, hull_tri[e])
+        hull_tri[i] = legalize(t + 2)
+        hull_tri[e] = t
+
+        # walk forward through the visible part of the hull
+        nxt = hull_next[e]
+        while True:
+            q = hull_next[nxt]
+            if (xs[q] - xs[nxt]) * (y - ys[nxt]) - (ys[q] - ys[nxt]) * (x - xs[nxt]) >= 0:
+                break
+            t = add_triangle(nxt, i, q, hull_tri[i], -1, hull_tri[nxt])
+            hull_tri[i] = legalize(t + 2)
+            hull_next[nxt] = nxt
+            nxt = q
+
+        # walk backward
+        if e == start:
+            while True:
+                q = hull_prev[e]
+                if (xs[e] - xs[q]) * (y - ys[q]) - (ys[e] - ys[q]) * (x - xs[q]) >= 0:
+                    break
+                t = add_triangle(q, i, e, -1, hull_tri[e], hull_tri[q])
+                legalize(t + 2)
+                hull_tri[q] = t
+                hull_next[e] = e
+                e = q
+
+        hull_start = hull_prev[i] = e
+        hull_next[e] = hull_prev[nxt] = i
+        hull_next[i] = nxt
+        hull_hash[hash_key(x, y)] = i
+        hull_hash[hash_key(xs[e], ys[e])] = e
+
+    hull = [hull_start]
+    e = hull_next[hull_start]
+    while e != hull_start:
+        hull.append(e)
+        e = hull_next[e]
+
+    triangles = np.array(triangles[:triangles_len], dtype=np.int64).reshape((-1, 3))
+    halfedges = np.array(halfedges[:triangles_len], dtype=np.int64)
+    return triangles, halfedges, np.array(hull, dtype=np.int64)
+
+
+def circumcenters(points, triangles):
+    """circumcenters of triangles ((m, 3) indices into (n, 2) points)"""
+    a = points[triangles[:, 0]]
+    d = points[triangles[:, 1]] - a
+    e = points[triangles[:, 2]] - a
+    bl = np.sum(d * d, axis=1)
+    cl = np.sum(e * e, axis=1)
+    det = 2 * (d[:, 0] * e[:, 1] - d[:, 1] * e[:, 0])
+    x = (e[:, 1] * bl - d[:, 1] * cl) / det
+    y = (d[:, 0] * cl - e[:, 0] * bl) / det
+    return a + np.stack((x, y), axis=-1)
+
+
+def clip_segments_box(starts, directions, t_min, t_max, x_min, y_min, x_max, y_max):
+    """
+    Clip parametric segments p = start + t * direction, t in [t_min, t_max]
+    (can be infinite) by a box (Liang-Barsky). Returns new t_min, t_max;
+    segments outside of the box get t_min > t_max.
+    """
+    t_min = t_min.copy()
+    t_max = t_max.copy()
+    for axis, lo, hi in ((0, x_min, x_max), (1, y_min, y_max)):
+        p = starts[:, axis]
+        d = directions[:, axis]
+        parallel = d == 0
+        outside = parallel & ((p < lo) | (p > hi))
+        t_min[outside] = np.inf
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_lo = (lo - p) / d
+            t_hi = (hi - p) / d
+        enter = np.where(parallel, -np.inf, np.minimum(t_lo, t_hi))
+        leave = np.where(parallel, np.inf, np.maximum(t_lo, t_hi))
+        t_min = np.maximum(t_min, enter)
+        t_max = np.minimum(t_max, leave)
+    return t_min, t_max
+
+
+def clip_segments_circle(starts, directions, t_min, t_max, center, radius):
+    """
+    Clip parametric segments p = start + t * direction, t in [t_min, t_max]
+    by a circle. Returns new t_min, t_max; segments outside of the circle
+    get t_min > t_max.
+    """
+    rel = starts - center
+    a = np.sum(directions * directions, axis=1)
+    b = 2 * np.sum(directions * rel, axis=1)
+    c = np.sum(rel * rel, axis=1) - radius * radius
+    disc = b * b - 4 * a * c
+    miss = disc < 0
+    root = np.sqrt(np.where(miss, 0, disc))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        enter = (-b - root) / (2 * a)
+        leave = (-b + root) / (2 * a)
+    t_min = np.maximum(t_min, enter)
+    t_max = np.minimum(t_max, leave)
+    t_min[miss] = np.inf
+    return t_min, t_max
+
+
+class Voronoi2D:
+    """
+    Voronoi diagram of 2D sites.
+
+    vertices - (k, 2) array of diagram vertices (circumcenters of Delaunay triangles)
+    edges - (l, 2) array of finite edges (vertex indices)
+    edge_sites - (l, 2) array of two sites separated by each finite edge
+    ray_starts, ray_directions, ray_sites - edges going to infinity from a vertex
+    lines - (point, direction, sites) of lines infinite in both directions
+            (only if all sites are collinear)
+    cells - RaggedArray of vertex indices of each site cell, counter-clockwise;
+            cells of hull sites are open (they continue by two rays)
+    """
+    def __init__(self, points):
+        points = np.asarray(points, dtype=np.float64)
+        self.sites = points[:, :2].reshape((-1, 2))
+        self.triangles, self.halfedges, self.hull = delaunay_triangulation(self.sites)
+        if len(self.sites):
+            self.scale = max(float(np.max(np.ptp(self.sites, axis=0))), 1e-12)
+        else:
+            self.scale = 1.0
+
+        # equal circumcenters (of cocircular sites) are merged
+        centers = circumcenters(self.sites, self.triangles)
+        keys = np.round(centers / (WELD_EPSILON * self.scale)).astype(np.int64)
+        _, first, tri_vertex = np.unique(keys.reshape((-1, 2)), axis=0, return_index=True, return_inverse=True)
+        self.vertices = centers[first]
+        tri_vertex = tri_vertex.reshape(-1)
+
+        halfedges = self.halfedges
+        edge_ids = np.arange(len(halfedges))
+        next_edge = edge_ids - edge_ids % 3 + (edge_ids + 1) % 3
+        flat_triangles = self.triangles.reshape(-1)
+
+        # each pair of adjacent triangles gives one finite edge
+        inner = halfedges > edge_ids
+        edges = np.stack((tri_vertex[edge_ids[inner] // 3], tri_vertex[halfedges[inner] // 3]), axis=-1)
+        edge_sites = np.stack((flat_triangles[inner], flat_triangles[next_edge[inner]]), axis=-1)
+        not_merged = edges[:, 0] != edges[:, 1]
+        self.edges = edges[not_merged]
+        self.edge_sites = edge_sites[not_merged]
+
+        # each hull edge gives a ray going outwards
+        outer = halfedges == -1
+        a = self.sites[flat_triangles[outer]]
+        b = self.sites[flat_triangles[next_edge[outer]]]
+        self.ray_starts = tri_vertex[edge_ids[outer] // 3]
+        self.ray_directions = np.stack((b[:, 1] - a[:, 1], a[:, 0] - b[:, 0]), axis=-1)
+        self.ray_sites = np.stack((flat_triangles[outer], flat_triangles[next_edge[outer]]), axis=-1)
+
+        self.lines = self._collinear_lines() if len(self.triangles) == 0 else None
+        self.cells = self._cells(flat_triangles, tri_vertex)
+
+    def _collinear_lines(self):
+        """bisectors of neighbouring sites, when there are no triangles"""
+        sites, index = np.unique(self.sites, axis=0, return_index=True)
+        if len(sites) < 2:
+            return np.zeros((0, 2)), np.zeros((0, 2)), np.zeros((0, 2), dtype=np.int64)
+        direction = sites[-1] - sites[0]
+        order = np.argsort(sites @ direction)
+        sites, index = sites[order], index[order]
+        points = (sites[1:] + sites[:-1]) / 2
+        directions = np.tile([-direction[1], direction[0]], (len(points), 1))
+        return points, directions, np.stack((index[:-1], index[1:]), axis=-1)
+
+    def _cells(self, flat_triangles, tri_vertex):
+        """vertices around each site, sorted by angle"""
+        site = flat_triangles
+        vertex = tri_vertex[np.arange(len(flat_triangles)) // 3]
+        rel = self.vertices[vertex] - self.sites[site]
+        angle = np.arctan2(rel[:, 1], rel[:, 0])
+        order = np.lexsort((angle, site))
+        site, vertex = site[order], vertex[order]
+        # merged vertices appear several times around a site
+        keep = np.ones(len(site), dtype=bool)
+        keep[1:] = (site[1:] != site[:-1]) | (vertex[1:] != vertex[:-1])
+        site, vertex = site[keep], vertex[keep]
+        lengths = np.bincount(site, minlength=len(self.sites))
+        return RaggedArray.from_lengths(vertex, lengths)
+
+    def _segments(self):
+        """all edges, rays and lines as parametric segments"""
+        starts = [self.vertices[self.edges[:, 0]], self.vertices[self.ray_starts]]
+        directions = [self.vertices[self.edges[:, 1]] - starts[0], self.ray_directions]
+        t_min = [np.zeros(len(self.edges)), np.zeros(len(self.ray_starts))]
+        t_max = [np.ones(len(self.edges)), np.full(len(self.ray_starts), np.inf)]
+        start_ids = [self.edges[:, 0], self.ray_starts]
+        end_ids = [self.edges[:, 1], np.full(len(self.ray_starts), -1)]
+        if self.lines is not None:
+            points, line_directions, _ = self.lines
+            starts.append(points)
+            directions.append(line_directions)
+            t_min.append(np.full(len(points), -np.inf))
+            t_max.append(np.full(len(points), np.inf))
+            start_ids.append(np.full(len(points), -1))
+            end_ids.append(np.full(len(points), -1))
+        return [np.concatenate(x) for x in (starts, directions, t_min, t_max, start_ids, end_ids)]
+
+    def _clipped(self, clip, keep_partial, bound_center, bound_corners):
+        """
+        Build mesh of clipped diagram: clip(starts, directions, t_min, t_max)
+        must return clipped parameter ranges.
+        Returns (verts (p, 2) array, edges (q, 2) array, indices of boundary verts)
+        """
+        starts, directions, t_min, t_max, start_ids, end_ids = self._segments()
+        new_min, new_max = clip(starts, directions, t_min, t_max)
+        eps = 1e-12
+        visible = new_min < new_max - eps
+        cut_start = visible & (new_min > t_min + eps)
+        cut_end = visible & (new_max < t_max - eps)
+        if not keep_partial:
+            visible &= ~cut_start & ~cut_end
+
+        n_verts = len(self.vertices)
+        cut_start &= visible
+        cut_end &= visible
+        start_points = starts[cut_start] + directions[cut_start] * new_min[cut_start, np.newaxis]
+        end_points = starts[cut_end] + directions[cut_end] * new_max[cut_end, np.newaxis]
+        start_ids = start_ids.copy()
+        end_ids = end_ids.copy()
+        start_ids[cut_start] = n_verts + np.arange(len(start_points))
+        end_ids[cut_end] = n_verts + len(start_points) + np.arange(len(end_points))
+        verts = np.concatenate((self.vertices, start_points, end_points))
+        edges = np.stack((start_ids[visible], end_ids[visible]), axis=-1)
+        boundary = np.arange(n_verts, len(verts))
+
+        if bound_center is not None and len(boundary):
+            # connect boundary points (and corners of the bounds) around the center
+            corners = np.asarray(bound_corners, dtype=np.float64).reshape((-1, 2))
+            boundary = np.concatenate((boundary, len(verts) + np.arange(len(corners))))
+            verts = np.concatenate((verts, corners))
+            rel = verts[boundary] - bound_center
+            boundary = boundary[np.argsort(np.arctan2(rel[:, 1], rel[:, 0]), kind='stable')]
+            edges = np.concatenate((edges, np.stack((boundary, np.roll(boundary, -1)), axis=-1)))
+
+        # remove unused vertices
+        used = np.zeros(len(verts), dtype=bool)
+        used[edges.reshape(-1)] = True
+        new_index = np.cumsum(used) - 1
+        return verts[used], new_index[edges], new_index[boundary[used[boundary]]]
+
+    def clip_box(self, x_min, y_min, x_max, y_max, keep_partial=True, draw_bounds=False):
+        """
+        Diagram edges inside of the box: (verts (p, 2), edges (q, 2)).
+        keep_partial - keep parts of edges crossing the box border;
+        draw_bounds - add edges along the box border.
+        """
+        def clip(starts, directions, t_min, t_max):
+            return clip_segments_box(starts, directions, t_min, t_max, x_min, y_min, x_max, y_max)
+        if draw_bounds:
+            center = np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
+            corners = [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)]
+        else:
+            center, corners = None, None
+        verts, edges, _ = self._clipped(clip, keep_partial or draw_bounds, center, corners)
+        return verts, edges
+
+    def clip_circle(self, center, radius, keep_partial=True, draw_bounds=False):
+        """
+        Diagram edges inside of the circle: (verts (p, 2), edges (q, 2)).
+        keep_partial - keep parts of edges crossing the circle;
+        draw_bounds - add edges along the circle, between edge ends.
+        """
+        center = np.asarray(center, dtype=np.float64)
+        def clip(starts, directions, t_min, t_max):
+            return clip_segments_circle(starts, directions, t_min, t_max, center, radius)
+        verts, edges, _ = self._clipped(clip, keep_partial or draw_bounds, center if draw_bounds else None, [])
+        return verts, edges